@@ -0,0 +1,7 @@
+import os
+
+# Analysis modules are imported on demand (`from Econ_Analysis.gini_charts import ...` or
+# `python -m Econ_Analysis <command>`); importing the package itself loads nothing heavy.
+
+# Directory holding the bundled datasets (Gini CSV, GADM boundaries, Nepal populations)
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -0,0 +1,61 @@
+import argparse
+import importlib
+import os
+import subprocess
+import sys
+
+# Command name -> (module providing main(argv), description). A module is imported
+# only when its command runs, so each command pays only for the libraries it uses.
+COMMANDS = {
+    "gini": ("gini_visualizations", "Extract one country's Gini data and plot it against the world"),
+    "gini-batch": ("gini_batch", "Render Gini charts for many countries without a display"),
+    "nepal-map": ("nepal_population_density_map", "Build the Nepal population choropleth map"),
+    "mpi": ("poverty.mpi_plot", "Compare MPI and its dimensions for a few countries"),
+    "mpi-batch": ("poverty.mpi_batch", "Render MPI charts for groups of countries without a display"),
+    "happiness": ("poverty.happiness_plot", "Bar charts of MPI or happiness ladder scores"),
+    "social": ("social_capital", "Draw clustered networks joined by weak links"),
+    "sweep": ("social_network_sweep", "Resumable Monte Carlo sweep over the weak link"),
+    "build": ("build", "Rebuild only the artifacts whose inputs, parameters or code changed"),
+    "benchmark": ("benchmark_pipelines", "Time each pipeline stage on scaled-up synthetic inputs"),
+    "app": (None, "Launch the interactive Gini Streamlit app"),
+}
+
+
+def run_app(argv):
+    """
+    Starts the Streamlit app with the package importable from its script.
+
+    Parameters:
+        argv (list[str]): Extra arguments passed to the app (e.g. a Gini CSV path).
+
+    Returns:
+        int: Streamlit's exit code.
+    """
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [os.path.dirname(package_dir), env.get("PYTHONPATH")]))
+    script = os.path.join(package_dir, "gini_interactive_app.py")
+    return subprocess.call([sys.executable, "-m", "streamlit", "run", script, "--", *argv], env=env)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m Econ_Analysis",
+        description="Economic analysis pipelines. Run `<command> --help` for a command's options.",
+        epilog="\n".join(f"  {name:<12} {description}" for name, (_, description) in COMMANDS.items()),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("command", choices=COMMANDS, metavar="command", help="One of the commands below")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    module_name = COMMANDS[args.command][0]
+    if module_name is None:
+        return run_app(args.args)
+    module = importlib.import_module(f".{module_name}", __package__)
+    sys.argv[0] = f"{parser.prog} {args.command}"  # shown in the command's own usage line
+    return module.main(args.args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
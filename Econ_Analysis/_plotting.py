@@ -0,0 +1,16 @@
+def headless_pyplot():
+    """
+    Switches matplotlib to the non-interactive Agg backend and returns pyplot.
+
+    Called by the batch renderers when they start drawing rather than at import
+    time, so importing them leaves the backend (and matplotlib itself) alone.
+
+    Returns:
+        module: matplotlib.pyplot.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")  # headless: no display needed, must be set before pyplot is imported
+    import matplotlib.pyplot as plt
+
+    return plt
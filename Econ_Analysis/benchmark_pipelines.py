@@ -0,0 +1,275 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from ._plotting import headless_pyplot
+from .pipeline_timing import StageTimer
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+POVERTY_DIR = os.path.join(HERE, "poverty")
+
+PIPELINES = ("gini", "mpi", "nepal", "social")
+
+# A stage counts as a regression when it is this many times slower than the baseline
+DEFAULT_TOLERANCE = 1.25
+
+
+def synthetic_world_bank_csv(source, scale, path, seed=0):
+    """
+    Writes a World Bank-format CSV with `scale` times the countries and 10 * (scale - 1) extra years.
+
+    Copies of each country get suffixed names/codes and multiplicative noise;
+    extra years continue the series from resampled earlier years.
+
+    Parameters:
+        source (str): Bundled World Bank CSV to scale up.
+        scale (int): Scale factor.
+        path (str): Output path.
+        seed (int): Seed for the noise.
+
+    Returns:
+        str: The output path.
+    """
+    from .world_bank_data import ID_COLUMNS, parse_world_bank_csv
+
+    rng = np.random.default_rng(seed)
+    wide = parse_world_bank_csv(source)
+    year_columns = [col for col in wide.columns if col not in ID_COLUMNS]
+    values = wide[year_columns].to_numpy(dtype="float64")
+    last_year = int(year_columns[-1])
+    extra = 10 * (scale - 1)
+    if extra:
+        resampled = values[:, rng.integers(0, len(year_columns), extra)]
+        values = np.hstack([values, resampled])
+        year_columns = year_columns + [str(last_year + k) for k in range(1, extra + 1)]
+
+    copies = []
+    for copy in range(scale):
+        ids = wide[ID_COLUMNS].copy()
+        if copy:
+            ids["Country Name"] = ids["Country Name"] + f" #{copy}"
+            ids["Country Code"] = ids["Country Code"] + f"{copy:03d}"
+        noisy = values * (1 + 0.02 * rng.standard_normal(values.shape)) if copy else values
+        copies.append(pd.concat([ids, pd.DataFrame(noisy, columns=year_columns)], axis=1))
+    scaled = pd.concat(copies, ignore_index=True)
+
+    with open(path, "w", newline="") as handle:
+        handle.write('"Data Source","World Development Indicators",\n\n"Last Updated Date","synthetic",\n\n')
+        scaled.to_csv(handle, index=False)
+    return path
+
+
+def bench_gini(timer, scale, workdir):
+    from .country_index import CountryIndex
+    from .gini_charts import draw_all_country_trends, draw_heatmap, heatmap_matrix
+    from .world_bank_data import melt_world_bank_data, parse_world_bank_csv
+
+    plt = headless_pyplot()
+
+    path = synthetic_world_bank_csv(os.path.join(HERE, "gini_world_data.csv"), scale,
+                                    os.path.join(workdir, "gini_scaled.csv"))
+    with timer.stage("load"):
+        wide = parse_world_bank_csv(path)
+    with timer.stage("melt"):
+        long = melt_world_bank_data(wide, "Gini Index")
+    with timer.stage("index"):
+        index = CountryIndex(wide)
+        index.find("Nepal")
+    with timer.stage("pivot"):
+        matrix, rows, years = heatmap_matrix(long, sort_rows="mean")
+    with timer.stage("serialize"):
+        long.to_feather(os.path.join(workdir, "gini_long.feather"))
+    with timer.stage("render"):
+        fig, (trend_ax, heat_ax) = plt.subplots(1, 2, figsize=(16, 6))
+        draw_all_country_trends(trend_ax, long, ["Nepal"])
+        draw_heatmap(heat_ax, matrix, rows, years)
+        fig.savefig(os.path.join(workdir, "gini.png"))
+        plt.close(fig)
+
+
+def bench_mpi(timer, scale, workdir):
+    from .country_index import CountryIndex
+    from .country_panel import build_country_panel
+    from .poverty.mpi_batch import country_groups, render_mpi_groups
+    from .poverty.mpi_data import load_mpi_table
+    from .world_bank_data import load_world_bank_data
+
+    with timer.stage("load"):
+        table = load_mpi_table(os.path.join(POVERTY_DIR, "National_Results_MPI_2024.xlsx"), use_cache=False)
+    # Scale up by repeating the countries under suffixed names
+    table = pd.concat([table.assign(Country=table["Country"].astype(str) + (f" #{k}" if k else ""))
+                       for k in range(scale)], ignore_index=True)
+    wide, long = load_world_bank_data(os.path.join(HERE, "gini_world_data.csv"), use_cache=False)
+    with timer.stage("merge"):
+        build_country_panel(CountryIndex(wide), long, mpi=table)
+    with timer.stage("render"):
+        groups = country_groups(table, "Region", max_countries=8)
+        selected = dict(list(groups.items())[:2 * scale])
+        render_mpi_groups(table, selected, os.path.join(workdir, "mpi"), html=False)
+
+
+def bench_nepal(timer, scale, workdir):
+    import geopandas as gpd
+
+    from .district_lookup import DistrictLocator
+    from .district_names import DistrictNameIndex
+    from .nepal_geometry import simplify_districts
+    from .nepal_map import build_choropleth_map
+
+    with timer.stage("read"):
+        districts = gpd.read_file(os.path.join(HERE, "gadm41_NPL_3.json"))
+    with timer.stage("simplify"):
+        districts = simplify_districts(districts)
+
+    # Population table repeated `scale` times (summed back per district by the join)
+    population = pd.read_csv(os.path.join(HERE, "Nepal_District_Populations_2021_renamed.csv"))
+    population = pd.concat([population] * scale, ignore_index=True)
+    with timer.stage("join"):
+        joined, _ = DistrictNameIndex(districts).join(population, "District", aggregate="sum")
+
+    rng = np.random.default_rng(0)
+    minx, miny, maxx, maxy = districts.total_bounds
+    n_points = 200_000 * scale
+    lon, lat = rng.uniform(minx, maxx, n_points), rng.uniform(miny, maxy, n_points)
+    with timer.stage("locate"):
+        DistrictLocator(districts).locate(lon, lat)
+    with timer.stage("render"):
+        m = build_choropleth_map(joined, "Population_2021", legend_name="Population by District")
+        m.save(os.path.join(workdir, "nepal.html"))
+
+
+def bench_social(timer, scale, workdir):
+    from .social_network import generate_clustered_network
+    from .social_network_charts import cluster_layout, draw_network
+    from .social_network_metrics import cluster_metrics, node_metrics
+
+    plt = headless_pyplot()
+
+    with timer.stage("generate"):
+        network = generate_clustered_network([50] * (100 * scale), p_intra=0.3, bridges_per_pair=2, seed=0)
+    with timer.stage("metrics"):
+        cluster_metrics(network, node_metrics(network))
+    with timer.stage("layout"):
+        positions = cluster_layout(network)
+    with timer.stage("render"):
+        fig, ax = plt.subplots(figsize=(8, 8))
+        draw_network(ax, network, positions)
+        fig.savefig(os.path.join(workdir, "network.png"), dpi=100)
+        plt.close(fig)
+
+
+BENCHMARKS = {"gini": bench_gini, "mpi": bench_mpi, "nepal": bench_nepal, "social": bench_social}
+
+
+def _run_pass(pipelines, scale, trace_memory):
+    timer = StageTimer(trace_memory=trace_memory)
+    with tempfile.TemporaryDirectory() as workdir:
+        for name in pipelines:
+            with timer.stage(name):
+                BENCHMARKS[name](timer, scale, workdir)
+    return timer.summary()
+
+
+def run_benchmarks(pipelines=PIPELINES, scale=1, trace_memory=True):
+    """
+    Runs the selected pipeline benchmarks on synthetic inputs scaled up from the bundled data.
+
+    tracemalloc slows allocation-heavy stages many times over, so memory is
+    measured in a separate first pass (which also warms up imports and caches)
+    and wall times come from a second, untraced pass.
+
+    Parameters:
+        pipelines (tuple[str]): Pipelines to run, from PIPELINES.
+        scale (int): Scale factor for countries/years, table rows, points and graph size.
+        trace_memory (bool): Record peak traced memory per stage.
+
+    Returns:
+        dict: {"meta": {...}, "stages": {"<pipeline>/<stage>": {"seconds", "calls", "peak_mb"}}};
+        the "<pipeline>" entries include building its synthetic inputs.
+    """
+    memory = _run_pass(pipelines, scale, trace_memory=True) if trace_memory else {}
+    stages = _run_pass(pipelines, scale, trace_memory=False)
+    for stage, entry in stages.items():
+        if stage in memory:
+            entry["peak_mb"] = memory[stage]["peak_mb"]
+    meta = {
+        "scale": scale,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    return {"meta": meta, "stages": stages}
+
+
+def compare_results(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    Compares stage timings and memory against a baseline run.
+
+    Parameters:
+        results (dict): Output of run_benchmarks.
+        baseline (dict): A previous output of run_benchmarks.
+        tolerance (float): Slowdown ratio above which a stage is flagged.
+
+    Returns:
+        pd.DataFrame: One row per stage with baseline/current seconds and peak memory,
+        the time ratio and a "regression" flag.
+    """
+    rows = []
+    for stage, current in results["stages"].items():
+        before = baseline.get("stages", {}).get(stage)
+        ratio = current["seconds"] / before["seconds"] if before and before["seconds"] > 0 else np.nan
+        rows.append({
+            "stage": stage,
+            "baseline_s": before["seconds"] if before else np.nan,
+            "current_s": current["seconds"],
+            "ratio": ratio,
+            "baseline_mb": before.get("peak_mb", np.nan) if before else np.nan,
+            "current_mb": current.get("peak_mb", np.nan),
+            "regression": bool(ratio > tolerance),
+        })
+    return pd.DataFrame(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time each pipeline stage on scaled-up synthetic inputs.")
+    parser.add_argument("--pipelines", nargs="+", choices=PIPELINES, default=list(PIPELINES))
+    parser.add_argument("--scale", type=int, default=1)
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--baseline", default=None, help="Baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--no-memory", action="store_true", help="Skip tracemalloc (faster, time only)")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.pipelines, args.scale, trace_memory=not args.no_memory)
+    with open(args.output, "w") as handle:
+        json.dump(results, handle, indent=2)
+    print(f"Wrote {len(results['stages'])} stage timings to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as handle:
+            baseline = json.load(handle)
+        if baseline.get("meta", {}).get("scale") != args.scale:
+            print(f"Warning: baseline was recorded at scale {baseline.get('meta', {}).get('scale')}")
+        comparison = compare_results(results, baseline, args.tolerance)
+        print(comparison.to_string(index=False, float_format=lambda value: f"{value:.3f}"))
+        regressions = comparison.loc[comparison["regression"], "stage"].tolist()
+        if regressions:
+            print(f"Slower than {args.tolerance}x baseline: {regressions}")
+            return 1
+    else:
+        for stage, entry in results["stages"].items():
+            print(f"{stage:<20} {entry['seconds']:8.3f} s  {entry.get('peak_mb', float('nan')):9.1f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,430 @@
+import argparse
+import ast
+import hashlib
+import inspect
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from . import DATA_DIR
+from .world_bank_data import file_digest
+
+MANIFEST_NAME = ".build_manifest.json"
+
+# Bumped when the manifest layout changes; older manifests are ignored (everything rebuilds)
+MANIFEST_VERSION = 1
+
+
+class Artifact:
+    """
+    Declares one build artifact: what produces it and everything its content depends on.
+
+    The artifact's key hashes the content of its input files, its parameters, the
+    source of its builder and of every package module the builder imports, directly
+    or through other modules (see module_dependencies). It is rebuilt only when
+    that key changes or one of its previously written outputs is missing.
+
+    Parameters:
+        name (str): Unique artifact name.
+        builder (callable): Top-level function builder(output_dir, inputs, **params) that
+            writes the artifact and returns the written paths.
+        inputs (dict[str, str]): Input files by role, relative to DATA_DIR unless absolute.
+        params (dict): JSON-serializable parameters passed to the builder.
+        code (tuple[str]): Extra package modules (e.g. "poverty.mpi_batch") whose source is
+            part of the key, for modules the imports do not reveal.
+        prepare (callable): Optional top-level function prepare(inputs, **params) that fills
+            caches shared with other artifacts; build() runs it before the builders fan out,
+            so concurrent builders only read those caches.
+    """
+
+    def __init__(self, name, builder, inputs=None, params=None, code=(), prepare=None):
+        self.name = name
+        self.builder = builder
+        self.inputs = {role: os.path.join(DATA_DIR, path) for role, path in (inputs or {}).items()}
+        self.params = dict(params or {})
+        self.code = tuple(code)
+        self.prepare = prepare
+
+    def key(self, digest):
+        """
+        Returns the content hash of everything the artifact depends on.
+
+        Parameters:
+            digest (callable): Maps a file path to its content digest (see FileDigests).
+
+        Returns:
+            str: A short hex key.
+        """
+        sources = [inspect.getsource(func) for func in (self.builder, self.prepare) if func is not None]
+        state = {
+            "inputs": {role: digest(path) for role, path in sorted(self.inputs.items())},
+            "params": self.params,
+            "builder": hashlib.sha256("".join(sources).encode()).hexdigest()[:16],
+            "code": {module: digest(module_path(module)) for module in module_dependencies(self.code, sources)},
+        }
+        return hashlib.sha256(json.dumps(state, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+
+def module_path(module):
+    """
+    Returns the source file of a package module without importing it.
+
+    Parameters:
+        module (str): Module name relative to the package ("" for the package itself).
+
+    Returns:
+        str | None: Path to the module's .py file (or its package __init__.py), None if absent.
+    """
+    base = os.path.join(DATA_DIR, *module.split(".")) if module else DATA_DIR
+    for path in (f"{base}.py", os.path.join(base, "__init__.py")):
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def _imported_modules(source, module):
+    # Package modules named by the imports anywhere in the source, including function-local ones
+    package = [part for part in module.split(".") if part]
+    if not module_path(module).endswith("__init__.py"):
+        package = package[:-1]
+    found = set()
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.ImportFrom):
+            if node.level:
+                parts = package[:len(package) - node.level + 1] + (node.module.split(".") if node.module else [])
+            elif (node.module or "").split(".")[0] == __package__:
+                parts = node.module.split(".")[1:]
+            else:
+                continue
+            target = ".".join(parts)
+            found.add(target)
+            # "from . import name" may name a submodule as well as an attribute
+            found.update(f"{target}.{alias.name}" if target else alias.name for alias in node.names)
+        elif isinstance(node, ast.Import):
+            found.update(".".join(alias.name.split(".")[1:]) for alias in node.names
+                         if alias.name.split(".")[0] == __package__)
+    return {name for name in found if module_path(name)}
+
+
+def module_dependencies(modules=(), sources=()):
+    """
+    Returns the package modules reachable through imports, following each module's own imports.
+
+    Parameters:
+        modules (Iterable[str]): Package modules to start from, e.g. "nepal_map".
+        sources (Iterable[str]): Source snippets (such as a builder function) whose imports are
+            resolved as if written in this module.
+
+    Returns:
+        list[str]: The starting modules and everything they import, sorted ("" is the package itself).
+    """
+    pending = set(modules)
+    for source in sources:
+        pending |= _imported_modules(source, os.path.splitext(os.path.basename(__file__))[0])
+    seen = set()
+    while pending:
+        module = pending.pop()
+        seen.add(module)
+        with open(module_path(module)) as handle:
+            pending |= _imported_modules(handle.read(), module) - seen
+    return sorted(seen)
+
+
+class FileDigests:
+    """
+    Content digests of files, reusing the previous run's digest while a file's size and mtime are unchanged.
+
+    Parameters:
+        cache (dict): Previous entries {path: {"size", "mtime_ns", "digest"}} (updated in place).
+    """
+
+    def __init__(self, cache=None):
+        self.cache = cache if cache is not None else {}
+
+    def __call__(self, path):
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        entry = self.cache.get(path)
+        if entry is None or entry["size"] != stat.st_size or entry["mtime_ns"] != stat.st_mtime_ns:
+            entry = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "digest": file_digest(path)}
+            self.cache[path] = entry
+        return entry["digest"]
+
+
+# Builders run in worker processes: each imports only what its artifact needs
+
+def build_nepal_population_map(output_dir, inputs, file_name, level, indicator, tolerance, quantize_digits,
+                               value_column):
+    from .nepal_population_density_map import main
+
+    path = os.path.join(output_dir, file_name)
+    main(["--population", inputs["population"], "--boundaries", inputs["boundaries"], "--output", path,
+          "--level", level, "--indicator", indicator, "--tolerance", str(tolerance),
+          "--quantize-digits", str(quantize_digits), "--value-column", value_column])
+    return [path]
+
+
+def warm_nepal_boundaries(inputs, tolerance, quantize_digits, **params):
+    # Every administrative level is cached in one pass, so both Nepal maps only read it
+    from .nepal_admin import admin_level_path
+
+    admin_level_path(inputs["boundaries"], 3, tolerance, quantize_digits)
+
+
+def warm_world_bank_cache(inputs, **params):
+    # The parsed Gini table is shared by every Gini artifact
+    from .world_bank_data import load_world_bank_data
+
+    load_world_bank_data(inputs["gini"], value_name="Gini Index")
+
+
+def build_country_gini_data(output_dir, inputs, country):
+    from .country_index import CountryIndex
+    from .gini_visualizations import extract_country_data
+    from .world_bank_data import load_world_bank_data
+
+    wide, _ = load_world_bank_data(inputs["gini"], value_name="Gini Index")
+    path = os.path.join(output_dir, f"{country.lower().replace(' ', '_')}_gini_index_data.csv")
+    extract_country_data(CountryIndex(wide), country, path)
+    return [path]
+
+
+def build_gini_overview(output_dir, inputs, countries_to_label, dpi):
+    from ._plotting import headless_pyplot
+    from .gini_charts import draw_all_country_trends, draw_heatmap, heatmap_matrix
+    from .world_bank_data import load_world_bank_data
+
+    plt = headless_pyplot()
+    _, gini_long = load_world_bank_data(inputs["gini"], value_name="Gini Index")
+    paths = [os.path.join(output_dir, "gini_trends.png"), os.path.join(output_dir, "gini_heatmap.png")]
+
+    fig, ax = plt.subplots(figsize=(14, 8))
+    draw_all_country_trends(ax, gini_long, countries_to_label, value_name="Gini Index")
+    fig.savefig(paths[0], dpi=dpi, bbox_inches="tight")
+    plt.close(fig)
+
+    fig, ax = plt.subplots(figsize=(16, 10))
+    draw_heatmap(ax, *heatmap_matrix(gini_long, value_name="Gini Index"), value_name="Gini Index", cmap="YlGnBu")
+    ax.set_title("Gini Index Heatmap Across Countries and Years")
+    fig.savefig(paths[1], dpi=dpi, bbox_inches="tight")
+    plt.close(fig)
+    return paths
+
+
+def build_gini_country_charts(output_dir, inputs, countries, years, formats):
+    from .gini_batch import render_countries
+
+    results = render_countries(inputs["gini"], countries, os.path.join(output_dir, "gini_charts"),
+                               formats, years, workers=1)
+    return [path for paths in results.values() for path in paths]
+
+
+def build_mpi_charts(output_dir, inputs, group_by, max_countries, formats):
+    from .poverty.mpi_batch import country_groups, render_mpi_groups
+    from .poverty.mpi_data import load_mpi_table
+
+    table = load_mpi_table(inputs["mpi"])
+    groups = country_groups(table, group_by, max_countries)
+    return render_mpi_groups(table, groups, os.path.join(output_dir, "mpi_charts"), formats)
+
+
+def build_social_network(output_dir, inputs, clusters, size, bridges, seed):
+    from .social_capital import main
+
+    path = os.path.join(output_dir, "social_network.png")
+    main(["--clusters", str(clusters), "--size", str(size), "--bridges", str(bridges),
+          "--seed", str(seed), "--output", path])
+    return [path]
+
+
+ARTIFACTS = [
+    Artifact("nepal_population_map", build_nepal_population_map,
+             inputs={"population": "Nepal_District_Populations_2021_renamed.csv", "boundaries": "gadm41_NPL_3.json"},
+             params={"file_name": "nepal_population_heatmap.html", "level": "district", "indicator": "density",
+                     "tolerance": 0.005, "quantize_digits": 4, "value_column": "Population_2021"},
+             prepare=warm_nepal_boundaries),
+    Artifact("nepal_zone_density_map", build_nepal_population_map,
+             inputs={"population": "Nepal_District_Populations_2021_renamed.csv", "boundaries": "gadm41_NPL_3.json"},
+             params={"file_name": "nepal_population_density_zones.html", "level": "zone", "indicator": "density",
+                     "tolerance": 0.005, "quantize_digits": 4, "value_column": "Population_2021"},
+             prepare=warm_nepal_boundaries),
+    Artifact("nepal_gini_data", build_country_gini_data,
+             inputs={"gini": "gini_world_data.csv"},
+             params={"country": "Nepal"},
+             prepare=warm_world_bank_cache),
+    Artifact("gini_overview", build_gini_overview,
+             inputs={"gini": "gini_world_data.csv"},
+             params={"countries_to_label": ["Nepal", "United States", "India", "China", "Brazil", "Germany",
+                                            "South Korea"], "dpi": 100},
+             prepare=warm_world_bank_cache),
+    Artifact("gini_country_charts", build_gini_country_charts,
+             inputs={"gini": "gini_world_data.csv"},
+             params={"countries": ["Nepal", "India", "Bhutan", "Bangladesh", "China"],
+                     "years": [2000, 2005, 2010, 2015, 2020], "formats": ["png"]},
+             prepare=warm_world_bank_cache),
+    Artifact("mpi_charts", build_mpi_charts,
+             inputs={"mpi": "poverty/National_Results_MPI_2024.xlsx"},
+             params={"group_by": "Region", "max_countries": 8, "formats": ["png"]}),
+    Artifact("social_network", build_social_network,
+             params={"clusters": 2, "size": 10, "bridges": 1, "seed": 0}),
+]
+
+
+def _run_builder(builder, output_dir, inputs, params):
+    start = time.perf_counter()
+    paths = builder(output_dir, inputs, **params)
+    return [os.path.relpath(path, output_dir) for path in paths], time.perf_counter() - start
+
+
+def load_manifest(output_dir):
+    """
+    Reads the build manifest of an output directory (empty if missing or from an older layout).
+
+    Parameters:
+        output_dir (str): Build output directory.
+
+    Returns:
+        dict: {"version", "files": {path: digest entry}, "artifacts": {name: {"key", "outputs", ...}}}.
+    """
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    if os.path.exists(path):
+        with open(path) as handle:
+            manifest = json.load(handle)
+        if manifest.get("version") == MANIFEST_VERSION:
+            return manifest
+    return {"version": MANIFEST_VERSION, "files": {}, "artifacts": {}}
+
+
+def _save_manifest(manifest, output_dir):
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w") as handle:
+        json.dump(manifest, handle, indent=2, sort_keys=True)
+    os.replace(temp_path, path)  # never leave a half-written manifest behind
+
+
+def stale_artifacts(artifacts, output_dir, manifest=None, force=False):
+    """
+    Works out which artifacts must be rebuilt.
+
+    Parameters:
+        artifacts (list[Artifact]): Declared artifacts.
+        output_dir (str): Build output directory.
+        manifest (dict): Manifest to check against (loaded from output_dir if None); its
+            file digest cache is updated in place.
+        force (bool): Treat every artifact as stale.
+
+    Returns:
+        dict[str, str]: New key per stale artifact name, in declaration order.
+    """
+    manifest = manifest if manifest is not None else load_manifest(output_dir)
+    digest = FileDigests(manifest["files"])
+    stale = {}
+    for artifact in artifacts:
+        key = artifact.key(digest)
+        previous = manifest["artifacts"].get(artifact.name)
+        if (force or previous is None or previous["key"] != key
+                or not all(os.path.exists(os.path.join(output_dir, path)) for path in previous["outputs"])):
+            stale[artifact.name] = key
+    return stale
+
+
+def build(artifacts=None, output_dir="build", only=None, force=False, workers=None, dry_run=False):
+    """
+    Rebuilds the stale artifacts, independent ones concurrently, and records them in the manifest.
+
+    Caches shared between artifacts are filled first by their prepare functions,
+    so the concurrent builders never write the same cache file. The manifest is
+    rewritten after every finished artifact, so an interrupted build keeps the
+    artifacts it completed. A failed artifact keeps its previous
+    manifest entry and is retried on the next run.
+
+    Parameters:
+        artifacts (list[Artifact]): Declared artifacts (defaults to ARTIFACTS).
+        output_dir (str): Directory the artifacts are written to.
+        only (list[str]): Restrict the build to these artifact names.
+        force (bool): Rebuild even up-to-date artifacts.
+        workers (int): Worker processes (defaults to the CPU count).
+        dry_run (bool): Only report what is stale.
+
+    Returns:
+        dict[str, str]: Outcome per artifact: "up to date", "stale", "built" or "failed: <error>".
+    """
+    artifacts = ARTIFACTS if artifacts is None else artifacts
+    if only:
+        unknown = set(only) - {artifact.name for artifact in artifacts}
+        if unknown:
+            raise ValueError(f"Unknown artifacts: {sorted(unknown)}")
+        artifacts = [artifact for artifact in artifacts if artifact.name in only]
+
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = load_manifest(output_dir)
+    stale = stale_artifacts(artifacts, output_dir, manifest, force)
+    outcome = {artifact.name: "stale" if artifact.name in stale else "up to date" for artifact in artifacts}
+    if dry_run or not stale:
+        _save_manifest(manifest, output_dir)  # keep the refreshed file digests
+        return outcome
+
+    by_name = {artifact.name: artifact for artifact in artifacts}
+    # Caches shared between artifacts are filled here, one artifact at a time, before the fan-out
+    for name in list(stale):
+        prepare = by_name[name].prepare
+        if prepare is None:
+            continue
+        try:
+            prepare(by_name[name].inputs, **by_name[name].params)
+        except Exception as error:
+            outcome[name] = f"failed: {error!r}"
+            print(f"{name}: failed ({error!r})")
+            del stale[name]
+    if not stale:
+        return outcome
+
+    with ProcessPoolExecutor(max_workers=min(workers or os.cpu_count() or 1, len(stale))) as pool:
+        futures = {pool.submit(_run_builder, by_name[name].builder, output_dir, by_name[name].inputs,
+                               by_name[name].params): name for name in stale}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                outputs, seconds = future.result()
+            except Exception as error:
+                outcome[name] = f"failed: {error!r}"
+                print(f"{name}: failed ({error!r})")
+                continue
+            manifest["artifacts"][name] = {"key": stale[name], "outputs": outputs,
+                                           "built": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                                           "seconds": round(seconds, 3)}
+            _save_manifest(manifest, output_dir)
+            outcome[name] = "built"
+            print(f"{name}: built {len(outputs)} files in {seconds:.1f} s")
+    return outcome
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rebuild only the charts, maps and tables whose inputs changed.")
+    parser.add_argument("--output-dir", default="build")
+    parser.add_argument("--only", nargs="+", default=None, help="Artifact names to consider")
+    parser.add_argument("--force", action="store_true", help="Rebuild everything")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--dry-run", action="store_true", help="List stale artifacts without building")
+    parser.add_argument("--list", action="store_true", help="List the declared artifacts")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for artifact in ARTIFACTS:
+            print(f"{artifact.name:<22} inputs: {', '.join(os.path.basename(p) for p in artifact.inputs.values()) or '-'}")
+        return 0
+
+    start = time.perf_counter()
+    outcome = build(output_dir=args.output_dir, only=args.only, force=args.force, workers=args.workers,
+                    dry_run=args.dry_run)
+    for name, status in outcome.items():
+        print(f"{name:<22} {status}")
+    print(f"Finished in {time.perf_counter() - start:.1f} s")
+    return 1 if any(status.startswith("failed") for status in outcome.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+import bisect
+import difflib
+
+import numpy as np
+import pandas as pd
+
+# Country names used by other sources (World Happiness Report, UNDP/OPHI MPI, ...)
+# that differ from the World Bank naming, mapped straight to ISO3 codes
+COUNTRY_ALIASES = {
+    "bolivia": "BOL",
+    "cape verde": "CPV",
+    "congo (brazzaville)": "COG",
+    "congo (kinshasa)": "COD",
+    "congo, democratic republic of the": "COD",
+    "czechia": "CZE",
+    "egypt": "EGY",
+    "gambia": "GMB",
+    "hong kong s.a.r. of china": "HKG",
+    "iran": "IRN",
+    "ivory coast": "CIV",
+    "kosovo": "XKX",
+    "kyrgyzstan": "KGZ",
+    "laos": "LAO",
+    "micronesia": "FSM",
+    "north korea": "PRK",
+    "palestine, state of": "PSE",
+    "russia": "RUS",
+    "slovakia": "SVK",
+    "south korea": "KOR",
+    "state of palestine": "PSE",
+    "swaziland": "SWZ",
+    "syria": "SYR",
+    "taiwan province of china": "TWN",
+    "tanzania": "TZA",
+    "turkey": "TUR",
+    "turkiye": "TUR",
+    "türkiye": "TUR",
+    "venezuela": "VEN",
+    "vietnam": "VNM",
+    "yemen": "YEM",
+}
+
+
+class CountryIndex:
+    """
+    Prebuilt lookup index over a wide World Bank table.
+
+    Maps lower-cased country names and ISO3 codes to row positions and keeps the
+    year columns as a dense country x year NumPy matrix, so country queries are
+    dictionary lookups or binary searches instead of full-table string scans.
+
+    Parameters:
+        data (pd.DataFrame): Wide table with "Country Name", "Country Code" and one column per year.
+    """
+
+    def __init__(self, data):
+        self.data = data.reset_index(drop=True)
+        self.year_columns = [col for col in self.data.columns if str(col).isdigit()]
+        self.years = np.array([int(col) for col in self.year_columns])
+        self.matrix = self.data[self.year_columns].to_numpy(dtype="float64")
+
+        self.names = self.data["Country Name"].astype(str).to_numpy()
+        self.codes = self.data["Country Code"].astype(str).to_numpy()
+
+        self._by_name = {}
+        for pos, name in enumerate(self.names):
+            self._by_name.setdefault(name.lower(), []).append(pos)
+        self._by_code = {}
+        for pos, code in enumerate(self.codes):
+            self._by_code.setdefault(code.upper(), []).append(pos)
+
+        # Sorted lower-cased names back prefix queries with a binary search
+        self._sorted_keys = sorted(self._by_name)
+
+    def __len__(self):
+        return len(self.names)
+
+    def exact(self, query):
+        """
+        Returns row positions whose country name or ISO3 code equals the query (case-insensitive).
+        """
+        query = query.strip()
+        return self._by_name.get(query.lower(), []) or self._by_code.get(query.upper(), [])
+
+    def prefix(self, query):
+        """
+        Returns row positions whose country name starts with the query (case-insensitive).
+        """
+        key = query.strip().lower()
+        start = bisect.bisect_left(self._sorted_keys, key)
+        end = bisect.bisect_left(self._sorted_keys, key + "\uffff")
+        return [pos for name in self._sorted_keys[start:end] for pos in self._by_name[name]]
+
+    def fuzzy(self, query, n=3, cutoff=0.8):
+        """
+        Returns row positions of the closest country names to the query, best match first.
+        """
+        matches = difflib.get_close_matches(query.strip().lower(), self._sorted_keys, n=n, cutoff=cutoff)
+        return [pos for name in matches for pos in self._by_name[name]]
+
+    def find(self, query):
+        """
+        Resolves a country query to row positions, trying exact, prefix and then fuzzy matching.
+
+        Parameters:
+            query (str): Country name, ISO3 code or partial name.
+
+        Returns:
+            list[int]: Matching row positions (empty if nothing matched).
+        """
+        return self.exact(query) or self.prefix(query) or self.fuzzy(query)
+
+    def rows(self, positions):
+        """
+        Returns the wide-table rows at the given positions.
+        """
+        return self.data.iloc[positions]
+
+    def to_long(self, positions, value_name="Gini Index"):
+        """
+        Builds a long (country, year, value) table for the given rows straight from the matrix.
+
+        Parameters:
+            positions (list[int]): Row positions as returned by find.
+            value_name (str): Name of the value column.
+
+        Returns:
+            pd.DataFrame: Long table restricted to non-missing observations.
+        """
+        positions = np.asarray(positions, dtype=int)
+        block = self.matrix[positions]
+        row_idx, col_idx = np.nonzero(~np.isnan(block))
+        return pd.DataFrame({
+            "Country Name": self.names[positions][row_idx],
+            "Country Code": self.codes[positions][row_idx],
+            "Year": self.years[col_idx],
+            value_name: block[row_idx, col_idx],
+        })
+
+    def available_years(self, positions):
+        """
+        Returns the years in which every one of the given rows has data.
+        """
+        block = self.matrix[np.asarray(positions, dtype=int)]
+        return self.years[~np.isnan(block).any(axis=0)]
+
+    def latest(self, positions):
+        """
+        Returns the latest year and value with data for each given row.
+
+        Parameters:
+            positions (list[int]): Row positions as returned by find.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Year and value arrays (NaN where a row has no data).
+        """
+        block = self.matrix[np.asarray(positions, dtype=int)]
+        valid = ~np.isnan(block)
+        last = block.shape[1] - 1 - np.argmax(valid[:, ::-1], axis=1)
+        has_data = valid.any(axis=1)
+        years = np.where(has_data, self.years[last], np.nan)
+        values = np.where(has_data, block[np.arange(len(block)), last], np.nan)
+        return years, values
+
+    def iso3(self, name):
+        """
+        Resolves a country name from any source to its ISO3 code.
+
+        Tries the alias table first, then exact name/code matches and finally a
+        fuzzy match against the World Bank names; prefix matches are not used
+        because they are ambiguous across sources.
+
+        Parameters:
+            name (str): Country name or ISO3 code.
+
+        Returns:
+            str | None: The ISO3 code, or None if the name could not be resolved.
+        """
+        key = str(name).strip().lower()
+        if key in COUNTRY_ALIASES:
+            return COUNTRY_ALIASES[key]
+        positions = self.exact(name) or self.fuzzy(name, n=1, cutoff=0.9)
+        return self.codes[positions[0]] if positions else None
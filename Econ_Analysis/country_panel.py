@@ -0,0 +1,113 @@
+import pandas as pd
+
+# Canonical panel column names for the MPI table columns
+MPI_PANEL_COLUMNS = {
+    "MPI": "mpi",
+    "H": "mpi_headcount",
+    "A": "mpi_intensity",
+    "Vulnerable": "mpi_vulnerable",
+    "Severe": "mpi_severe",
+    "D": "mpi_destitution",
+}
+
+
+def _survey_end_year(survey_years):
+    # "2018-2019" -> 2019; MPI surveys are dated by the last fieldwork year
+    return pd.to_numeric(survey_years.astype(str).str.extract(r"(\d{4})\D*$")[0], errors="coerce")
+
+
+def _resolve_codes(names, index):
+    resolved = {name: index.iso3(name) for name in pd.unique(names)}
+    unresolved = sorted(name for name, code in resolved.items() if code is None)
+    if unresolved:
+        print(f"Could not resolve country names to ISO3: {unresolved}")
+    return names.map(resolved)
+
+
+def build_country_panel(index, gini_long=None, happiness=None, mpi=None, happiness_year=2023):
+    """
+    Joins Gini, happiness and MPI data into one frame indexed by (iso3, year).
+
+    Country names from every source are resolved to ISO3 once, anchored on the
+    World Bank "Country Code" column (with an alias table for names such as
+    "Laos" vs "Lao PDR"), so cross-indicator comparisons become index slices.
+
+    Parameters:
+        index (CountryIndex): Index over the wide World Bank table (names and codes).
+        gini_long (pd.DataFrame): Long Gini table with "Country Code", "Year" and "Gini Index".
+        happiness (pd.DataFrame): World Happiness table with "Country name" and "Ladder score".
+        mpi (pd.DataFrame): Cleaned MPI table with "ISO", "Survey year" and MPI columns.
+        happiness_year (int): Year the happiness scores are assigned to.
+
+    Returns:
+        pd.DataFrame: Panel with a sorted (iso3, year) MultiIndex, a "country" column
+        with the World Bank name and one column per indicator.
+    """
+    frames = []
+    if gini_long is not None:
+        gini = pd.DataFrame({
+            "iso3": gini_long["Country Code"].astype(str).to_numpy(),
+            "year": gini_long["Year"].astype("int64").to_numpy(),
+            "gini": gini_long["Gini Index"].to_numpy(dtype="float64"),
+        })
+        frames.append(gini.set_index(["iso3", "year"]))
+
+    if happiness is not None:
+        ladder = pd.DataFrame({
+            "iso3": _resolve_codes(happiness["Country name"], index),
+            "year": happiness_year,
+            "ladder_score": pd.to_numeric(happiness["Ladder score"], errors="coerce"),
+        }).dropna(subset=["iso3"])
+        frames.append(ladder.set_index(["iso3", "year"]))
+
+    if mpi is not None:
+        columns = {col: name for col, name in MPI_PANEL_COLUMNS.items() if col in mpi.columns}
+        poverty = mpi[list(columns)].rename(columns=columns).astype("float64")
+        poverty.insert(0, "iso3", mpi["ISO"].astype(str).to_numpy())
+        poverty.insert(1, "year", _survey_end_year(mpi["Survey year"]))
+        poverty = poverty.dropna(subset=["year"]).astype({"year": "int64"})
+        frames.append(poverty.set_index(["iso3", "year"]))
+
+    if not frames:
+        raise ValueError("At least one of gini_long, happiness or mpi is required.")
+
+    panel = pd.concat(frames, axis=1, join="outer").sort_index()
+    names = dict(zip(index.codes, index.names))
+    panel.insert(0, "country", panel.index.get_level_values("iso3").map(lambda code: names.get(code, code)))
+    return panel
+
+
+def panel_slice(panel, index, countries=None, indicators=None, years=None):
+    """
+    Selects countries, indicators and years from a country panel.
+
+    Parameters:
+        panel (pd.DataFrame): Panel as returned by build_country_panel.
+        index (CountryIndex): Index used to resolve country names to ISO3.
+        countries (list[str]): Country names or ISO3 codes from any source (all if None).
+        indicators (list[str]): Indicator columns to keep (all if None).
+        years (slice | list[int]): Years to keep, e.g. slice(2000, 2023) (all if None).
+
+    Returns:
+        pd.DataFrame: The selected rows and columns, keeping the "country" column.
+    """
+    codes = slice(None)
+    if countries is not None:
+        codes = [code for code in (index.iso3(country) for country in countries) if code is not None]
+    columns = ["country"] + list(indicators) if indicators is not None else list(panel.columns)
+    year_key = slice(None) if years is None else years
+    return panel.loc[(codes, year_key), columns]
+
+
+def latest_values(panel, indicators):
+    """
+    Returns each country's most recent non-missing value of every indicator.
+
+    Parameters:
+        panel (pd.DataFrame): Panel as returned by build_country_panel.
+        indicators (list[str]): Indicator columns.
+
+    Returns:
+        pd.DataFrame: One row per ISO3 code with the latest value of each indicator.
+    """
+    return panel.groupby(level="iso3")[list(indicators)].last()
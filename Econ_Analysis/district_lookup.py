@@ -0,0 +1,94 @@
+import numpy as np
+import pandas as pd
+import shapely
+from shapely import STRtree
+
+
+class DistrictLocator:
+    """
+    Point-in-district lookup over GADM boundaries backed by an STRtree.
+
+    Geometries are prepared once and queried in bulk with NumPy coordinate
+    arrays, so assigning many points costs one tree query per batch rather
+    than a polygon scan per point.
+
+    Parameters:
+        districts (gpd.GeoDataFrame): District polygons in EPSG:4326 (lon/lat).
+        name_column (str): District name column carried into the results.
+    """
+
+    def __init__(self, districts, name_column="NAME_3"):
+        self.districts = districts.reset_index(drop=True)
+        self.name_column = name_column
+        self.geometries = np.asarray(self.districts.geometry.values)
+        shapely.prepare(self.geometries)
+        self.tree = STRtree(self.geometries)
+
+    def locate(self, lon, lat):
+        """
+        Returns the district row position of each point.
+
+        Parameters:
+            lon (array-like): Longitudes.
+            lat (array-like): Latitudes.
+
+        Returns:
+            np.ndarray: District position per point, -1 for points outside every district.
+        """
+        points = shapely.points(np.asarray(lon, dtype="float64"), np.asarray(lat, dtype="float64"))
+        # "within" is evaluated as the prepared district containing the point, the
+        # fastest predicate here; points exactly on a border are left unassigned
+        point_idx, district_idx = self.tree.query(points, predicate="within")
+
+        positions = np.full(len(points), -1, dtype="int64")
+        positions[point_idx] = district_idx
+        return positions
+
+    def aggregate(self, chunks, lon_column="lon", lat_column="lat", value_columns=()):
+        """
+        Assigns streamed point records to districts and accumulates per-district totals.
+
+        Parameters:
+            chunks (Iterable[pd.DataFrame]): Record batches, e.g. pd.read_csv(..., chunksize=1_000_000).
+            lon_column (str): Longitude column.
+            lat_column (str): Latitude column.
+            value_columns (list[str]): Numeric columns to sum and average per district.
+
+        Returns:
+            gpd.GeoDataFrame: The districts with a "count" column plus "<col>_sum" and
+            "<col>_mean" for every value column, ready for build_choropleth_map.
+        """
+        n_districts = len(self.districts)
+        counts = np.zeros(n_districts, dtype="int64")
+        sums = {col: np.zeros(n_districts, dtype="float64") for col in value_columns}
+        valid_counts = {col: np.zeros(n_districts, dtype="int64") for col in value_columns}
+        outside = 0
+
+        for chunk in chunks:
+            positions = self.locate(chunk[lon_column].to_numpy(), chunk[lat_column].to_numpy())
+            inside = positions >= 0
+            outside += int((~inside).sum())
+            counts += np.bincount(positions[inside], minlength=n_districts)
+            for col in value_columns:
+                values = chunk[col].to_numpy(dtype="float64")[inside]
+                valid = ~np.isnan(values)
+                sums[col] += np.bincount(positions[inside][valid], weights=values[valid], minlength=n_districts)
+                valid_counts[col] += np.bincount(positions[inside][valid], minlength=n_districts)
+
+        result = self.districts.copy()
+        result["count"] = counts
+        for col in value_columns:
+            result[f"{col}_sum"] = sums[col]
+            result[f"{col}_mean"] = np.divide(sums[col], valid_counts[col], out=np.full(n_districts, np.nan),
+                                              where=valid_counts[col] > 0)
+        if outside:
+            print(f"{outside} points fell outside every district")
+        return result
+
+    def aggregate_csv(self, file_path, lon_column="lon", lat_column="lat", value_columns=(), chunksize=1_000_000):
+        """
+        Streams a CSV of point records in chunks and aggregates them per district.
+        """
+        usecols = [lon_column, lat_column, *value_columns]
+        chunks = pd.read_csv(file_path, usecols=usecols, chunksize=chunksize)
+        return self.aggregate(chunks, lon_column, lat_column, value_columns)
@@ -0,0 +1,150 @@
+import difflib
+import re
+
+import pandas as pd
+
+# Words that only qualify a district name ("Rukum East", "Bhaktapur Jilla") and are ignored when matching
+_QUALIFIERS = re.compile(r"\b(east|west|north|south|jilla|district)\b")
+_PARENTHETICAL = re.compile(r"\(([^)]*)\)")
+_NON_LETTERS = re.compile(r"[^a-z]")
+
+
+def normalize_name(name):
+    """
+    Normalizes a district name for matching: lower case, letters only.
+    """
+    return _NON_LETTERS.sub("", str(name).lower())
+
+
+def _name_variants(name):
+    # Progressively looser spellings of a single input name, most specific first
+    text = str(name).strip().lower()
+    variants = [text, _PARENTHETICAL.sub(" ", text)]
+    variants += _PARENTHETICAL.findall(text)
+    variants += [_QUALIFIERS.sub(" ", variant) for variant in list(variants)]
+    seen = []
+    for variant in map(normalize_name, variants):
+        if variant and variant not in seen:
+            seen.append(variant)
+    return seen
+
+
+class DistrictNameIndex:
+    """
+    Name-resolution index over GADM district boundaries.
+
+    Built once from NAME_3, the alternative spellings in VARNAME_3 and the HASC_3
+    codes. Each distinct input name is resolved at most once (exact, then looser
+    variants, then a fuzzy match) and memoized, so repeated joins are dictionary
+    lookups.
+
+    Parameters:
+        districts (gpd.GeoDataFrame): GADM level-3 districts.
+        name_column (str): Primary district name column.
+        fuzzy_cutoff (float): Minimum difflib similarity accepted for fuzzy matches.
+    """
+
+    def __init__(self, districts, name_column="NAME_3", fuzzy_cutoff=0.8):
+        self.districts = districts.reset_index(drop=True)
+        self.name_column = name_column
+        self.fuzzy_cutoff = fuzzy_cutoff
+        self.names = self.districts[name_column].astype(str).to_numpy()
+
+        self._keys = {}
+        for pos, name in enumerate(self.names):
+            self._keys.setdefault(normalize_name(name), pos)
+        if "VARNAME_3" in self.districts.columns:
+            for pos, variants in enumerate(self.districts["VARNAME_3"]):
+                if isinstance(variants, str) and variants != "NA":
+                    for variant in re.split(r"[|,]", variants):
+                        self._keys.setdefault(normalize_name(variant), pos)
+        if "HASC_3" in self.districts.columns:
+            for pos, code in enumerate(self.districts["HASC_3"]):
+                if isinstance(code, str) and code != "NA":
+                    self._keys.setdefault(normalize_name(code), pos)
+        self._key_list = list(self._keys)
+        self._resolved = {}
+
+    def resolve(self, name):
+        """
+        Resolves one district name to a row position.
+
+        Parameters:
+            name (str): District name, alternative spelling or HASC code.
+
+        Returns:
+            tuple[int | None, str]: Row position (None if unmatched) and the match
+            method ("exact", "variant", "fuzzy" or "unmatched").
+        """
+        if name in self._resolved:
+            return self._resolved[name]
+
+        result = (None, "unmatched")
+        variants = _name_variants(name)
+        for i, variant in enumerate(variants):
+            if variant in self._keys:
+                result = (self._keys[variant], "exact" if i == 0 else "variant")
+                break
+        else:
+            for variant in variants:
+                close = difflib.get_close_matches(variant, self._key_list, n=1, cutoff=self.fuzzy_cutoff)
+                if close:
+                    result = (self._keys[close[0]], "fuzzy")
+                    break
+
+        self._resolved[name] = result
+        return result
+
+    def match(self, names):
+        """
+        Resolves a column of district names, computing each distinct name once.
+
+        Parameters:
+            names (pd.Series): District names to resolve.
+
+        Returns:
+            pd.DataFrame: Match report with the input name, resolved row position,
+            matched district name and match method, aligned to the input index.
+        """
+        resolved = {name: self.resolve(name) for name in pd.unique(names)}
+        positions = names.map(lambda name: resolved[name][0])
+        report = pd.DataFrame({
+            "input": names,
+            "position": positions.astype("Int64"),
+            "method": names.map(lambda name: resolved[name][1]),
+        })
+        report["matched"] = report["position"].map(lambda pos: None if pd.isna(pos) else self.names[pos])
+        return report[["input", "matched", "method", "position"]]
+
+    def join(self, table, name_column="District", how="inner", aggregate=None):
+        """
+        Joins a district-level table onto the boundaries through the name index.
+
+        Parameters:
+            table (pd.DataFrame): District-level data.
+            name_column (str): Column in table holding district names.
+            how (str): "inner" keeps matched districts only, "left" keeps every boundary.
+            aggregate (str): How to combine numeric columns when several rows resolve
+                to one district (e.g. "sum" for districts split after the GADM release).
+
+        Returns:
+            tuple[gpd.GeoDataFrame, pd.DataFrame]: The joined districts and the match report.
+        """
+        report = self.match(table[name_column])
+        matched = table.assign(_district=report["position"])
+        matched = matched[matched["_district"].notna()]
+        if aggregate is not None:
+            numeric = matched.select_dtypes("number").columns.drop("_district")
+            matched = matched.groupby("_district")[list(numeric)].agg(aggregate).reset_index()
+
+        joined = self.districts.merge(matched.astype({"_district": "int64"}), left_index=True,
+                                      right_on="_district", how=how)
+        joined = joined.drop(columns="_district").reset_index(drop=True)
+        return joined, report
+
+    def unmatched_districts(self, report):
+        """
+        Returns the boundary names that no row of a match report resolved to.
+        """
+        used = set(report["position"].dropna().astype(int))
+        return [name for pos, name in enumerate(self.names) if pos not in used]
@@ -0,0 +1,113 @@
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from . import DATA_DIR
+from ._plotting import headless_pyplot
+from .country_index import CountryIndex
+from .gini_charts import draw_country_bars, draw_country_trend
+from .world_bank_data import load_world_bank_data
+
+DEFAULT_YEARS = [2000, 2005, 2010, 2015, 2020]
+
+# Per-process state: the dataset index and one reusable figure
+_worker = {}
+
+
+def _init_worker(file_path, figsize, dpi):
+    wide, _ = load_world_bank_data(file_path, value_name="Gini Index")
+    _worker["index"] = CountryIndex(wide)
+    _worker["figure"] = headless_pyplot().figure(figsize=figsize, dpi=dpi)
+
+
+def _save(fig, path_stem, formats):
+    paths = []
+    for fmt in formats:
+        path = f"{path_stem}.{fmt}"
+        fig.savefig(path, format=fmt)
+        paths.append(path)
+    return paths
+
+
+def _render_country(task):
+    position, output_dir, formats, years = task
+    index = _worker["index"]
+    fig = _worker["figure"]
+    name = index.names[position]
+    stem = os.path.join(output_dir, index.codes[position])
+
+    paths = []
+    fig.clf()
+    if draw_country_trend(fig.add_subplot(), index, [position], name):
+        paths += _save(fig, f"{stem}_trend", formats)
+    fig.clf()
+    if draw_country_bars(fig.add_subplot(), index, [position], name, years):
+        paths += _save(fig, f"{stem}_bars", formats)
+    return name, paths
+
+
+def render_countries(file_path, countries=None, output_dir="gini_charts", formats=("png",),
+                     years=DEFAULT_YEARS, workers=None, figsize=(10, 6), dpi=100):
+    """
+    Renders trend and bar charts for many countries to image files without a display.
+
+    Countries are spread across a process pool; each worker loads the dataset once
+    and reuses a single Agg figure for every chart it draws.
+
+    Parameters:
+        file_path (str): Path to the World Bank Gini CSV.
+        countries (list[str]): Country names or ISO3 codes; None renders every country with data.
+        output_dir (str): Directory for the rendered files (named by ISO3 code).
+        formats (tuple[str]): File formats to write, e.g. ("png", "svg").
+        years (list[int]): Years to show in the bar charts.
+        workers (int): Number of worker processes (defaults to the CPU count).
+        figsize (tuple[float, float]): Figure size in inches.
+        dpi (int): Resolution for raster formats.
+
+    Returns:
+        dict[str, list[str]]: Written file paths per country name.
+    """
+    wide, _ = load_world_bank_data(file_path, value_name="Gini Index")
+    index = CountryIndex(wide)
+
+    if countries is None:
+        positions = np.flatnonzero(~np.isnan(index.matrix).all(axis=1)).tolist()
+    else:
+        positions = []
+        for country in countries:
+            found = index.find(country)
+            if not found:
+                print(f"No data found for country: {country}")
+            positions.extend(found)
+
+    os.makedirs(output_dir, exist_ok=True)
+    tasks = [(pos, output_dir, tuple(formats), list(years)) for pos in positions]
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(file_path, figsize, dpi)) as pool:
+        for name, paths in pool.map(_render_country, tasks, chunksize=max(1, len(tasks) // 64)):
+            results[name] = paths
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render Gini Index charts for many countries without a display.")
+    parser.add_argument("--file", default=os.path.join(DATA_DIR, "gini_world_data.csv"), help="World Bank Gini CSV")
+    parser.add_argument("--countries", nargs="*", help="Country names or ISO3 codes (default: all)")
+    parser.add_argument("--output-dir", default="gini_charts")
+    parser.add_argument("--formats", nargs="+", default=["png"], help="e.g. png svg")
+    parser.add_argument("--years", nargs="+", type=int, default=DEFAULT_YEARS)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    results = render_countries(args.file, args.countries or None, args.output_dir,
+                               args.formats, args.years, args.workers)
+    written = sum(len(paths) for paths in results.values())
+    print(f"Rendered {written} files for {len(results)} countries into {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+import numpy as np
+import pandas as pd
+
+
+# Drawing helpers shared by the interactive script and the headless batch renderer.
+# They draw onto a caller-provided Axes so that one figure can be reused across charts.
+# seaborn and matplotlib are imported on first draw, so the data helpers (heatmap_matrix,
+# latest_observations) stay cheap to import.
+
+def draw_country_trend(ax, index, positions, country_name):
+    """
+    Draws the Gini Index trend line for the given rows of a CountryIndex.
+
+    Parameters:
+        ax (matplotlib.axes.Axes): Axes to draw on.
+        index (CountryIndex): Index over the wide Gini dataset.
+        positions (list[int]): Row positions of the country (as returned by index.find).
+        country_name (str): Name used in the chart title.
+
+    Returns:
+        bool: False if the country has no observations to plot.
+    """
+    import seaborn as sns
+
+    country_long = index.to_long(positions, value_name="Gini Index")
+    if country_long.empty:
+        return False
+
+    sns.lineplot(data=country_long, x="Year", y="Gini Index", ax=ax)
+    ax.set_title(f"Gini Index Trend for {country_name}")
+    ax.set_xlabel("Year")
+    ax.set_ylabel("Gini Index")
+    return True
+
+
+def draw_country_bars(ax, index, positions, country_name, years):
+    """
+    Draws a bar chart of the Gini Index for the requested years that have data.
+
+    Parameters:
+        ax (matplotlib.axes.Axes): Axes to draw on.
+        index (CountryIndex): Index over the wide Gini dataset.
+        positions (list[int]): Row positions of the country (as returned by index.find).
+        country_name (str): Name used in the chart title.
+        years (list[int]): Years to show if data is available.
+
+    Returns:
+        bool: False if none of the requested years have data.
+    """
+    import seaborn as sns
+
+    available_years = index.available_years(positions).tolist()
+    valid_years = [year for year in years if year in available_years]
+    if not valid_years:
+        return False
+
+    country_year_data = index.to_long(positions, value_name="Gini Index")
+    country_year_data = country_year_data[country_year_data["Year"].isin(valid_years)]
+
+    sns.barplot(data=country_year_data, x="Year", y="Gini Index", hue="Year", palette="viridis", legend=False, ax=ax)
+    ax.set_title(f"Gini Index for {country_name} in Valid Selected Years")
+    ax.set_xlabel("Year")
+    ax.set_ylabel("Gini Index")
+    return True
+
+
+def latest_observations(long, value_name="Gini Index"):
+    """
+    Returns each country's last valid observation from a long table.
+
+    Parameters:
+        long (pd.DataFrame): Long table with "Country Name", "Year" and the value column.
+        value_name (str): Name of the value column.
+
+    Returns:
+        pd.DataFrame: One row per country holding its latest year and value.
+    """
+    valid = long.dropna(subset=[value_name])
+    latest = valid.loc[valid.groupby("Country Name", observed=True)["Year"].idxmax()]
+    return latest[["Country Name", "Year", value_name]].reset_index(drop=True)
+
+
+def draw_all_country_trends(ax, long, countries_to_label=(), value_name="Gini Index", palette="husl"):
+    """
+    Draws one trend line per country as a single LineCollection and labels selected countries.
+
+    Parameters:
+        ax (matplotlib.axes.Axes): Axes to draw on.
+        long (pd.DataFrame): Long table with "Country Name", "Year" and the value column.
+        countries_to_label (list[str]): Exact country names to label at their latest observation.
+        value_name (str): Name of the value column.
+        palette (str): Seaborn palette used to color the countries.
+
+    Returns:
+        LineCollection: The collection holding every country's line.
+    """
+    import seaborn as sns
+    from matplotlib.collections import LineCollection
+
+    valid = long.dropna(subset=[value_name]).sort_values(["Country Name", "Year"])
+    countries = valid["Country Name"].to_numpy()
+    points = np.column_stack([valid["Year"].to_numpy(dtype="float64"), valid[value_name].to_numpy(dtype="float64")])
+
+    # Split the sorted points wherever the country changes: one polyline per country
+    breaks = np.flatnonzero(countries[1:] != countries[:-1]) + 1
+    segments = np.split(points, breaks)
+
+    lines = LineCollection(segments, colors=sns.color_palette(palette, len(segments)), linewidths=1.5)
+    ax.add_collection(lines)
+    ax.autoscale_view()
+
+    latest = latest_observations(long, value_name)
+    latest = latest[latest["Country Name"].isin(list(countries_to_label))]
+    for name, year, value in zip(latest["Country Name"], latest["Year"], latest[value_name]):
+        ax.text(year, value, name, fontsize=9)
+
+    ax.set_title(f"Trends of {value_name} Across Countries")
+    ax.set_xlabel("Year")
+    ax.set_ylabel(value_name)
+    return lines
+
+
+def heatmap_matrix(long, value_name="Gini Index", sort_rows=None, year_bin=1):
+    """
+    Builds a dense float32 country x year matrix directly from a long table.
+
+    Parameters:
+        long (pd.DataFrame): Long table with "Country Name", "Year" and the value column.
+        value_name (str): Name of the value column.
+        sort_rows (str): None (alphabetical), "mean", "latest" or "cluster" (needs scipy).
+        year_bin (int): Number of consecutive years averaged into one column.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: The matrix, its country labels and the first year of each column.
+    """
+    valid = long.dropna(subset=[value_name])
+    row_codes, countries = pd.factorize(valid["Country Name"], sort=True)
+    years = valid["Year"].to_numpy(dtype="int64")
+    first_year = years.min()
+    col_codes = (years - first_year) // year_bin
+    n_cols = col_codes.max() + 1
+
+    # Scatter values (and counts, for binned means) straight into the dense matrix
+    sums = np.zeros((len(countries), n_cols), dtype="float64")
+    counts = np.zeros((len(countries), n_cols), dtype="int32")
+    np.add.at(sums, (row_codes, col_codes), valid[value_name].to_numpy(dtype="float64"))
+    np.add.at(counts, (row_codes, col_codes), 1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        matrix = (sums / counts).astype("float32")
+    matrix[counts == 0] = np.nan
+
+    labels = np.asarray(countries, dtype=object)
+    year_labels = first_year + np.arange(n_cols) * year_bin
+
+    order = None
+    if sort_rows == "mean":
+        order = np.argsort(np.nanmean(matrix, axis=1))
+    elif sort_rows == "latest":
+        valid_cells = ~np.isnan(matrix)
+        last = matrix.shape[1] - 1 - np.argmax(valid_cells[:, ::-1], axis=1)
+        order = np.argsort(matrix[np.arange(len(matrix)), last])
+    elif sort_rows == "cluster":
+        from scipy.cluster.hierarchy import leaves_list, linkage
+
+        # Missing cells are filled with the row mean so sparse rows still cluster by level
+        filled = np.where(np.isnan(matrix), np.nanmean(matrix, axis=1, keepdims=True), matrix)
+        order = leaves_list(linkage(filled, method="average"))
+    elif sort_rows is not None:
+        raise ValueError(f"Unknown sort_rows option: {sort_rows}")
+
+    if order is not None:
+        matrix, labels = matrix[order], labels[order]
+    return matrix, labels, year_labels
+
+
+def draw_heatmap(ax, matrix, row_labels, year_labels, value_name="Gini Index", cmap="YlGnBu", max_row_ticks=60):
+    """
+    Draws a country x year matrix as a single rasterized image (missing cells left blank).
+
+    Parameters:
+        ax (matplotlib.axes.Axes): Axes to draw on.
+        matrix (np.ndarray): Matrix as returned by heatmap_matrix.
+        row_labels (np.ndarray): Country label per row.
+        year_labels (np.ndarray): Year label per column.
+        value_name (str): Colorbar label.
+        cmap (str): Matplotlib colormap name.
+        max_row_ticks (int): Upper bound on the number of country labels shown.
+
+    Returns:
+        matplotlib.image.AxesImage: The drawn image.
+    """
+    image = ax.imshow(np.ma.masked_invalid(matrix), aspect="auto", interpolation="nearest",
+                      cmap=cmap, rasterized=True)
+    ax.figure.colorbar(image, ax=ax, label=value_name)
+
+    row_step = max(1, int(np.ceil(len(row_labels) / max_row_ticks)))
+    ax.set_yticks(np.arange(0, len(row_labels), row_step))
+    ax.set_yticklabels(row_labels[::row_step], fontsize=7)
+    col_step = max(1, int(np.ceil(len(year_labels) / 20)))
+    ax.set_xticks(np.arange(0, len(year_labels), col_step))
+    ax.set_xticklabels(year_labels[::col_step], rotation=90)
+    return image
@@ -1,60 +1,99 @@
-import streamlit as st
+import os
+import sys
+
 import pandas as pd
-import plotly.express as px
+import streamlit as st
+
+from Econ_Analysis import DATA_DIR
+from Econ_Analysis.world_bank_data import load_world_bank_data
+
+# Streamlit runs this file as a script, so the package is imported by name (see `python -m Econ_Analysis app`)
+DEFAULT_FILE = os.path.join(DATA_DIR, "gini_world_data.csv")
+
 
-# Load and preprocess the data
-@st.cache
+class GiniDataset:
+    """
+    Immutable, precomputed view of the Gini data shared by every session.
+
+    Holds the sorted country list and each country's series so that widget
+    reruns are dictionary lookups instead of filters over the long table.
+    """
+
+    def __init__(self, gini_long):
+        gini_long = gini_long[["Country Name", "Year", "Gini Index"]].sort_values(["Country Name", "Year"])
+        gini_long["Country Name"] = gini_long["Country Name"].astype(str)
+        self.countries = tuple(gini_long["Country Name"].unique())
+        self.series = {
+            country: frame.reset_index(drop=True)
+            for country, frame in gini_long.groupby("Country Name", sort=False)
+        }
+
+
+# Load and preprocess the data once per process, shared across sessions and reruns
+@st.cache_resource
 def load_data(file_path):
-    gini_data = pd.read_csv(file_path, skiprows=4).drop(columns=["Unnamed: 68"]).dropna(how="all", axis=0).reset_index(drop=True)
-    gini_long = gini_data.melt(
-        id_vars=["Country Name", "Country Code"],
-        var_name="Year",
-        value_name="Gini Index"
-    ).dropna(subset=["Gini Index"])
-    gini_long["Year"] = pd.to_numeric(gini_long["Year"], errors="coerce")
-    return gini_long
-
-# Load the dataset
-file_path = "gini_world_data.csv"  # Update with the correct path
-gini_long = load_data(file_path)
-
-# Streamlit UI
-st.title("Interactive Gini Index Visualization")
-st.sidebar.header("Filters")
-
-# Dropdown for selecting a country
-selected_country = st.sidebar.selectbox(
-    "Select a country",
-    gini_long["Country Name"].unique(),
-    index=0
-)
-
-# Filter data for the selected country
-country_data = gini_long[gini_long["Country Name"] == selected_country]
-
-# Line chart for the selected country
-st.subheader(f"Gini Index Trend for {selected_country}")
-fig = px.line(country_data, x="Year", y="Gini Index", title=f"{selected_country} Gini Index Over Time")
-st.plotly_chart(fig)
-
-# Multiselect for comparing multiple countries
-st.sidebar.subheader("Compare Countries")
-selected_countries = st.sidebar.multiselect(
-    "Select countries to compare",
-    gini_long["Country Name"].unique(),
-    default=["Nepal", "India"]
-)
-
-# Filter data for the selected countries
-comparison_data = gini_long[gini_long["Country Name"].isin(selected_countries)]
-
-# Line chart for multiple countries
-st.subheader("Comparison of Gini Index Across Countries")
-fig_comparison = px.line(
-    comparison_data,
-    x="Year",
-    y="Gini Index",
-    color="Country Name",
-    title="Comparison of Gini Index Trends"
-)
-st.plotly_chart(fig_comparison)
+    _, gini_long = load_world_bank_data(file_path, value_name="Gini Index")
+    return GiniDataset(gini_long)
+
+
+# Comparison frames are memoized per selection (the tuple of countries is the cache key)
+@st.cache_data
+def comparison_frame(file_path, selected_countries):
+    dataset = load_data(file_path)
+    frames = [dataset.series[country] for country in selected_countries if country in dataset.series]
+    if not frames:
+        return pd.DataFrame(columns=["Country Name", "Year", "Gini Index"])
+    return pd.concat(frames, ignore_index=True)
+
+
+def main():
+    import plotly.express as px
+
+    # Load the dataset (path from `streamlit run gini_interactive_app.py -- <csv>`)
+    file_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_FILE
+    dataset = load_data(file_path)
+
+    # Streamlit UI
+    st.title("Interactive Gini Index Visualization")
+    st.sidebar.header("Filters")
+
+    # Dropdown for selecting a country
+    selected_country = st.sidebar.selectbox(
+        "Select a country",
+        dataset.countries,
+        index=0
+    )
+
+    # Series for the selected country (precomputed)
+    country_data = dataset.series[selected_country]
+
+    # Line chart for the selected country
+    st.subheader(f"Gini Index Trend for {selected_country}")
+    fig = px.line(country_data, x="Year", y="Gini Index", title=f"{selected_country} Gini Index Over Time")
+    st.plotly_chart(fig)
+
+    # Multiselect for comparing multiple countries
+    st.sidebar.subheader("Compare Countries")
+    selected_countries = st.sidebar.multiselect(
+        "Select countries to compare",
+        dataset.countries,
+        default=[country for country in ["Nepal", "India"] if country in dataset.series]
+    )
+
+    # Data for the selected countries, memoized per selection
+    comparison_data = comparison_frame(file_path, tuple(selected_countries))
+
+    # Line chart for multiple countries
+    st.subheader("Comparison of Gini Index Across Countries")
+    fig_comparison = px.line(
+        comparison_data,
+        x="Year",
+        y="Gini Index",
+        color="Country Name",
+        title="Comparison of Gini Index Trends"
+    )
+    st.plotly_chart(fig_comparison)
+
+
+if __name__ == "__main__":
+    main()
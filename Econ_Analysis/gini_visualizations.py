@@ -1,130 +1,148 @@
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-
-# Load the CSV file and clean metadata
-file_path = 'gini_world_data.csv'
-# Full corrected code for visualizations using Nepal as an example
-
-# Load and clean the dataset
-gini_data = pd.read_csv(file_path, skiprows=4).drop(columns=["Unnamed: 68"]).dropna(how="all", axis=0).reset_index(drop=True)
-
-# Transform data to long format for analysis
-gini_long = gini_data.melt(
-    id_vars=["Country Name", "Country Code", "Indicator Name", "Indicator Code"],
-    var_name="Year",
-    value_name="Gini Index"
+import argparse
+import os
+
+from . import DATA_DIR
+from .country_index import CountryIndex
+from .gini_charts import (
+    draw_all_country_trends,
+    draw_country_bars,
+    draw_country_trend,
+    draw_heatmap,
+    heatmap_matrix,
 )
-gini_long = gini_long.dropna(subset=["Gini Index"])
-gini_long["Year"] = pd.to_numeric(gini_long["Year"], errors="coerce")
+from .pipeline_timing import report_if_enabled, stage
+from .world_bank_data import load_world_bank_data
+
+DEFAULT_COUNTRIES_TO_LABEL = ["Nepal", "United States", "India", "China", "Brazil", "Germany", "South Korea"]
+DEFAULT_YEARS = [2000, 2005, 2010, 2015, 2020]
+
+
+def _as_index(data):
+    # Accept either a prebuilt CountryIndex or a wide DataFrame (indexed on the fly)
+    return data if isinstance(data, CountryIndex) else CountryIndex(data)
 
 
 # Function to extract data for a specific country and save to CSV
 def extract_country_data(data, country_name, output_path=None):
     """
     Extracts all data for a specific country from the dataset and optionally saves it to a CSV file.
-    
+
     Parameters:
-        data (pd.DataFrame): The full dataset.
-        country_name (str): The name of the country to extract data for.
+        data (CountryIndex | pd.DataFrame): The full dataset, ideally as a prebuilt CountryIndex.
+        country_name (str): The name, ISO3 code or partial name of the country to extract data for.
         output_path (str): Optional path to save the extracted data as a CSV file.
-    
+
     Returns:
         pd.DataFrame: The extracted data for the specified country.
     """
-    country_data = data[data["Country Name"].str.contains(country_name, case=False, na=False)]
-    if country_data.empty:
+    index = _as_index(data)
+    positions = index.find(country_name)
+    if not positions:
         print(f"No data found for country: {country_name}")
         return None
+    country_data = index.rows(positions)
     if output_path:
         country_data.to_csv(output_path, index=False)
         print(f"Data saved to {output_path}")
     return country_data
 
-# Example usage
-nepal_data = extract_country_data(gini_data, "Nepal", "nepal_gini_index_data.csv")
-if nepal_data is not None:
-    print(nepal_data)
 
+# General Visualization: Line plot for trends across countries
+def plot_all_country_trends(gini_long, countries_to_label=DEFAULT_COUNTRIES_TO_LABEL):
+    import matplotlib.pyplot as plt
 
+    fig, ax = plt.subplots(figsize=(14, 8))
+    draw_all_country_trends(ax, gini_long, countries_to_label, value_name="Gini Index")
+    plt.show()
 
-# General Visualization: Line plot for trends across countries
-plt.figure(figsize=(14, 8))
-sns.lineplot(data=gini_long, x="Year", y="Gini Index", hue="Country Name", legend=None)
-plt.title("Trends of Gini Index Across Countries")
-plt.xlabel("Year")
-plt.ylabel("Gini Index")
-# Adding labels for specific countries
-countries_to_label = ["Nepal", "United States", "India", "China", "Brazil", "Germany", "South Korea"]
-for country in countries_to_label:
-    country_data = gini_long[gini_long["Country Name"] == country]
-    if not country_data.empty:
-        latest_data = country_data[country_data["Year"] == country_data["Year"].max()]
-        for _, row in latest_data.iterrows():
-            plt.text(row["Year"], row["Gini Index"], country, fontsize=9)
-plt.show()
 
 # General Visualization: Heatmap
-heatmap_data = gini_long.pivot(index="Country Name", columns="Year", values="Gini Index")
-heatmap_data_cleaned = heatmap_data.apply(pd.to_numeric, errors='coerce')
+def plot_gini_heatmap(gini_long):
+    import matplotlib.pyplot as plt
+
+    # Dense float32 matrix drawn as one rasterized image rather than one patch per cell
+    heatmap_data, heatmap_countries, heatmap_years = heatmap_matrix(gini_long, value_name="Gini Index")
+
+    fig, ax = plt.subplots(figsize=(16, 10))
+    draw_heatmap(ax, heatmap_data, heatmap_countries, heatmap_years, value_name="Gini Index", cmap="YlGnBu")
+    plt.title("Gini Index Heatmap Across Countries and Years")
+    plt.xlabel("Year")
+    plt.ylabel("Country Name")
+    plt.show()
 
-plt.figure(figsize=(16, 10))
-sns.heatmap(heatmap_data_cleaned, cmap="YlGnBu", linewidths=0.5, cbar_kws={'label': 'Gini Index'})
-plt.title("Gini Index Heatmap Across Countries and Years")
-plt.xlabel("Year")
-plt.ylabel("Country Name")
-plt.show()
 
 # Country-Specific Visualizations
 def plot_country_gini(data, country_name):
-    country_data = data[data["Country Name"].str.contains(country_name, case=False, na=False)]
-    if country_data.empty:
+    import matplotlib.pyplot as plt
+
+    index = _as_index(data)
+    positions = index.find(country_name)
+    if not positions:
         print(f"No data found for country: {country_name}")
         return
 
-    country_long = country_data.melt(
-        id_vars=["Country Name", "Country Code", "Indicator Name", "Indicator Code"],
-        var_name="Year",
-        value_name="Gini Index"
-    ).dropna(subset=["Gini Index"])
-    country_long["Year"] = pd.to_numeric(country_long["Year"], errors="coerce")
-
-    plt.figure(figsize=(10, 6))
-    sns.lineplot(data=country_long, x="Year", y="Gini Index")
-    plt.title(f"Gini Index Trend for {country_name}")
-    plt.xlabel("Year")
-    plt.ylabel("Gini Index")
+    fig, ax = plt.subplots(figsize=(10, 6))
+    draw_country_trend(ax, index, positions, country_name)
     plt.show()
 
+
 def bar_chart_country_gini_with_suggestion(data, country_name, years):
-    country_data = data[data["Country Name"].str.contains(country_name, case=False, na=False)]
-    if country_data.empty:
+    import matplotlib.pyplot as plt
+
+    index = _as_index(data)
+    positions = index.find(country_name)
+    if not positions:
         print(f"No data found for country: {country_name}")
         return
 
-    available_years = country_data.drop(columns=["Country Name", "Country Code", "Indicator Name", "Indicator Code"]).dropna(axis=1).columns
-    available_years = [int(year) for year in available_years if year.isdigit()]
-    
-    valid_years = [year for year in years if str(year) in country_data.columns and year in available_years]
-    if not valid_years:
+    available_years = index.available_years(positions).tolist()
+    if not any(year in available_years for year in years):
         print(f"No Gini index data available for {country_name} in the selected years: {years}.")
         print(f"Available years with data for {country_name}: {sorted(available_years)}")
         return
 
-    selected_columns = ["Country Name"] + [str(year) for year in valid_years]
-    country_year_data = country_data[selected_columns].melt(
-        id_vars=["Country Name"],
-        var_name="Year",
-        value_name="Gini Index"
-    ).dropna(subset=["Gini Index"])
-
-    plt.figure(figsize=(10, 6))
-    sns.barplot(data=country_year_data, x="Year", y="Gini Index", palette="viridis")
-    plt.title(f"Gini Index for {country_name} in Valid Selected Years")
-    plt.xlabel("Year")
-    plt.ylabel("Gini Index")
+    fig, ax = plt.subplots(figsize=(10, 6))
+    draw_country_bars(ax, index, positions, country_name, years)
     plt.show()
 
-# Example country: Nepal
-plot_country_gini(gini_data, "Nepal")
-bar_chart_country_gini_with_suggestion(gini_data, "Nepal", [2000, 2005, 2010, 2015, 2020])
\ No newline at end of file
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Extract one country's Gini Index data and plot it against the world.")
+    parser.add_argument("--file", default=os.path.join(DATA_DIR, "gini_world_data.csv"), help="World Bank Gini CSV")
+    parser.add_argument("--country", default="Nepal", help="Country name or ISO3 code")
+    parser.add_argument("--output", default=None,
+                        help="CSV for the extracted country data (default: <country>_gini_index_data.csv)")
+    parser.add_argument("--years", nargs="+", type=int, default=DEFAULT_YEARS, help="Years in the bar chart")
+    parser.add_argument("--label", nargs="*", default=DEFAULT_COUNTRIES_TO_LABEL,
+                        help="Countries labelled on the all-country trend chart")
+    args = parser.parse_args(argv)
+
+    # Load the cleaned wide dataset and its long format for analysis
+    # (parsed once, then served from the columnar cache until the CSV changes).
+    # Run with ECON_TIMING=1 to print how long each stage took.
+    with stage('load'):
+        gini_data, gini_long = load_world_bank_data(args.file, value_name="Gini Index")
+
+    # Country name/code lookups and the dense country x year matrix, built once
+    with stage('index'):
+        gini_index = CountryIndex(gini_data)
+
+    with stage('extract'):
+        output = args.output or f"{args.country.lower().replace(' ', '_')}_gini_index_data.csv"
+        country_data = extract_country_data(gini_index, args.country, output)
+    if country_data is not None:
+        print(country_data)
+
+    # Each chart is drawn and shown in turn; with an interactive backend the render
+    # stage also counts the time a window stays open.
+    with stage('render'):
+        plot_all_country_trends(gini_long, args.label)
+        plot_gini_heatmap(gini_long)
+        plot_country_gini(gini_index, args.country)
+        bar_chart_country_gini_with_suggestion(gini_index, args.country, args.years)
+
+    report_if_enabled()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+import os
+
+import pandas as pd
+
+from .nepal_geometry import simplify_districts
+from .world_bank_data import DEFAULT_CACHE_DIR, file_digest
+
+# Lambert azimuthal equal-area projection centred on Nepal, used for every area computation
+EQUAL_AREA_CRS = "+proj=laea +lat_0=28.4 +lon_0=84.1 +datum=WGS84 +units=m +no_defs"
+
+# GADM level -> id column and name column; each level also keeps the names of the levels above it
+ADMIN_LEVELS = {1: ("GID_1", "NAME_1"), 2: ("GID_2", "NAME_2"), 3: ("GID_3", "NAME_3")}
+
+# Names of the GADM 4.1 levels for Nepal (development regions, zones, districts)
+LEVEL_NAMES = {"region": 1, "zone": 2, "district": 3}
+
+# Extra district attributes kept for name matching (see district_names.DistrictNameIndex)
+DISTRICT_EXTRAS = ["VARNAME_3", "HASC_3"]
+
+
+def admin_columns(level):
+    """
+    Returns the attribute columns kept at an administrative level.
+
+    Parameters:
+        level (int): GADM level (1 region, 2 zone, 3 district).
+
+    Returns:
+        list[str]: Id and name columns of this level and the levels above it.
+    """
+    columns = []
+    for upper in range(1, level + 1):
+        columns += ADMIN_LEVELS[upper]
+    return columns + (DISTRICT_EXTRAS if level == 3 else [])
+
+
+def dissolve_admin_levels(districts):
+    """
+    Computes district areas in an equal-area projection and dissolves the districts into every level.
+
+    Areas are measured once on the full-resolution district polygons; zone and
+    region areas are the sums of their districts' areas, so no dissolved shape
+    is reprojected or measured again.
+
+    Parameters:
+        districts (gpd.GeoDataFrame): Full-resolution GADM level-3 polygons in EPSG:4326.
+
+    Returns:
+        dict[int, gpd.GeoDataFrame]: Per level, one row per unit with its hierarchy
+        attributes, "area_km2", "n_districts" and its (unsimplified) geometry.
+    """
+    districts = districts[[col for col in admin_columns(3) if col in districts.columns] + ["geometry"]].copy()
+    districts["area_km2"] = districts.geometry.to_crs(EQUAL_AREA_CRS).area.to_numpy() / 1e6
+    districts["n_districts"] = 1
+
+    levels = {3: districts.reset_index(drop=True)}
+    for level in (2, 1):
+        id_column = ADMIN_LEVELS[level][0]
+        aggfunc = {col: "first" for col in admin_columns(level) if col != id_column}
+        aggfunc.update(area_km2="sum", n_districts="sum")
+        dissolved = districts.dissolve(by=id_column, aggfunc=aggfunc, sort=True).reset_index()
+        levels[level] = dissolved[admin_columns(level) + ["area_km2", "n_districts", "geometry"]]
+    return levels
+
+
+def _level_cache_path(file_path, cache_dir, level, tolerance, quantize_digits):
+    stem = os.path.splitext(os.path.basename(file_path))[0]
+    return os.path.join(cache_dir, f"{stem}.{file_digest(file_path)}.admin{level}.tol{tolerance}.q{quantize_digits}.geojson")
+
+
+def admin_level_path(file_path, level=3, tolerance=0.005, quantize_digits=4, cache_dir=None):
+    """
+    Returns the cached boundaries and attributes of one administrative level, building every level if needed.
+
+    The first call reads and reprojects the GADM file once, dissolves it into
+    all three levels, simplifies each level's shared borders and writes one
+    GeoJSON per level. Later calls (for any level) only read the cache, which is
+    keyed on the source content hash, the tolerance and the quantization.
+
+    Parameters:
+        file_path (str): Path to the full-resolution GADM level-3 GeoJSON.
+        level (int): GADM level (1 region, 2 zone, 3 district).
+        tolerance (float): Simplification tolerance in degrees.
+        quantize_digits (int): Decimal places kept per coordinate.
+        cache_dir (str): Cache directory (defaults to ".cache" next to the source file).
+
+    Returns:
+        str: Path to the cached GeoJSON of the level.
+    """
+    if level not in ADMIN_LEVELS:
+        raise ValueError(f"Unknown administrative level: {level}")
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(os.path.abspath(file_path)), DEFAULT_CACHE_DIR)
+    paths = {lvl: _level_cache_path(file_path, cache_dir, lvl, tolerance, quantize_digits) for lvl in ADMIN_LEVELS}
+    if os.path.exists(paths[level]):
+        return paths[level]
+
+    import geopandas as gpd
+
+    os.makedirs(cache_dir, exist_ok=True)
+    for lvl, units in dissolve_admin_levels(gpd.read_file(file_path)).items():
+        simplified = simplify_districts(units, tolerance, quantize_digits)
+        # Per-process temporary name: concurrent builders of a cold cache never share one
+        temp_path = f"{paths[lvl]}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "w") as handle:
+                handle.write(simplified.to_json(drop_id=True, separators=(",", ":")))
+            os.replace(temp_path, paths[lvl])
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+    return paths[level]
+
+
+def load_admin_level(file_path, level=3, tolerance=0.005, quantize_digits=4, cache_dir=None):
+    """
+    Loads the simplified boundaries of one administrative level with their cached attributes.
+
+    Parameters:
+        file_path (str): Path to the full-resolution GADM level-3 GeoJSON.
+        level (int): GADM level (1 region, 2 zone, 3 district).
+        tolerance (float): Simplification tolerance in degrees.
+        quantize_digits (int): Decimal places kept per coordinate.
+        cache_dir (str): Cache directory (defaults to ".cache" next to the source file).
+
+    Returns:
+        gpd.GeoDataFrame: One row per unit with hierarchy attributes, "area_km2" and "n_districts".
+    """
+    import geopandas as gpd
+
+    return gpd.read_file(admin_level_path(file_path, level, tolerance, quantize_digits, cache_dir))
+
+
+def aggregate_to_level(districts, units, value_columns, density=True):
+    """
+    Sums district-level indicators up to the units of another level and derives densities.
+
+    Parameters:
+        districts (pd.DataFrame): District rows carrying the GID columns and the indicators
+            (e.g. the result of DistrictNameIndex.join on load_admin_level(..., level=3)).
+        units (gpd.GeoDataFrame): Units of the target level (see load_admin_level).
+        value_columns (list[str]): Count indicators to sum, such as "Population_2021".
+        density (bool): Add "<column>_per_km2" for every indicator.
+
+    Returns:
+        gpd.GeoDataFrame: The units with the summed indicators, the number of districts
+        with data ("n_reporting") and the densities. A unit whose districts all lack
+        data gets NaN; partially covered units can be spotted by n_reporting < n_districts.
+    """
+    id_column = next(ADMIN_LEVELS[level][0] for level in sorted(ADMIN_LEVELS, reverse=True)
+                     if ADMIN_LEVELS[level][0] in units.columns)
+    values = pd.DataFrame(districts[[id_column] + list(value_columns)])
+    grouped = values.groupby(id_column)
+    totals = grouped[list(value_columns)].sum(min_count=1)
+    totals["n_reporting"] = grouped[list(value_columns)].count().max(axis=1)
+
+    result = units.drop(columns=[col for col in value_columns if col in units.columns])
+    result = result.merge(totals, left_on=id_column, right_index=True, how="left")
+    result["n_reporting"] = result["n_reporting"].fillna(0).astype("int64")
+    if density:
+        for column in value_columns:
+            result[f"{column}_per_km2"] = result[column] / result["area_km2"]
+    return result
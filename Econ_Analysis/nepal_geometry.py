@@ -0,0 +1,36 @@
+import numpy as np
+import shapely
+
+
+def simplify_districts(districts, tolerance=0.005, quantize_digits=4):
+    """
+    Simplifies district boundaries while keeping shared borders aligned.
+
+    Uses coverage simplification, which simplifies each shared edge once so that
+    neighbouring districts stay gap- and overlap-free (falls back to per-polygon
+    topology-preserving simplification on older shapely/GEOS), then snaps the
+    coordinates to a fixed number of decimals.
+
+    Parameters:
+        districts (gpd.GeoDataFrame): District polygons in EPSG:4326.
+        tolerance (float): Simplification tolerance in degrees (0 disables simplification).
+        quantize_digits (int): Decimal places kept per coordinate (None disables quantization).
+
+    Returns:
+        gpd.GeoDataFrame: A copy with simplified, quantized geometries.
+    """
+    import geopandas as gpd
+
+    geometries = districts.geometry.values
+    if tolerance:
+        if hasattr(shapely, "coverage_simplify"):
+            geometries = shapely.coverage_simplify(geometries, tolerance)
+        else:
+            geometries = shapely.simplify(geometries, tolerance, preserve_topology=True)
+    if quantize_digits is not None:
+        geometries = shapely.transform(geometries, lambda coords: np.round(coords, quantize_digits))
+        geometries = shapely.make_valid(geometries)
+
+    simplified = districts.copy()
+    simplified.geometry = gpd.GeoSeries(geometries, index=districts.index, crs=districts.crs)
+    return simplified
@@ -0,0 +1,132 @@
+import json
+import os
+
+import numpy as np
+
+NEPAL_CENTER = [28.3949, 84.1240]
+
+
+def bin_colors(values, bins=6, cmap="YlOrRd", scheme="equal"):
+    """
+    Assigns a hex fill color to every value by equal-width or quantile binning.
+
+    Quantile classes suit skewed indicators such as population density, where a
+    few urban districts would otherwise push every other district into the first class.
+
+    Parameters:
+        values (array-like): Indicator values (NaN values get no color).
+        bins (int): Number of color classes (fewer if quantiles coincide).
+        cmap (str): Matplotlib colormap name.
+        scheme (str): "equal" (equal-width classes) or "quantile" (equal-count classes).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, list[str]]: Hex color per value (None for NaN),
+        the bin edges and the hex color per bin.
+    """
+    from matplotlib import colormaps
+    from matplotlib.colors import to_hex
+
+    values = np.asarray(values, dtype="float64")
+    if scheme == "quantile":
+        edges = np.unique(np.nanquantile(values, np.linspace(0, 1, bins + 1)))
+        if len(edges) < 2:
+            edges = np.repeat(edges, 2)
+        bins = len(edges) - 1
+    elif scheme == "equal":
+        edges = np.linspace(np.nanmin(values), np.nanmax(values), bins + 1)
+    else:
+        raise ValueError(f"Unknown binning scheme: {scheme}")
+    palette = [to_hex(color) for color in colormaps[cmap](np.linspace(0.1, 0.9, bins))]
+    classes = np.clip(np.digitize(values, edges[1:-1]), 0, bins - 1)
+    colors = np.array(palette, dtype=object)[classes]
+    colors[np.isnan(values)] = None
+    return colors, edges, palette
+
+
+def district_geojson(districts, value_column, name_column="NAME_3", fill_colors=None):
+    """
+    Serializes district geometries once, carrying only the properties the map needs.
+
+    Parameters:
+        districts (gpd.GeoDataFrame): Districts with the indicator already joined.
+        value_column (str): Indicator column shown in the tooltip.
+        name_column (str): District name column shown in the tooltip.
+        fill_colors (array-like): Precomputed hex fill color per district.
+
+    Returns:
+        str: Compact GeoJSON FeatureCollection.
+    """
+    slim = districts[[name_column, value_column, "geometry"]].copy()
+    if fill_colors is not None:
+        slim["fill"] = fill_colors
+    return slim.to_json(drop_id=True, separators=(",", ":"))
+
+
+def build_choropleth_map(districts, value_column, name_column="NAME_3", legend_name=None,
+                         bins=6, cmap="YlOrRd", sidecar_path=None, location=NEPAL_CENTER, zoom_start=7,
+                         scheme="equal", output_path=None):
+    """
+    Builds a Folium choropleth whose colors are computed up front in Python.
+
+    Geometry is serialized exactly once and the style function only reads the
+    precomputed "fill" property, so no separate data table is shipped. With
+    sidecar_path the GeoJSON is written next to the HTML and loaded by the page
+    instead of being inlined into it.
+
+    Parameters:
+        districts (gpd.GeoDataFrame): Districts with the indicator already joined.
+        value_column (str): Indicator column to color by.
+        name_column (str): District name column shown in the tooltip.
+        legend_name (str): Legend caption (defaults to value_column).
+        bins (int): Number of color classes.
+        cmap (str): Matplotlib colormap name.
+        sidecar_path (str): Optional GeoJSON file path, relative to the directory of output_path.
+        location (list[float]): Map center as [lat, lon].
+        zoom_start (int): Initial zoom level.
+        scheme (str): Binning of the color classes, "equal" or "quantile" (see bin_colors).
+        output_path (str): Where the HTML will be saved; only used to place the sidecar
+            (defaults to the current directory).
+
+    Returns:
+        folium.Map: The map with the choropleth layer, legend and layer control.
+    """
+    import folium
+    from branca.colormap import StepColormap
+
+    colors, edges, palette = bin_colors(districts[value_column], bins, cmap, scheme)
+    geojson = district_geojson(districts, value_column, name_column, colors)
+
+    if sidecar_path is not None:
+        # The page fetches the sidecar relative to itself, so it is written relative to the HTML
+        if os.path.isabs(sidecar_path):
+            raise ValueError(f"sidecar_path must be relative to the HTML file: {sidecar_path}")
+        file_path = os.path.join(os.path.dirname(output_path or ""), sidecar_path)
+        with open(file_path, "w") as handle:
+            handle.write(geojson)
+        data, embed = file_path, False
+    else:
+        data, embed = json.loads(geojson), True
+
+    m = folium.Map(location=location, zoom_start=zoom_start)
+    layer = folium.GeoJson(
+        data,
+        name="Choropleth",
+        embed=embed,
+        style_function=lambda feature: {
+            "fillColor": feature["properties"]["fill"] or "#cccccc",
+            "fillOpacity": 0.7,
+            "color": "black",
+            "weight": 1,
+            "opacity": 0.2,
+        },
+        tooltip=folium.GeoJsonTooltip(fields=[name_column, value_column]),
+    )
+    if sidecar_path is not None:
+        # Folium links the path it read from; the page needs it relative to the HTML
+        layer.embed_link = sidecar_path.replace(os.sep, "/")
+    layer.add_to(m)
+
+    StepColormap(palette, index=list(edges), vmin=edges[0], vmax=edges[-1],
+                 caption=legend_name or value_column).add_to(m)
+    folium.LayerControl().add_to(m)
+    return m
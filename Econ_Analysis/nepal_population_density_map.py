@@ -1,45 +1,94 @@
-import folium
+import argparse
+import os
+
 import pandas as pd
-import geopandas as gpd
 
-# Load your population data.
-pop_data = pd.read_csv('Nepal_District_Populations_2021_renamed.csv')
-pop_data['District'] = pop_data['District'].str.strip().str.lower()
+from . import DATA_DIR
+from .district_names import DistrictNameIndex
+from .nepal_admin import ADMIN_LEVELS, LEVEL_NAMES, aggregate_to_level, load_admin_level
+from .nepal_map import build_choropleth_map
+from .pipeline_timing import report_if_enabled, stage
+
+# Boundary simplification tolerance (degrees) and coordinate precision for the map.
+# Each setting is computed once and then read from the on-disk cache.
+SIMPLIFY_TOLERANCE = 0.005
+QUANTIZE_DIGITS = 4
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the Nepal population density (or count) choropleth map.")
+    parser.add_argument("--population", default=os.path.join(DATA_DIR, "Nepal_District_Populations_2021_renamed.csv"))
+    parser.add_argument("--boundaries", default=os.path.join(DATA_DIR, "gadm41_NPL_3.json"), help="GADM level-3 GeoJSON")
+    parser.add_argument("--value-column", default="Population_2021")
+    parser.add_argument("--level", choices=list(LEVEL_NAMES), default="district",
+                        help="Administrative level to map (districts are summed up to zones/regions)")
+    parser.add_argument("--indicator", choices=["density", "count"], default="density",
+                        help="People per km² (equal-area district areas) or the raw count")
+    parser.add_argument("--scheme", choices=["equal", "quantile"], default=None,
+                        help="Color class binning (default: quantile for density, equal for counts)")
+    parser.add_argument("--tolerance", type=float, default=SIMPLIFY_TOLERANCE)
+    parser.add_argument("--quantize-digits", type=int, default=QUANTIZE_DIGITS)
+    parser.add_argument("--sidecar", default=None,
+                        help="Write the boundaries to this GeoJSON file (relative to --output) instead of inline")
+    parser.add_argument("--output", default="nepal_population_heatmap.html")
+    args = parser.parse_args(argv)
 
-# Load Nepal's district boundaries from the GeoJSON file.
-nepal_districts = gpd.read_file('gadm41_NPL_3.json')
-nepal_districts['NAME_3'] = nepal_districts['NAME_3'].str.strip().str.lower()
+    # Load your population data and Nepal's simplified district boundaries. Areas (computed
+    # once in an equal-area projection) and the dissolved zone/region boundaries are cached
+    # per tolerance. Run with ECON_TIMING=1 to print how long each stage took.
+    level = LEVEL_NAMES[args.level]
+    with stage('load'):
+        pop_data = pd.read_csv(args.population)
+        nepal_districts = load_admin_level(args.boundaries, 3, args.tolerance, args.quantize_digits)
 
-# Merge the population data with the GeoDataFrame using "NAME_3"
-nepal_districts = nepal_districts.merge(pop_data, left_on='NAME_3', right_on='District')
+    # Join the population data through the district name index (NAME_3, VARNAME_3 and
+    # HASC_3 spellings, with a fuzzy fallback). Districts split after the GADM release
+    # resolve to their parent district and are summed.
+    with stage('join'):
+        name_index = DistrictNameIndex(nepal_districts)
+        nepal_districts, match_report = name_index.join(pop_data, 'District', aggregate='sum')
 
-# Inspect the merged data.
-print(nepal_districts.head())
-print("Number of merged rows:", len(nepal_districts))
+    # Inspect the merged data and anything that did not match exactly.
+    print(nepal_districts.head())
+    print("Number of merged rows:", len(nepal_districts))
+    print(match_report[match_report['method'] != 'exact'])
+    print("Districts without data:", name_index.unmatched_districts(match_report))
 
-# Convert the merged GeoDataFrame to GeoJSON.
-nepal_geojson = nepal_districts.to_json()
+    # Sum the counts up to the requested level and divide by the cached areas
+    with stage('aggregate'):
+        units = nepal_districts if level == 3 else load_admin_level(args.boundaries, level, args.tolerance,
+                                                                    args.quantize_digits)
+        units = aggregate_to_level(nepal_districts, units, [args.value_column])
+    if args.indicator == 'density':
+        value_column = f"{args.value_column}_per_km2"
+        units[value_column] = units[value_column].round(1)
+        legend_name = f"Population density by {args.level.title()} (people per km²)"
+    else:
+        value_column = args.value_column
+        legend_name = f"Population by {args.level.title()}"
 
-# Create a Folium map centered on Nepal.
-m = folium.Map(location=[28.3949, 84.1240], zoom_start=7)
+    # Build the choropleth: geometry is serialized once with only the unit name,
+    # indicator and precomputed fill color. With --sidecar the boundaries are shipped
+    # next to the HTML instead of inline.
+    with stage('map'):
+        m = build_choropleth_map(
+            units,
+            value_column=value_column,
+            name_column=ADMIN_LEVELS[level][1],
+            legend_name=legend_name,
+            cmap='YlOrRd',
+            sidecar_path=args.sidecar,
+            output_path=args.output,
+            scheme=args.scheme or ('quantile' if args.indicator == 'density' else 'equal')
+        )
 
-# Add a choropleth layer to the map using the appropriate population column.
-folium.Choropleth(
-    geo_data=nepal_geojson,
-    name='Choropleth',
-    data=pop_data,
-    columns=['District', 'Population_2021'],  # Use your actual population column name.
-    key_on='feature.properties.NAME_3',        # Changed to "NAME_3"
-    fill_color='YlOrRd',
-    fill_opacity=0.7,
-    line_opacity=0.2,
-    legend_name='Population by District'
-).add_to(m)
+    # Save the map to an HTML file.
+    with stage('save'):
+        m.save(args.output)
 
-# Add a layer control panel.
-folium.LayerControl().add_to(m)
+    print(f"Map has been saved as '{args.output}'")
+    report_if_enabled()
 
-# Save the map to an HTML file.
-m.save('nepal_population_heatmap.html')
 
-print("Map has been saved as 'nepal_population_heatmap.html'")
+if __name__ == "__main__":
+    main()
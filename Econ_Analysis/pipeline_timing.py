@@ -0,0 +1,126 @@
+import functools
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# Set to 1 to print a stage report when an instrumented script finishes
+TIMING_ENV = "ECON_TIMING"
+
+
+class StageTimer:
+    """
+    Records wall time, and optionally peak Python-heap memory, per named pipeline stage.
+
+    Timing costs two perf_counter calls per stage, cheap enough to leave on in
+    production. Memory tracing uses tracemalloc (which also sees NumPy and
+    pandas buffers) and slows allocation-heavy code, so it is off unless
+    requested. Nested stages are recorded with "outer/inner" names.
+
+    Parameters:
+        trace_memory (bool): Also record each stage's peak traced memory.
+    """
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.records = []
+        self._stack = []
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Context manager timing the enclosed block as one stage.
+
+        Parameters:
+            name (str): Stage name, e.g. "load" or "render".
+        """
+        full_name = "/".join([frame["name"] for frame in self._stack] + [name])
+        frame = {"name": name}
+        started_tracing = False
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            # Fold the peak so far into the enclosing stage before resetting it for this one
+            if self._stack:
+                parent = self._stack[-1]
+                parent["peak"] = max(parent["peak"], tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+            frame["baseline"] = frame["peak"] = tracemalloc.get_traced_memory()[0]
+        self._stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            record = {"stage": full_name, "seconds": time.perf_counter() - start}
+            self._stack.pop()
+            if self.trace_memory:
+                peak = max(frame["peak"], tracemalloc.get_traced_memory()[1])
+                record["peak_mb"] = (peak - frame["baseline"]) / 2 ** 20
+                if self._stack:
+                    self._stack[-1]["peak"] = max(self._stack[-1]["peak"], peak)
+                if started_tracing:
+                    tracemalloc.stop()
+            self.records.append(record)
+
+    def timed(self, name=None):
+        """
+        Decorator timing every call of a function as a stage (named after the function by default).
+        """
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.stage(name or func.__name__):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def summary(self):
+        """
+        Returns total seconds, call count and largest peak memory per stage.
+
+        Returns:
+            dict[str, dict]: Stage name to {"seconds", "calls"[, "peak_mb"]}, in first-seen order.
+        """
+        stages = {}
+        for record in self.records:
+            entry = stages.setdefault(record["stage"], {"seconds": 0.0, "calls": 0})
+            entry["seconds"] += record["seconds"]
+            entry["calls"] += 1
+            if "peak_mb" in record:
+                entry["peak_mb"] = max(entry.get("peak_mb", 0.0), record["peak_mb"])
+        return stages
+
+    def report(self):
+        """
+        Prints the stage summary as an aligned table.
+        """
+        stages = self.summary()
+        if not stages:
+            return
+        width = max(len(name) for name in stages)
+        for name, entry in stages.items():
+            memory = f"  {entry['peak_mb']:9.1f} MB" if "peak_mb" in entry else ""
+            print(f"{name:<{width}}  {entry['seconds']:9.3f} s  x{entry['calls']}{memory}")
+
+    def to_json(self, path, **metadata):
+        """
+        Writes the stage summary (and any metadata) to a JSON file.
+        """
+        with open(path, "w") as handle:
+            json.dump({"meta": metadata, "stages": self.summary()}, handle, indent=2)
+
+
+# Process-wide timer for instrumenting scripts: `with stage("load"): ...` or `@timed()`
+default_timer = StageTimer()
+stage = default_timer.stage
+timed = default_timer.timed
+
+
+def report_if_enabled(timer=default_timer):
+    """
+    Prints the timer's report when the ECON_TIMING environment variable is set to 1.
+    """
+    if os.environ.get(TIMING_ENV) == "1":
+        timer.report()
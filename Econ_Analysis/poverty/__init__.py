@@ -0,0 +1 @@
+# MPI and World Happiness Report workbooks and the loaders/charts built on them
@@ -0,0 +1,140 @@
+import os
+
+import pandas as pd
+
+# Directory holding the source workbooks; override with the ECON_DATA_DIR environment variable
+DATA_DIR_ENV = "ECON_DATA_DIR"
+
+HAPPINESS_WORKBOOK = "DataForFigure2.1+with+sub+bars+2024.xls"
+MPI_WORKBOOK = "National_Results_MPI_2024.xlsx"
+
+
+def data_path(file_name, data_dir=None):
+    """
+    Resolves a workbook name against the configured data directory.
+
+    Parameters:
+        file_name (str): Workbook file name.
+        data_dir (str): Explicit directory; defaults to $ECON_DATA_DIR, then this script's directory.
+
+    Returns:
+        str: Path to the workbook.
+    """
+    if data_dir is None:
+        data_dir = os.environ.get(DATA_DIR_ENV) or os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(data_dir, file_name)
+
+
+def iter_sheet_rows(file_path, sheet_name=0):
+    """
+    Streams the rows of one worksheet as tuples without loading the whole workbook.
+
+    Uses calamine when python-calamine is installed (xls and xlsx), otherwise
+    openpyxl in read-only mode for xlsx and xlrd on demand for xls. Empty cells
+    are returned as None.
+
+    Parameters:
+        file_path (str): Path to the workbook.
+        sheet_name (int | str): Sheet index or name.
+
+    Yields:
+        tuple: Cell values of one row.
+    """
+    try:
+        from python_calamine import CalamineWorkbook
+    except ImportError:
+        CalamineWorkbook = None
+
+    if CalamineWorkbook is not None:
+        workbook = CalamineWorkbook.from_path(file_path)
+        if isinstance(sheet_name, int):
+            sheet = workbook.get_sheet_by_index(sheet_name)
+        else:
+            sheet = workbook.get_sheet_by_name(sheet_name)
+        for row in sheet.iter_rows():
+            yield tuple(None if cell == "" else cell for cell in row)
+    elif file_path.lower().endswith(".xls"):
+        import xlrd
+
+        workbook = xlrd.open_workbook(file_path, on_demand=True)
+        try:
+            if isinstance(sheet_name, int):
+                sheet = workbook.sheet_by_index(sheet_name)
+            else:
+                sheet = workbook.sheet_by_name(sheet_name)
+            for index in range(sheet.nrows):
+                yield tuple(None if cell == "" else cell for cell in sheet.row_values(index))
+        finally:
+            workbook.release_resources()
+    else:
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            sheet = workbook.worksheets[sheet_name] if isinstance(sheet_name, int) else workbook[sheet_name]
+            yield from sheet.iter_rows(values_only=True)
+        finally:
+            workbook.close()
+
+
+def read_filtered_sheet(file_path, sheet_name=0, header_row=0, columns=None, filter_column=None, filter_values=None):
+    """
+    Reads selected columns and matching rows of a worksheet in one streaming pass.
+
+    Only the requested columns of rows whose filter column is in filter_values
+    are ever materialized.
+
+    Parameters:
+        file_path (str): Path to the workbook.
+        sheet_name (int | str): Sheet index or name.
+        header_row (int): Zero-based row holding the column names.
+        columns (list[str]): Columns to keep (all columns if None).
+        filter_column (str): Column whose value selects rows (e.g. "Country name").
+        filter_values (list[str]): Accepted values of filter_column (compared after stripping).
+
+    Returns:
+        pd.DataFrame: The selected rows and columns.
+    """
+    rows = iter_sheet_rows(file_path, sheet_name)
+    for _ in range(header_row):
+        next(rows)
+    header = [str(cell).strip() if cell is not None else None for cell in next(rows)]
+
+    columns = columns or [name for name in header if name is not None]
+    missing = [name for name in columns + ([filter_column] if filter_column else []) if name not in header]
+    if missing:
+        raise KeyError(f"Columns not found in {file_path}: {missing}")
+    positions = [header.index(name) for name in columns]
+
+    wanted = None
+    if filter_column is not None and filter_values is not None:
+        filter_pos = header.index(filter_column)
+        wanted = {str(value).strip() for value in filter_values}
+
+    records = []
+    for row in rows:
+        if wanted is not None:
+            key = row[filter_pos] if filter_pos < len(row) else None
+            if key is None or str(key).strip() not in wanted:
+                continue
+        records.append([row[pos] if pos < len(row) else None for pos in positions])
+    return pd.DataFrame(records, columns=columns)
+
+
+def load_happiness_scores(countries=None, columns=("Country name", "Ladder score"), file_path=None):
+    """
+    Loads World Happiness Report scores for the given countries only.
+
+    Parameters:
+        countries (list[str]): Countries to keep (all countries if None).
+        columns (tuple[str]): Columns to read.
+        file_path (str): Workbook path; defaults to the configured data directory.
+
+    Returns:
+        pd.DataFrame: The requested columns for the matching countries.
+    """
+    file_path = file_path or data_path(HAPPINESS_WORKBOOK)
+    table = read_filtered_sheet(file_path, columns=list(columns), filter_column="Country name", filter_values=countries)
+    if "Country name" in table.columns:
+        table["Country name"] = table["Country name"].str.strip()
+    return table
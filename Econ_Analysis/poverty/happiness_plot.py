@@ -0,0 +1,81 @@
+import argparse
+
+from .excel_ingest import load_happiness_scores
+from .mpi_data import load_mpi_table
+
+# Define the three countries of interest, named as in the happiness workbook; the MPI
+# loader resolves such names through country_index.COUNTRY_ALIASES ("Laos" -> "Lao PDR").
+DEFAULT_COUNTRIES = ['Nepal', 'Bhutan', 'Laos']
+
+
+def _bar_chart(data, x, y, title, ylabel):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    sns.set(style="whitegrid")
+    plt.figure(figsize=(8, 6))
+    sns.barplot(data=data, x=x, y=y, hue=x, palette='Set2', legend=False)
+    plt.title(title, fontsize=16)
+    plt.xlabel('Country', fontsize=14)
+    plt.ylabel(ylabel, fontsize=14)
+    plt.xticks(fontsize=12)
+    plt.yticks(fontsize=12)
+    plt.tight_layout()
+    plt.show()
+
+
+def plot_mpi(countries=DEFAULT_COUNTRIES, file_path=None):
+    """
+    Prints the MPI indicators of the given countries and plots their MPI as bars.
+
+    Parameters:
+        countries (list[str]): Countries to show, named as in the MPI workbook, an alias
+            from country_index.COUNTRY_ALIASES or ISO3 codes.
+        file_path (str): MPI workbook; defaults to the configured data directory.
+    """
+    # Load these countries from the MPI workbook. The workbook location comes from
+    # the ECON_DATA_DIR environment variable (defaults to this directory). The cleaned
+    # table is cached whole next to the workbook and filtered after reading; only
+    # with use_cache=False is the filter pushed down into the streaming sheet read.
+    filtered_data = load_mpi_table(file_path, countries=countries)
+
+    # For demonstration purposes, display all MPI-related indicators.
+    print("MPI and related indicators for selected countries:")
+    print(filtered_data.to_string(index=False))
+
+    # The loader maps the "Multidimensional Poverty Index (MPI = H*A)" column to "MPI".
+    mpi_col = 'MPI'
+    _bar_chart(filtered_data, 'Country', mpi_col, f"MPI Indicator for {', '.join(countries)} (2024)", mpi_col)
+
+
+def plot_ladder_scores(countries=DEFAULT_COUNTRIES, file_path=None):
+    """
+    Prints the World Happiness Report ladder scores of the given countries and plots them as bars.
+
+    Parameters:
+        countries (list[str]): Countries to show, named as in the happiness workbook.
+        file_path (str): Happiness workbook; defaults to the configured data directory.
+    """
+    # Only the two columns used below are read, and only for the matching countries
+    filtered_data = load_happiness_scores(countries, file_path=file_path)
+    print(filtered_data.to_string(index=False))
+
+    _bar_chart(filtered_data, 'Country name', 'Ladder score',
+               f"Happiness Score for {', '.join(countries)} (2024)", 'Ladder Score')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bar charts of MPI or happiness ladder scores for a few countries.")
+    parser.add_argument("--indicator", choices=["mpi", "ladder"], default="mpi")
+    parser.add_argument("--countries", nargs="+", default=DEFAULT_COUNTRIES)
+    parser.add_argument("--file", default=None, help="Workbook (default: $ECON_DATA_DIR or this directory)")
+    args = parser.parse_args(argv)
+
+    if args.indicator == "ladder":
+        plot_ladder_scores(args.countries, args.file)
+    else:
+        plot_mpi(args.countries, args.file)
+
+
+if __name__ == "__main__":
+    main()
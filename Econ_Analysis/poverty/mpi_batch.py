@@ -0,0 +1,117 @@
+import argparse
+import os
+import re
+
+from .._plotting import headless_pyplot
+from .mpi_charts import dimension_matrix, draw_dimension_bars, draw_overall_mpi, draw_radar, radar_figure
+from .mpi_data import load_mpi_table
+
+
+def _slug(text):
+    return re.sub(r"[^a-z0-9]+", "_", str(text).lower()).strip("_")
+
+
+def country_groups(table, group_by="Region", max_countries=8):
+    """
+    Splits the MPI table into chart-sized groups of countries.
+
+    Parameters:
+        table (pd.DataFrame): Cleaned MPI table.
+        group_by (str): Column to group on (e.g. "Region"); None puts every country in one group.
+        max_countries (int): Maximum countries per chart; larger groups are split in order of MPI.
+
+    Returns:
+        dict[str, list[str]]: Country names per group name.
+    """
+    table = table.dropna(subset=["MPI"]).sort_values("MPI")
+    grouped = table.groupby(group_by, sort=True) if group_by else [("all", table)]
+    groups = {}
+    for name, frame in grouped:
+        names = frame["Country"].tolist()
+        parts = [names[start:start + max_countries] for start in range(0, len(names), max_countries)]
+        for part_number, part in enumerate(parts, start=1):
+            key = name if len(parts) == 1 else f"{name} ({part_number})"
+            groups[key] = part
+    return groups
+
+
+def render_mpi_groups(table, groups, output_dir="mpi_charts", formats=("png",), html=True,
+                      include_plotlyjs="directory", figsize=(10, 6), dpi=100):
+    """
+    Renders the overall-MPI, grouped-dimension and radar charts for many country groups.
+
+    Static charts reuse one Agg figure. Radar charts are also written as Plotly HTML
+    files that all reference a single shared plotly.js bundle: with "directory" one
+    plotly.min.js is written next to the HTML files, with "cdn" the pages load it
+    from the CDN; either way it is not inlined into every file.
+
+    Parameters:
+        table (pd.DataFrame): Cleaned MPI table.
+        groups (dict[str, list[str]]): Country names per group (see country_groups).
+        output_dir (str): Directory for the rendered files.
+        formats (tuple[str]): Static image formats, e.g. ("png", "svg").
+        html (bool): Also write interactive radar charts as HTML.
+        include_plotlyjs (str): "directory" or "cdn".
+        figsize (tuple[float, float]): Figure size in inches.
+        dpi (int): Resolution for raster formats.
+
+    Returns:
+        list[str]: Paths of the written files.
+    """
+    plt = headless_pyplot()
+    os.makedirs(output_dir, exist_ok=True)
+    indexed = table.set_index("Country")
+    fig = plt.figure(figsize=figsize, dpi=dpi)
+    written = []
+
+    def save(stem):
+        for fmt in formats:
+            path = os.path.join(output_dir, f"{stem}.{fmt}")
+            fig.savefig(path, format=fmt, bbox_inches="tight")
+            written.append(path)
+
+    for group, countries in groups.items():
+        slug = _slug(group)
+        matrix, names, dimensions = dimension_matrix(table, countries)
+
+        fig.clf()
+        draw_overall_mpi(fig.add_subplot(), names, indexed.loc[names, "MPI"].to_numpy())
+        save(f"{slug}_overall_mpi")
+
+        fig.clf()
+        draw_dimension_bars(fig.add_subplot(), matrix, names, dimensions)
+        save(f"{slug}_dimensions")
+
+        fig.clf()
+        draw_radar(fig.add_subplot(projection="polar"), matrix, names, dimensions)
+        save(f"{slug}_radar")
+
+        if html:
+            path = os.path.join(output_dir, f"{slug}_radar.html")
+            radar_figure(matrix, names, dimensions).write_html(path, include_plotlyjs=include_plotlyjs, full_html=True)
+            written.append(path)
+
+    plt.close(fig)
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render MPI charts for groups of countries without a display.")
+    parser.add_argument("--file", default=None, help="MPI workbook (default: $ECON_DATA_DIR or this directory)")
+    parser.add_argument("--group-by", default="Region", help="Column to group countries on, or 'none'")
+    parser.add_argument("--max-countries", type=int, default=8)
+    parser.add_argument("--output-dir", default="mpi_charts")
+    parser.add_argument("--formats", nargs="+", default=["png"], help="e.g. png svg")
+    parser.add_argument("--no-html", action="store_true", help="Skip the interactive radar HTML files")
+    parser.add_argument("--plotlyjs", choices=["directory", "cdn"], default="directory")
+    args = parser.parse_args(argv)
+
+    table = load_mpi_table(args.file)
+    group_by = None if args.group_by.lower() == "none" else args.group_by
+    groups = country_groups(table, group_by, args.max_countries)
+    written = render_mpi_groups(table, groups, args.output_dir, args.formats, not args.no_html, args.plotlyjs)
+    print(f"Rendered {len(written)} files for {len(groups)} groups into {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
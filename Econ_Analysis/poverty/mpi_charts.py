@@ -0,0 +1,107 @@
+import numpy as np
+
+# Poverty dimensions compared across countries, in display order
+DIMENSIONS = ["H", "A", "Vulnerable", "Severe", "D", "DestituteProp"]
+
+BAR_COLORS = ["#4e79a7", "#f28e2b", "#76b7b2", "#e15759", "#59a14f", "#edc948", "#b07aa1", "#ff9da7", "#9c755f", "#bab0ac"]
+
+
+def dimension_matrix(table, countries=None, dimensions=DIMENSIONS):
+    """
+    Pivots the MPI dimensions once into a country x dimension matrix.
+
+    Parameters:
+        table (pd.DataFrame): Cleaned MPI table (see mpi_data.load_mpi_table).
+        countries (list[str]): Countries to include, in order (all rows if None).
+        dimensions (list[str]): Dimension columns to include (missing ones are skipped).
+
+    Returns:
+        tuple[np.ndarray, list[str], list[str]]: The matrix, its country names and dimension names.
+    """
+    dimensions = [dim for dim in dimensions if dim in table.columns]
+    if countries is not None:
+        table = table.set_index("Country").reindex(countries).dropna(how="all").reset_index()
+    matrix = table[dimensions].to_numpy(dtype="float64")
+    return matrix, table["Country"].tolist(), dimensions
+
+
+def bar_offsets(n_series, group_width=0.8):
+    """
+    Returns the bar width and the x offset of each series in a grouped bar chart.
+
+    Parameters:
+        n_series (int): Number of bars per group.
+        group_width (float): Total width taken by one group.
+
+    Returns:
+        tuple[float, np.ndarray]: Bar width and per-series offsets centered on 0.
+    """
+    width = group_width / max(n_series, 1)
+    offsets = (np.arange(n_series) - (n_series - 1) / 2) * width
+    return width, offsets
+
+
+def draw_overall_mpi(ax, countries, values):
+    """
+    Draws the overall MPI per country as annotated bars.
+    """
+    values = np.asarray(values, dtype="float64")
+    colors = [BAR_COLORS[i % len(BAR_COLORS)] for i in range(len(countries))]
+    bars = ax.bar(countries, values, color=colors)
+    ax.set_title("Overall MPI Comparison")
+    ax.set_ylabel("MPI Score")
+    ax.set_ylim(0, np.nanmax(values) * 1.2 if len(values) else 1)
+    for bar, value in zip(bars, values):
+        ax.text(bar.get_x() + bar.get_width() / 2.0, value + 0.01, f"{value:.3f}", ha="center", va="bottom")
+    if len(countries) > 5:
+        ax.tick_params(axis="x", labelrotation=45)
+
+
+def draw_dimension_bars(ax, matrix, countries, dimensions):
+    """
+    Draws a grouped bar chart of poverty dimensions for any number of countries.
+    """
+    x = np.arange(len(dimensions))
+    width, offsets = bar_offsets(len(countries))
+    for row, (country, offset) in enumerate(zip(countries, offsets)):
+        ax.bar(x + offset, matrix[row], width, label=country, color=BAR_COLORS[row % len(BAR_COLORS)])
+    ax.set_xticks(x, dimensions)
+    ax.set_ylabel("Score")
+    ax.set_title("Comparison of Poverty Dimensions by Country")
+    max_val = np.nanmax(matrix) if matrix.size else 0
+    ax.set_ylim(0, max_val * 1.2 if max_val else 1)
+    ax.legend(fontsize="small", ncol=2 if len(countries) > 6 else 1)
+
+
+def draw_radar(ax, matrix, countries, dimensions):
+    """
+    Draws the dimension profile of each country on a matplotlib polar Axes (static radar chart).
+    """
+    angles = np.linspace(0, 2 * np.pi, len(dimensions), endpoint=False)
+    closed = np.append(angles, angles[0])
+    for row, country in enumerate(countries):
+        values = np.append(matrix[row], matrix[row][0])
+        color = BAR_COLORS[row % len(BAR_COLORS)]
+        ax.plot(closed, values, color=color, label=country)
+        ax.fill(closed, values, color=color, alpha=0.15)
+    ax.set_xticks(angles, dimensions)
+    ax.set_title("Radar Chart of Poverty Dimensions")
+    ax.legend(loc="upper right", bbox_to_anchor=(1.3, 1.1), fontsize="small")
+
+
+def radar_figure(matrix, countries, dimensions):
+    """
+    Builds the interactive Plotly radar chart of poverty dimensions.
+    """
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    for row, country in enumerate(countries):
+        fig.add_trace(go.Scatterpolar(
+            r=np.append(matrix[row], matrix[row][0]),
+            theta=dimensions + dimensions[:1],
+            name=country,
+            fill="toself",
+        ))
+    fig.update_layout(title="Radar Chart of Poverty Dimensions")
+    return fig
@@ -0,0 +1,216 @@
+import itertools
+import os
+import re
+
+import pandas as pd
+
+from ..country_index import COUNTRY_ALIASES
+from ..world_bank_data import DEFAULT_CACHE_DIR, file_digest, write_feather_cache
+from .excel_ingest import MPI_WORKBOOK, data_path, iter_sheet_rows
+
+# Canonical column names, matched in order against each column's combined header
+# text (group header + sub-header + units, lower-cased, footnote marks removed).
+# The first pattern that matches wins, so more specific patterns come first.
+MPI_COLUMN_PATTERNS = [
+    ("ISO numeric", r"iso country numeric code"),
+    ("ISO", r"iso country code"),
+    ("Country", r"^country\b"),
+    ("Region", r"world region"),
+    ("Survey year", r"mpi data source .*year"),
+    ("Survey", r"mpi data source"),
+    ("MPI", r"multidimensional poverty index"),
+    ("H", r"headcount ratio: population in multidimensional poverty"),
+    ("Vulnerable", r"vulnerable to poverty"),
+    ("Severe", r"severe poverty"),
+    ("A", r"intensity of deprivation"),
+    ("D", r"destitution poverty"),
+    ("DestituteProp", r"proportion of (mpi )?poor who are destitute"),
+    ("Inequality", r"inequality among the poor"),
+    ("Poor survey year", r"number of mpi poor people .*year of the survey"),
+    ("Poor 2021", r"number of mpi poor people .*2021"),
+    ("Poor 2022", r"number of mpi poor people .*2022"),
+    ("Population survey year", r"total population .*year of the survey"),
+    ("Population 2021", r"total population .*2021"),
+    ("Population 2022", r"total population .*2022"),
+    ("Indicators missing", r"indicator ?\(s\) missing"),
+    ("Indicators included", r"total number of indicators"),
+]
+_COMPILED_PATTERNS = [(name, re.compile(pattern)) for name, pattern in MPI_COLUMN_PATTERNS]
+
+TEXT_COLUMNS = ["ISO", "Country", "Region", "Survey", "Survey year", "Indicators missing"]
+
+_FOOTNOTE_MARKS = re.compile(r"[¹²³⁴⁵⁶⁷⁸⁹⁰*]")
+_WHITESPACE = re.compile(r"\s+")
+
+def find_header_row(raw, keyword="country", max_rows=30):
+    """
+    Finds the header row with a vectorized scan of the first rows of a sheet.
+
+    Parameters:
+        raw (pd.DataFrame): Sheet read with header=None.
+        keyword (str): Cell text (case-insensitive, exact) marking the header row.
+        max_rows (int): Number of leading rows to scan.
+
+    Returns:
+        int: Positional index of the header row.
+    """
+    head = raw.iloc[:max_rows]
+    hits = head.apply(lambda col: col.astype(str).str.strip().str.lower().eq(keyword)).any(axis=1)
+    if not hits.any():
+        raise ValueError(f"Could not find a header cell '{keyword}' in the first {max_rows} rows.")
+    return int(hits.to_numpy().argmax())
+
+
+def resolve_column_name(label):
+    """
+    Maps one combined header label onto its canonical MPI column name (None if unknown).
+    """
+    for name, pattern in _COMPILED_PATTERNS:
+        if pattern.search(label):
+            return name
+    return None
+
+
+def _mpi_layout(head, max_header_rows=30):
+    # Locates the header block in the leading rows and resolves the kept columns
+    header_row = find_header_row(head, "country", max_header_rows)
+
+    # Data rows start at the first row below the header with a 3-letter ISO code in column 1
+    below = head.iloc[header_row + 1:]
+    is_data = below.iloc[:, 1].astype(str).str.fullmatch(r"[A-Z]{3}")
+    if not is_data.any():
+        raise ValueError(f"No data rows found within the first {max_header_rows} rows.")
+    data_start = header_row + 1 + int(is_data.to_numpy().argmax())
+
+    header_block = head.iloc[header_row:data_start].copy()
+    header_block.iloc[0] = header_block.iloc[0].ffill()
+    labels = header_block.apply(lambda col: " ".join(str(cell) for cell in col.dropna()))
+    labels = labels.map(lambda label: _WHITESPACE.sub(" ", _FOOTNOTE_MARKS.sub("", label)).strip().lower())
+
+    names = [resolve_column_name(label) for label in labels]
+    keep = [pos for pos, name in enumerate(names) if name is not None]
+    return data_start, keep, [names[pos] for pos in keep]
+
+
+def _type_mpi_table(table):
+    table = table[table["ISO"].astype(str).str.fullmatch(r"[A-Z]{3}")].reset_index(drop=True)
+    for col in table.columns:
+        if col in TEXT_COLUMNS:
+            table[col] = table[col].astype("string").str.strip()
+        else:
+            # Suppressed values are reported as "...*" and become NaN
+            table[col] = pd.to_numeric(table[col], errors="coerce")
+    return table
+
+
+def _country_keys(countries):
+    # Names as given, plus ISO3 codes for aliases ("Laos" -> LAO for "Lao PDR") and codes passed directly
+    names = {str(country).strip() for country in countries}
+    codes = {COUNTRY_ALIASES.get(name.lower(), name.upper()) for name in names}
+    return names, codes
+
+
+def select_countries(table, countries):
+    """
+    Selects the rows of the requested countries, in the requested order.
+
+    Names are matched against the "Country" column and, through
+    country_index.COUNTRY_ALIASES or as ISO3 codes, against the "ISO" column, so
+    "Laos" finds the workbook's "Lao PDR". Names without a row are reported.
+
+    Parameters:
+        table (pd.DataFrame): Cleaned MPI table (see load_mpi_table).
+        countries (list[str]): Country names, aliases or ISO3 codes.
+
+    Returns:
+        pd.DataFrame: One row per matched country.
+    """
+    by_name = {name: pos for pos, name in enumerate(table["Country"].astype(str).str.strip())}
+    by_code = {code: pos for pos, code in enumerate(table["ISO"].astype(str))}
+    positions = []
+    for country in countries:
+        name = str(country).strip()
+        pos = by_name.get(name, by_code.get(COUNTRY_ALIASES.get(name.lower(), name.upper())))
+        if pos is None:
+            print(f"No MPI data found for country: {country}")
+        elif pos not in positions:
+            positions.append(pos)
+    return table.iloc[positions].reset_index(drop=True)
+
+
+def read_mpi_workbook(file_path, sheet_name=0, countries=None, max_header_rows=30):
+    """
+    Streams the MPI sheet with a read-only engine and cleans it, keeping only the wanted countries.
+
+    The sheet has a group header row (merged cells), a sub-header row and unit
+    rows before the data. Group headers are carried across their merged span and
+    combined with the rows below them into one label per column, which is then
+    resolved through MPI_COLUMN_PATTERNS.
+
+    Parameters:
+        file_path (str): Path to the UNDP/OPHI MPI workbook.
+        sheet_name (int | str): Sheet holding the national results.
+        countries (list[str]): Country names (as in the workbook or in COUNTRY_ALIASES)
+            or ISO3 codes to keep (all countries if None).
+        max_header_rows (int): Number of leading rows scanned for the header.
+
+    Returns:
+        pd.DataFrame: The cleaned table for the requested countries.
+    """
+    rows = iter_sheet_rows(file_path, sheet_name)
+    head_rows = list(itertools.islice(rows, max_header_rows))
+    head = pd.DataFrame(head_rows)
+    data_start, keep, names = _mpi_layout(head, max_header_rows)
+    country_pos, iso_pos = keep[names.index("Country")], keep[names.index("ISO")]
+
+    wanted_names, wanted_codes = (None, None) if countries is None else _country_keys(countries)
+    records = []
+    for row in itertools.chain(head_rows[data_start:], rows):
+        if wanted_names is not None:
+            country = str(row[country_pos]).strip() if country_pos < len(row) else None
+            code = str(row[iso_pos]).strip() if iso_pos < len(row) else None
+            if country not in wanted_names and code not in wanted_codes:
+                continue
+        records.append([row[pos] if pos < len(row) else None for pos in keep])
+    table = _type_mpi_table(pd.DataFrame(records, columns=names))
+    return table if countries is None else select_countries(table, countries)
+
+
+def load_mpi_table(file_path=None, sheet_name=0, countries=None, cache_dir=None, use_cache=True):
+    """
+    Loads the cleaned national MPI results table, cached as Feather keyed on the workbook hash.
+
+    Parameters:
+        file_path (str): Path to the UNDP/OPHI MPI workbook (defaults to the configured data directory).
+        sheet_name (int | str): Sheet holding the national results.
+        countries (list[str]): Country names (as in the workbook or in COUNTRY_ALIASES)
+            or ISO3 codes to keep, in this order (all countries if None); names without data
+            are reported (see select_countries).
+        cache_dir (str): Cache directory (defaults to ".cache" next to the workbook).
+        use_cache (bool): Set to False to always parse the workbook.
+
+    Returns:
+        pd.DataFrame: One row per country with canonical column names (see MPI_COLUMN_PATTERNS).
+    """
+    file_path = file_path or data_path(MPI_WORKBOOK)
+    try:
+        from pyarrow import feather
+    except ImportError:
+        feather = None
+
+    if not use_cache or feather is None:
+        # Without a cache the country filter is pushed down into the streaming read
+        return read_mpi_workbook(file_path, sheet_name, countries)
+
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(os.path.abspath(file_path)), DEFAULT_CACHE_DIR)
+    stem = os.path.splitext(os.path.basename(file_path))[0]
+    cache_path = os.path.join(cache_dir, f"{stem}.{file_digest(file_path)}.sheet{sheet_name}.feather")
+    if os.path.exists(cache_path):
+        table = feather.read_table(cache_path, memory_map=True).to_pandas()
+    else:
+        table = read_mpi_workbook(file_path, sheet_name)
+        os.makedirs(cache_dir, exist_ok=True)
+        write_feather_cache(table, cache_path)
+
+    return table if countries is None else select_countries(table, countries)
@@ -0,0 +1,88 @@
+import argparse
+
+from ..pipeline_timing import report_if_enabled, stage
+from .mpi_charts import dimension_matrix, draw_dimension_bars, draw_overall_mpi, radar_figure
+from .mpi_data import load_mpi_table, select_countries
+
+# Any number of countries works; names follow the workbook ("Lao PDR"), but aliases
+# such as "Laos" and ISO3 codes resolve as well (see mpi_data.select_countries).
+# For whole regions at once, see mpi_batch.py.
+DEFAULT_COUNTRIES = ["Nepal", "Lao PDR", "Bhutan"]
+
+
+def plot_mpi_comparison(df, countries_of_interest=DEFAULT_COUNTRIES):
+    """
+    Shows the overall-MPI bars, the grouped dimension bars and the radar chart for a few countries.
+
+    Parameters:
+        df (pd.DataFrame): Cleaned MPI table (see mpi_data.load_mpi_table).
+        countries_of_interest (list[str]): Countries to compare, in display order (workbook
+            names, aliases or ISO3 codes).
+    """
+    import matplotlib.pyplot as plt
+
+    # -----------------------------
+    # STEP 5: Filter for the countries of interest
+    # -----------------------------
+    with stage('filter'):
+        df_filtered = select_countries(df, countries_of_interest)
+
+        # Numeric columns are already typed by the loader
+        df_filtered.dropna(subset=["MPI"], inplace=True)
+
+        # Country x dimension matrix (workbook names, in the requested order), pivoted
+        # once and shared by the plots below
+        matrix, countries, dimensions = dimension_matrix(df_filtered, df_filtered["Country"].tolist())
+
+    # -----------------------------
+    # STEP 6: Plot 1 – Overall MPI
+    # -----------------------------
+    overall_mpi = df_filtered.set_index("Country").loc[countries, "MPI"]
+
+    with stage('render'):
+        fig, ax = plt.subplots(figsize=(8, 6))
+        draw_overall_mpi(ax, countries, overall_mpi.to_numpy())
+        plt.tight_layout()
+        plt.show()
+
+    # -----------------------------
+    # STEP 7: Plot 2 – Grouped Bar
+    # -----------------------------
+    # Dimensions compared: H, A, Vulnerable, Severe, D, DestituteProp
+    with stage('render'):
+        fig, ax = plt.subplots(figsize=(10, 6))
+        draw_dimension_bars(ax, matrix, countries, dimensions)
+        plt.tight_layout()
+        plt.show()
+
+    # -----------------------------
+    # STEP 8: Plot 3 – Radar Chart
+    # -----------------------------
+    with stage('render'):
+        fig = radar_figure(matrix, countries, dimensions)
+        fig.show()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare MPI and its dimensions for a few countries.")
+    parser.add_argument("--file", default=None, help="MPI workbook (default: $ECON_DATA_DIR or this directory)")
+    parser.add_argument("--sheet", default=0, help="Sheet index or name")
+    parser.add_argument("--countries", nargs="+", default=DEFAULT_COUNTRIES)
+    args = parser.parse_args(argv)
+
+    # -----------------------------
+    # STEP 1-4: Load the cleaned MPI table
+    # -----------------------------
+    # Header detection and column renaming happen in mpi_data.load_mpi_table; the
+    # cleaned, typed table is cached next to the workbook until the workbook changes.
+    # Columns: Country, ISO, Region, MPI, H, A, Vulnerable, Severe, D, DestituteProp, ...
+    # Run with ECON_TIMING=1 to print how long each stage took.
+    sheet_name = int(args.sheet) if str(args.sheet).isdigit() else args.sheet
+    with stage('load'):
+        df = load_mpi_table(args.file, sheet_name=sheet_name)
+    plot_mpi_comparison(df, args.countries)
+    report_if_enabled()
+
+
+if __name__ == "__main__":
+    main()
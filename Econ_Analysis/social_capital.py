@@ -1,54 +1,75 @@
-import networkx as nx
-import matplotlib.pyplot as plt
-import random
-
-# 1. Create two highly connected clusters (cliques)
-G = nx.Graph()
-
-# Cluster 1: Nodes 1-10
-cluster1_nodes = range(1, 11)
-G.add_nodes_from(cluster1_nodes)
-for i in cluster1_nodes:
-    for j in cluster1_nodes:
-        if i != j:
-            G.add_edge(i, j)  # Fully connected within cluster 1
-
-# Cluster 2: Nodes 11-20
-cluster2_nodes = range(11, 21)
-G.add_nodes_from(cluster2_nodes)
-for i in cluster2_nodes:
-    for j in cluster2_nodes:
-        if i != j:
-            G.add_edge(i, j)  # Fully connected within cluster 2
-
-# 2. Create a weak connection between the clusters (a single, thin edge)
-# Randomly select one node from each cluster to connect
-node_from_cluster1 = random.choice(list(cluster1_nodes))
-node_from_cluster2 = random.choice(list(cluster2_nodes))
-G.add_edge(node_from_cluster1, node_from_cluster2, weight=0.1) # add weight for visualizing the edge
-
-# 3. Visualize the graph
-pos = nx.spring_layout(G, seed=42)  # Seed for reproducibility
-
-# Draw nodes
-nx.draw_networkx_nodes(G, pos, nodelist=cluster1_nodes, node_color="skyblue", label="Cluster 1")
-nx.draw_networkx_nodes(G, pos, nodelist=cluster2_nodes, node_color="lightgreen", label="Cluster 2")
-
-# Draw edges, making the weak connection thinner
-edges = G.edges()
-weights = [G[u][v]['weight'] if 'weight' in G[u][v] else 1 for u, v in edges] # default weight is 1 if not specified
-
-nx.draw_networkx_edges(G, pos, edgelist=edges, width=weights)
-
-# Draw labels (optional)
-#nx.draw_networkx_labels(G, pos, font_size=8)
-
-#Add Legend
-plt.legend(loc='upper left')
-
-# Customize plot
-plt.title("Two Highly Connected Clusters with a Weak Link")
-plt.axis("off")  # Turn off axis labels
-
-# 4. Display the plot
-plt.show()
\ No newline at end of file
+import argparse
+
+from ._plotting import headless_pyplot
+from .pipeline_timing import report_if_enabled, stage
+from .social_network import generate_clustered_network
+from .social_network_charts import cluster_layout, draw_network, spring_positions
+from .social_network_metrics import cluster_metrics, edge_betweenness, node_metrics
+
+# Above this many nodes the force-directed NetworkX layout is replaced by the cluster block layout
+SPRING_LAYOUT_MAX_NODES = 2000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Draw highly connected clusters joined by weak links.")
+    parser.add_argument("--clusters", type=int, default=2, help="Number of clusters")
+    parser.add_argument("--size", type=int, default=10, help="Nodes per cluster")
+    parser.add_argument("--p-intra", type=float, default=1.0, help="Edge probability within a cluster")
+    parser.add_argument("--bridge-weight", type=float, default=0.1)
+    parser.add_argument("--bridges", type=int, default=1, help="Weak links between neighbouring clusters")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--layout", choices=["auto", "spring", "cluster"], default="auto")
+    parser.add_argument("--max-intra-edges", type=int, default=100_000, help="Intra-cluster edges drawn at most")
+    parser.add_argument("--output", default=None, help="Save to this file instead of showing the plot")
+    parser.add_argument("--metrics", action="store_true", help="Print bonding and bridging measures")
+    parser.add_argument("--sources-per-cluster", type=int, default=None,
+                        help="Sample this many betweenness sources per cluster (exact if omitted)")
+    args = parser.parse_args(argv)
+
+    # 1. Create highly connected clusters (cliques) with a weak connection between neighbours.
+    # Run with ECON_TIMING=1 to print how long each stage took.
+    with stage('generate'):
+        network = generate_clustered_network([args.size] * args.clusters, p_intra=args.p_intra,
+                                             bridges_per_pair=args.bridges, bridge_weight=args.bridge_weight,
+                                             seed=args.seed)
+
+    if args.metrics:
+        with stage('metrics'):
+            clusters = cluster_metrics(network, node_metrics(network))
+            edges = edge_betweenness(network, args.sources_per_cluster)
+        print("Bonding and bridging per cluster:")
+        print(clusters.to_string(index=False, max_rows=20))
+        print("Edges with the highest betweenness (weak links should rank first):")
+        print(edges.head(10).to_string(index=False))
+
+    # 2. Visualize the graph, making the weak connections thinner
+    layout = args.layout
+    if layout == "auto":
+        layout = "spring" if network.n_nodes <= SPRING_LAYOUT_MAX_NODES else "cluster"
+    with stage('layout'):
+        positions = spring_positions(network, seed=42) if layout == "spring" else cluster_layout(network)
+
+    if args.output:
+        plt = headless_pyplot()
+    else:
+        import matplotlib.pyplot as plt
+    with stage('render'):
+        fig, ax = plt.subplots(figsize=(8, 8) if network.n_nodes > SPRING_LAYOUT_MAX_NODES else None)
+        draw_network(ax, network, positions, max_intra_edges=args.max_intra_edges)
+        if args.clusters == 2:
+            ax.set_title("Two Highly Connected Clusters with a Weak Link")
+        else:
+            ax.set_title(f"{args.clusters} Highly Connected Clusters with Weak Links")
+
+    # 3. Display or save the plot
+    if args.output:
+        with stage('save'):
+            fig.savefig(args.output, dpi=150, bbox_inches="tight")
+        print(f"Saved {network.n_nodes} nodes and {network.n_edges} edges to {args.output}")
+    else:
+        plt.show()
+    report_if_enabled()
+
+
+if __name__ == "__main__":
+    main()
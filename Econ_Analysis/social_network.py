@@ -0,0 +1,193 @@
+import numpy as np
+
+
+def _pair_index_to_nodes(index, n):
+    # Maps linear indices over the upper triangle (i < j, row-major) of an n x n matrix to (i, j)
+    index = np.asarray(index, dtype="int64")
+    i = n - 2 - np.floor(np.sqrt(-8 * index + 4 * n * (n - 1) - 7) / 2.0 - 0.5).astype("int64")
+    j = index + i + 1 - n * (n - 1) // 2 + (n - i) * ((n - i) - 1) // 2
+    return i, j
+
+
+def _sample_pairs(rng, n, p):
+    # Samples each of the n * (n - 1) / 2 undirected pairs independently with probability p
+    n_pairs = n * (n - 1) // 2
+    if n_pairs == 0 or p <= 0:
+        return np.empty(0, dtype="int64"), np.empty(0, dtype="int64")
+    if p >= 1:
+        i, j = np.triu_indices(n, k=1)
+        return i.astype("int64"), j.astype("int64")
+    k = rng.binomial(n_pairs, p)
+    return _pair_index_to_nodes(rng.choice(n_pairs, size=k, replace=False), n)
+
+
+class ClusteredNetwork:
+    """
+    Undirected, weighted network of communities stored as NumPy edge arrays.
+
+    Each undirected edge appears once (src < dst is not required). Use
+    to_networkx() for analysis and drawing on small graphs, or to_sparse() to
+    work on large graphs without building a NetworkX object.
+
+    Parameters:
+        src (np.ndarray): Source node of each edge.
+        dst (np.ndarray): Target node of each edge.
+        weight (np.ndarray): Weight of each edge.
+        cluster (np.ndarray): Cluster label of each node (node ids are 0..n_nodes-1).
+        kind (np.ndarray): Edge type per edge: 0 intra-cluster, 1 inter-cluster, 2 bridge.
+    """
+
+    INTRA, INTER, BRIDGE = 0, 1, 2
+
+    def __init__(self, src, dst, weight, cluster, kind):
+        self.src = src
+        self.dst = dst
+        self.weight = weight
+        self.cluster = cluster
+        self.kind = kind
+
+    @property
+    def n_nodes(self):
+        return len(self.cluster)
+
+    @property
+    def n_edges(self):
+        return len(self.src)
+
+    def to_networkx(self, node_offset=0):
+        """
+        Bulk-loads the network into a networkx.Graph.
+
+        Parameters:
+            node_offset (int): Added to every node id (e.g. 1 for 1-based labels).
+
+        Returns:
+            nx.Graph: Graph with a "cluster" node attribute and a "weight" edge attribute.
+        """
+        import networkx as nx
+
+        G = nx.Graph()
+        nodes = np.arange(self.n_nodes) + node_offset
+        G.add_nodes_from((int(node), {"cluster": int(label)}) for node, label in zip(nodes, self.cluster))
+        G.add_weighted_edges_from(zip((self.src + node_offset).tolist(), (self.dst + node_offset).tolist(),
+                                      self.weight.tolist()))
+        return G
+
+    def to_sparse(self):
+        """
+        Returns the symmetric weighted adjacency matrix as a scipy.sparse CSR matrix.
+        """
+        from scipy import sparse
+
+        rows = np.concatenate([self.src, self.dst])
+        cols = np.concatenate([self.dst, self.src])
+        data = np.concatenate([self.weight, self.weight])
+        return sparse.csr_matrix((data, (rows, cols)), shape=(self.n_nodes, self.n_nodes))
+
+
+def _ranked_members(cluster, src, dst, rng, periphery=False):
+    # Nodes grouped by cluster, each cluster ordered by intra-cluster degree so its hub (or, with
+    # periphery, its least connected member) comes last; ties are broken at random and
+    # background links to other clusters are not counted
+    intra = cluster[src] == cluster[dst]
+    degree = np.bincount(np.concatenate([src[intra], dst[intra]]), minlength=len(cluster)).astype("float64")
+    key = (-degree if periphery else degree) + rng.random(len(cluster)) * 0.5
+    return np.lexsort((key, cluster))
+
+
+def _drop_duplicate_edges(src, dst, kind):
+    # Keeps the first copy of every undirected pair, so earlier (bonding) ties win over bridges
+    low, high = np.minimum(src, dst), np.maximum(src, dst)
+    _, first = np.unique(low * (int(high.max(initial=0)) + 1) + high, return_index=True)
+    keep = np.sort(first)
+    return src[keep], dst[keep], kind[keep]
+
+
+def generate_clustered_network(cluster_sizes, p_intra=1.0, p_inter=0.0, bridges_per_pair=1,
+                               bridge_layout="chain", intra_weight=1.0, inter_weight=1.0,
+                               bridge_weight=0.1, bridge_endpoints="random", seed=None):
+    """
+    Generates communities with dense internal ties (bonding) and weak bridges between them (bridging).
+
+    Edges are built as NumPy arrays: complete clusters come from triangular
+    index arithmetic, sparser clusters from sampling pair indices, so nothing
+    loops over node pairs in Python and no edge is generated twice.
+
+    Parameters:
+        cluster_sizes (list[int]): Size of every cluster, e.g. [10, 10] or [50] * 1000.
+        p_intra (float): Probability of an edge between two nodes of the same cluster.
+        p_inter (float): Probability of a (background) edge between nodes of different clusters.
+        bridges_per_pair (int): Weak links added between each bridged pair of clusters; links
+            that repeat an existing pair are dropped, so small clusters may get fewer.
+        bridge_layout (str): "chain" bridges cluster c to c + 1, "ring" also closes the loop,
+            "random" bridges each cluster to one random other cluster.
+        intra_weight (float): Weight of intra-cluster edges.
+        inter_weight (float): Weight of background inter-cluster edges.
+        bridge_weight (float): Weight of bridge edges.
+        bridge_endpoints (str): Which members a bridge connects: "random" members,
+            each cluster's "hub" (highest intra-cluster degree) or its "periphery" (lowest);
+            further bridges of a pair use the next-ranked members.
+        seed (int | np.random.Generator): Seed or generator for reproducible networks.
+
+    Returns:
+        ClusteredNetwork: The generated network.
+    """
+    rng = np.random.default_rng(seed)
+    sizes = np.atleast_1d(np.asarray(cluster_sizes, dtype="int64"))
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    n_nodes = int(sizes.sum())
+    cluster = np.repeat(np.arange(len(sizes)), sizes)
+
+    src_parts, dst_parts, kind_parts = [], [], []
+
+    # Bonding ties: one vectorized draw per cluster
+    for start, size in zip(starts, sizes):
+        i, j = _sample_pairs(rng, int(size), p_intra)
+        src_parts.append(i + start)
+        dst_parts.append(j + start)
+        kind_parts.append(np.full(len(i), ClusteredNetwork.INTRA, dtype="int8"))
+
+    # Background ties between clusters: sample over all pairs, keep cross-cluster ones
+    if p_inter > 0 and len(sizes) > 1:
+        i, j = _sample_pairs(rng, n_nodes, p_inter)
+        cross = cluster[i] != cluster[j]
+        src_parts.append(i[cross])
+        dst_parts.append(j[cross])
+        kind_parts.append(np.full(int(cross.sum()), ClusteredNetwork.INTER, dtype="int8"))
+
+    # Bridging ties: weak links between members of paired clusters
+    if len(sizes) > 1 and bridges_per_pair > 0:
+        n_clusters = len(sizes)
+        if bridge_layout == "chain":
+            left = np.arange(n_clusters - 1)
+            right = left + 1
+        elif bridge_layout == "ring":
+            left = np.arange(n_clusters)
+            right = (left + 1) % n_clusters
+        elif bridge_layout == "random":
+            left = np.arange(n_clusters)
+            right = (left + rng.integers(1, n_clusters, size=n_clusters)) % n_clusters
+        else:
+            raise ValueError(f"Unknown bridge_layout: {bridge_layout}")
+        copy = np.tile(np.arange(bridges_per_pair), len(left))
+        left = np.repeat(left, bridges_per_pair)
+        right = np.repeat(right, bridges_per_pair)
+        if bridge_endpoints == "random":
+            src_parts.append(starts[left] + rng.integers(0, sizes[left]))
+            dst_parts.append(starts[right] + rng.integers(0, sizes[right]))
+        elif bridge_endpoints in ("hub", "periphery"):
+            # The k-th bridge of a pair joins the k-th ranked members, so copies are distinct edges
+            order = _ranked_members(cluster, np.concatenate(src_parts), np.concatenate(dst_parts), rng,
+                                    periphery=bridge_endpoints == "periphery")
+            src_parts.append(order[starts[left] + sizes[left] - 1 - copy % sizes[left]])
+            dst_parts.append(order[starts[right] + sizes[right] - 1 - copy % sizes[right]])
+        else:
+            raise ValueError(f"Unknown bridge_endpoints: {bridge_endpoints}")
+        kind_parts.append(np.full(len(left), ClusteredNetwork.BRIDGE, dtype="int8"))
+
+    src = np.concatenate(src_parts).astype("int64")
+    dst = np.concatenate(dst_parts).astype("int64")
+    src, dst, kind = _drop_duplicate_edges(src, dst, np.concatenate(kind_parts))
+    weight = np.select([kind == ClusteredNetwork.INTRA, kind == ClusteredNetwork.INTER],
+                       [intra_weight, inter_weight], default=bridge_weight).astype("float64")
+    return ClusteredNetwork(src, dst, weight, cluster, kind)
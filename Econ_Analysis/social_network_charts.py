@@ -0,0 +1,191 @@
+import numpy as np
+
+# Colours of the first clusters (matching the original two-cluster picture); larger graphs use CLUSTER_CMAP
+CLUSTER_COLORS = ["skyblue", "lightgreen", "salmon", "plum", "khaki", "lightgray", "peachpuff", "paleturquoise"]
+CLUSTER_CMAP = "tab20"  # must be a ListedColormap
+
+INTRA_EDGE_COLOR = (0.35, 0.35, 0.35)
+BRIDGE_EDGE_COLOR = (0.8, 0.1, 0.1)
+
+GOLDEN_ANGLE = np.pi * (3 - np.sqrt(5))
+
+
+# Layout and drawing helpers for networks built by social_network.generate_clustered_network.
+# Positions are (n_nodes, 2) arrays indexed by node id, so nothing iterates over nodes in Python.
+
+def spring_positions(network, seed=42):
+    """
+    Force-directed layout through NetworkX; only practical for small graphs.
+
+    Parameters:
+        network (ClusteredNetwork): Network to lay out.
+        seed (int): Seed for reproducibility.
+
+    Returns:
+        np.ndarray: Node positions of shape (n_nodes, 2).
+    """
+    import networkx as nx
+
+    pos = nx.spring_layout(network.to_networkx(), seed=seed)
+    return np.array([pos[node] for node in range(network.n_nodes)])
+
+
+def _cluster_centers(network, sizes, arrangement, seed):
+    n_clusters = len(sizes)
+    if arrangement == "spring":
+        import networkx as nx
+
+        # Quotient graph: one node per cluster, edge weights summed over the links between clusters
+        cross = network.cluster[network.src] != network.cluster[network.dst]
+        quotient = nx.Graph()
+        quotient.add_nodes_from(range(n_clusters))
+        quotient.add_weighted_edges_from(zip(network.cluster[network.src[cross]].tolist(),
+                                             network.cluster[network.dst[cross]].tolist(),
+                                             network.weight[cross].tolist()))
+        pos = nx.spring_layout(quotient, seed=seed, weight=None)
+        centers = np.array([pos[c] for c in range(n_clusters)])
+        if n_clusters > 1:
+            from scipy.spatial import cKDTree
+
+            nearest = cKDTree(centers).query(centers, k=2)[0][:, 1]
+            centers = centers / max(np.median(nearest), 1e-9)
+        return centers
+
+    # Grid in snake order so consecutive (chain-bridged) clusters stay next to each other
+    columns = int(np.ceil(np.sqrt(n_clusters)))
+    rows, cols = np.divmod(np.arange(n_clusters), columns)
+    cols = np.where(rows % 2 == 1, columns - 1 - cols, cols)
+    return np.column_stack([cols, -rows]).astype("float64")
+
+
+def cluster_layout(network, arrangement="auto", seed=42, fill=0.42):
+    """
+    Places every cluster as a compact disk (block) and arranges the disks in the plane.
+
+    Inside a cluster the nodes follow a sunflower pattern, which spreads them
+    evenly over the disk in O(n) without any force simulation. The disks are
+    arranged on a grid, or by a spring layout of the cluster-level graph when
+    there are few enough clusters for it to be quick.
+
+    Parameters:
+        network (ClusteredNetwork): Network to lay out.
+        arrangement (str): "grid", "spring" or "auto" (spring up to 500 clusters).
+        seed (int): Seed for the cluster arrangement and disk rotations.
+        fill (float): Radius of the largest disk relative to the spacing between clusters.
+
+    Returns:
+        np.ndarray: Node positions of shape (n_nodes, 2).
+    """
+    sizes = np.bincount(network.cluster)
+    if arrangement == "auto":
+        arrangement = "spring" if len(sizes) <= 500 else "grid"
+    centers = _cluster_centers(network, sizes, arrangement, seed)
+
+    # Rank of every node within its cluster
+    order = np.argsort(network.cluster, kind="stable")
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    rank = np.empty(network.n_nodes, dtype="int64")
+    rank[order] = np.arange(network.n_nodes) - np.repeat(starts, sizes)
+
+    rng = np.random.default_rng(seed)
+    rotation = rng.uniform(0, 2 * np.pi, len(sizes))
+    radius = fill * np.sqrt(sizes / max(sizes.max(), 1))
+
+    size = sizes[network.cluster]
+    r = radius[network.cluster] * np.sqrt((rank + 0.5) / size)
+    theta = rank * GOLDEN_ANGLE + rotation[network.cluster]
+    return centers[network.cluster] + np.column_stack([r * np.cos(theta), r * np.sin(theta)])
+
+
+def sample_edges(network, max_intra_edges=100_000, seed=0):
+    """
+    Selects the edges to draw: every bridging edge and at most max_intra_edges bonding edges.
+
+    Intra-cluster edges are downsampled uniformly, so each cluster keeps its share
+    and dense clusters still look dense; bridges and background inter-cluster
+    links are always kept because they carry the structure of interest.
+
+    Parameters:
+        network (ClusteredNetwork): Network whose edges are drawn.
+        max_intra_edges (int): Maximum number of intra-cluster edges (None keeps all).
+        seed (int): Seed for the sample.
+
+    Returns:
+        np.ndarray: Boolean mask over the network's edges.
+    """
+    intra = network.kind == network.INTRA
+    keep = ~intra
+    intra_positions = np.flatnonzero(intra)
+    if max_intra_edges is None or len(intra_positions) <= max_intra_edges:
+        keep |= intra
+    else:
+        rng = np.random.default_rng(seed)
+        keep[rng.choice(intra_positions, size=max_intra_edges, replace=False)] = True
+    return keep
+
+
+def _cluster_colors(n_clusters):
+    from matplotlib import colormaps
+    from matplotlib.colors import ListedColormap
+
+    # Few clusters get the named colours; many clusters cycle through a qualitative colormap
+    if n_clusters <= len(CLUSTER_COLORS):
+        return ListedColormap(CLUSTER_COLORS[:n_clusters])
+    return ListedColormap(colormaps[CLUSTER_CMAP].colors)
+
+
+def draw_network(ax, network, positions, max_intra_edges=100_000, width_scale=1.0, min_width=0.1,
+                 node_size=None, legend=None, seed=0):
+    """
+    Draws a clustered network with all edges in one LineCollection and all nodes in one scatter.
+
+    Edge widths are the edge weights times width_scale (so weak links are thinner),
+    computed as one array. Large collections are rasterized so vector output stays small.
+
+    Parameters:
+        ax (matplotlib.axes.Axes): Axes to draw on.
+        network (ClusteredNetwork): Network to draw.
+        positions (np.ndarray): Node positions of shape (n_nodes, 2).
+        max_intra_edges (int): Intra-cluster edges to draw at most (see sample_edges).
+        width_scale (float): Line width of an edge with weight 1.
+        min_width (float): Lower bound on drawn line widths.
+        node_size (float): Marker size; scaled down with the number of nodes if None.
+        legend (bool): Label each cluster in a legend (default: only for up to 10 clusters).
+        seed (int): Seed for the edge sample.
+
+    Returns:
+        tuple[LineCollection, PathCollection]: The edge and node artists.
+    """
+    from matplotlib.collections import LineCollection
+
+    keep = sample_edges(network, max_intra_edges, seed)
+    src, dst = network.src[keep], network.dst[keep]
+    segments = np.stack([positions[src], positions[dst]], axis=1)
+    widths = np.maximum(network.weight[keep] * width_scale, min_width)
+
+    colors = np.empty((len(src), 4))
+    colors[:] = (*INTRA_EDGE_COLOR, 1.0 if network.n_nodes <= 1000 else 0.3)
+    colors[network.kind[keep] != network.INTRA] = (*BRIDGE_EDGE_COLOR, 1.0)
+
+    large = network.n_nodes > 1000
+    edges = LineCollection(segments, linewidths=widths, colors=colors, zorder=1, rasterized=large)
+    ax.add_collection(edges)
+
+    n_clusters = int(network.cluster.max()) + 1 if network.n_nodes else 0
+    if node_size is None:
+        # Roughly half of an 8 inch square figure shared among the nodes (in points^2)
+        node_size = float(np.clip(90000 / max(network.n_nodes, 1), 0.5, 300))
+    cmap = _cluster_colors(n_clusters)
+    nodes = ax.scatter(positions[:, 0], positions[:, 1], c=network.cluster % cmap.N, cmap=cmap,
+                       vmin=-0.5, vmax=cmap.N - 0.5, s=node_size, linewidths=0, zorder=2, rasterized=large)
+
+    if legend is None:
+        legend = n_clusters <= 10
+    if legend and n_clusters:
+        handles, _ = nodes.legend_elements()
+        ax.legend(handles, [f"Cluster {c + 1}" for c in range(n_clusters)], loc="upper left")
+
+    ax.autoscale_view()
+    ax.set_aspect("equal")
+    ax.axis("off")
+    return edges, nodes
@@ -0,0 +1,253 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.sparse import csgraph
+
+# Sources per shortest-path batch; bounds the (batch x n_nodes) distance matrix held by a worker
+BETWEENNESS_BATCH = 32
+
+# Per-process state: the binary adjacency in CSR form and its directed edge arrays
+_worker = {}
+
+
+def binary_adjacency(network):
+    """
+    Returns the symmetric 0/1 adjacency of a network, with parallel edges merged.
+
+    Parameters:
+        network (ClusteredNetwork): Network as built by social_network.generate_clustered_network.
+
+    Returns:
+        sparse.csr_matrix: Adjacency with one stored entry per neighbour pair.
+    """
+    adjacency = network.to_sparse()
+    adjacency.sum_duplicates()
+    adjacency.data[:] = 1.0
+    return adjacency
+
+
+def node_metrics(network):
+    """
+    Computes bonding and brokerage measures for every node with sparse-matrix products.
+
+    Clustering and effective size treat ties as binary; Burt's constraint uses
+    the edge weights to compute each node's proportional tie strengths.
+
+    Parameters:
+        network (ClusteredNetwork): Network to measure.
+
+    Returns:
+        pd.DataFrame: One row per node with node, cluster, degree, strength, triangles,
+        clustering, effective_size and constraint.
+    """
+    adjacency = binary_adjacency(network)
+    weighted = network.to_sparse()
+    weighted.sum_duplicates()
+
+    degree = np.asarray(adjacency.sum(axis=1)).ravel()
+    strength = np.asarray(weighted.sum(axis=1)).ravel()
+    triangles = np.asarray((adjacency @ adjacency).multiply(adjacency).sum(axis=1)).ravel() / 2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        clustering = np.where(degree > 1, 2 * triangles / (degree * (degree - 1)), 0.0)
+        effective_size = np.where(degree > 0, degree - 2 * triangles / degree, np.nan)
+
+        # Burt: c_i = sum_j (p_ij + sum_q p_iq p_qj)^2 over the neighbours j of i
+        proportions = sparse.diags(np.where(strength > 0, 1 / strength, 0.0)) @ weighted
+        indirect = (proportions @ proportions).multiply(adjacency)
+        constraint = np.asarray((proportions + indirect).power(2).sum(axis=1)).ravel()
+    constraint = np.where(degree > 0, constraint, np.nan)
+
+    return pd.DataFrame({
+        "node": np.arange(network.n_nodes),
+        "cluster": network.cluster,
+        "degree": degree.astype("int64"),
+        "strength": strength,
+        "triangles": triangles.astype("int64"),
+        "clustering": clustering,
+        "effective_size": effective_size,
+        "constraint": constraint,
+    })
+
+
+def cluster_metrics(network, nodes=None):
+    """
+    Summarizes bonding and bridging capital per cluster.
+
+    Conductance is the weight of the ties leaving a cluster divided by the
+    smaller of its volume and the rest of the graph's volume: low values mean a
+    tightly bonded community with few bridges.
+
+    Parameters:
+        network (ClusteredNetwork): Network to measure.
+        nodes (pd.DataFrame): Output of node_metrics, reused for mean clustering and constraint.
+
+    Returns:
+        pd.DataFrame: One row per cluster with size, internal_edges, density, volume,
+        cut_weight, external_edges, conductance, mean_clustering and mean_constraint.
+    """
+    n_clusters = int(network.cluster.max()) + 1 if network.n_nodes else 0
+    sizes = np.bincount(network.cluster, minlength=n_clusters)
+    src_cluster = network.cluster[network.src]
+    dst_cluster = network.cluster[network.dst]
+    internal = src_cluster == dst_cluster
+
+    internal_edges = np.bincount(src_cluster[internal], minlength=n_clusters)
+    external_edges = (np.bincount(src_cluster[~internal], minlength=n_clusters)
+                      + np.bincount(dst_cluster[~internal], minlength=n_clusters))
+    cut_weight = (np.bincount(src_cluster[~internal], weights=network.weight[~internal], minlength=n_clusters)
+                  + np.bincount(dst_cluster[~internal], weights=network.weight[~internal], minlength=n_clusters))
+    volume = (np.bincount(src_cluster, weights=network.weight, minlength=n_clusters)
+              + np.bincount(dst_cluster, weights=network.weight, minlength=n_clusters))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        possible = sizes * (sizes - 1) / 2
+        density = np.where(possible > 0, internal_edges / possible, np.nan)
+        conductance = cut_weight / np.minimum(volume, volume.sum() - volume)
+
+    table = pd.DataFrame({
+        "cluster": np.arange(n_clusters),
+        "size": sizes,
+        "internal_edges": internal_edges,
+        "density": density,
+        "volume": volume,
+        "cut_weight": cut_weight,
+        "external_edges": external_edges,
+        "conductance": conductance,
+    })
+    if nodes is None:
+        nodes = node_metrics(network)
+    means = nodes.groupby("cluster")[["clustering", "constraint"]].mean()
+    table["mean_clustering"] = means["clustering"].reindex(table["cluster"]).to_numpy()
+    table["mean_constraint"] = means["constraint"].reindex(table["cluster"]).to_numpy()
+    return table
+
+
+def _init_worker(indptr, indices, n_nodes):
+    adjacency = sparse.csr_matrix((np.ones(len(indices)), indices, indptr), shape=(n_nodes, n_nodes))
+    _worker["adjacency"] = adjacency
+    _worker["tail"] = np.repeat(np.arange(n_nodes), np.diff(indptr))
+    _worker["head"] = indices
+
+
+def _single_source_dependencies(distance, source, tail, head, n_nodes):
+    # Brandes accumulation for one source over the shortest-path DAG given by hop distances
+    reached = np.isfinite(distance[tail])
+    dag = reached & (distance[head] == distance[tail] + 1)
+    dag_edges = np.flatnonzero(dag)
+    level = distance[tail[dag_edges]].astype("int64")
+    order = np.argsort(level, kind="stable")
+    dag_edges, level = dag_edges[order], level[order]
+    bounds = np.searchsorted(level, np.arange(level[-1] + 2)) if len(level) else np.array([0])
+
+    sigma = np.zeros(n_nodes)
+    sigma[source] = 1.0
+    for lvl in range(len(bounds) - 1):
+        edges = dag_edges[bounds[lvl]:bounds[lvl + 1]]
+        np.add.at(sigma, head[edges], sigma[tail[edges]])
+
+    delta = np.zeros(n_nodes)
+    credit = np.zeros(len(tail))
+    for lvl in range(len(bounds) - 2, -1, -1):
+        edges = dag_edges[bounds[lvl]:bounds[lvl + 1]]
+        u, v = tail[edges], head[edges]
+        contribution = sigma[u] / sigma[v] * (1 + delta[v])
+        credit[edges] = contribution
+        np.add.at(delta, u, contribution)
+    return credit
+
+
+def _betweenness_chunk(task):
+    sources, source_weights = task
+    adjacency, tail, head = _worker["adjacency"], _worker["tail"], _worker["head"]
+    n_nodes = adjacency.shape[0]
+    total = np.zeros(len(tail))
+    for start in range(0, len(sources), BETWEENNESS_BATCH):
+        batch = sources[start:start + BETWEENNESS_BATCH]
+        distances = csgraph.shortest_path(adjacency, directed=False, unweighted=True, indices=batch)
+        for row, source in enumerate(batch):
+            credit = _single_source_dependencies(distances[row], source, tail, head, n_nodes)
+            total += source_weights[start + row] * credit
+    return total
+
+
+def _stratified_sources(cluster, sources_per_cluster, rng):
+    # Picks up to sources_per_cluster random nodes in every cluster and a weight that
+    # scales each one to the size of its cluster, so sampled totals estimate the exact ones
+    sizes = np.bincount(cluster)
+    order = np.lexsort((rng.random(len(cluster)), cluster))
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    rank = np.empty(len(cluster), dtype="int64")
+    rank[order] = np.arange(len(cluster)) - np.repeat(starts, sizes)
+    chosen = np.flatnonzero(rank < sources_per_cluster)
+    picked = np.minimum(sizes, sources_per_cluster)
+    return chosen, sizes[cluster[chosen]] / picked[cluster[chosen]]
+
+
+def edge_betweenness(network, sources_per_cluster=None, workers=None, seed=0):
+    """
+    Computes (optionally sampled) edge betweenness to find the ties that bridge communities.
+
+    Hop distances for batches of sources come from scipy's compiled BFS; path
+    counts and dependencies are then accumulated level by level over the
+    shortest-path DAG with array operations (Brandes' algorithm). Source
+    chunks are spread across a process pool. For large graphs, pass
+    sources_per_cluster to sample a few sources in every community: each
+    sampled source is weighted by its cluster size, so the result estimates
+    exact betweenness while every community is represented.
+
+    Parameters:
+        network (ClusteredNetwork): Network to measure.
+        sources_per_cluster (int): Sources sampled per cluster (exact, all sources, if None).
+        workers (int): Worker processes (defaults to the CPU count; 1 runs in-process).
+        seed (int): Seed for the source sample.
+
+    Returns:
+        pd.DataFrame: One row per neighbour pair (u < v) with source, target, weight,
+        cross_cluster and betweenness (unnormalized, as networkx with normalized=False),
+        sorted by betweenness in descending order.
+    """
+    weighted = network.to_sparse()
+    weighted.sum_duplicates()  # also sorts the column indices of every row
+    adjacency = weighted.copy()
+    adjacency.data[:] = 1.0
+    n_nodes = network.n_nodes
+
+    if sources_per_cluster is None:
+        sources, source_weights = np.arange(n_nodes), np.ones(n_nodes)
+    else:
+        sources, source_weights = _stratified_sources(network.cluster, sources_per_cluster,
+                                                      np.random.default_rng(seed))
+
+    workers = workers or os.cpu_count() or 1
+    chunks = [(chunk, weights) for chunk, weights in zip(np.array_split(sources, workers * 4),
+                                                         np.array_split(source_weights, workers * 4))
+              if len(chunk)]
+    init_args = (adjacency.indptr, adjacency.indices, n_nodes)
+    if workers == 1:
+        _init_worker(*init_args)
+        credit = sum(_betweenness_chunk(chunk) for chunk in chunks)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=init_args) as pool:
+            credit = sum(pool.map(_betweenness_chunk, chunks))
+
+    # Each undirected pair is stored in both directions: add the credit of the reverse
+    # entry and halve, since every unordered pair of endpoints was counted from both ends
+    tail = np.repeat(np.arange(n_nodes), np.diff(adjacency.indptr))
+    head = adjacency.indices
+    keys = tail * n_nodes + head
+    reverse = np.searchsorted(keys, head * n_nodes + tail)
+    betweenness = (credit + credit[reverse]) / 2
+
+    upper = tail < head
+    table = pd.DataFrame({
+        "source": tail[upper],
+        "target": head[upper],
+        "weight": weighted.data[upper],
+        "cross_cluster": network.cluster[tail[upper]] != network.cluster[head[upper]],
+        "betweenness": betweenness[upper],
+    })
+    return table.sort_values("betweenness", ascending=False, ignore_index=True)
@@ -0,0 +1,300 @@
+import argparse
+import glob
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
+
+import numpy as np
+import pandas as pd
+from scipy.sparse import csgraph
+
+from .social_network import ClusteredNetwork, generate_clustered_network
+
+# Parameters that must match for a sweep directory to be resumed
+MANIFEST_NAME = "sweep.json"
+
+# Compact column types of the results table
+RESULT_DTYPES = {
+    "trial_id": "int32",
+    "replicate": "int32",
+    "n_nodes": "int32",
+    "n_edges": "int32",
+    "bridge_src": "int32",
+    "bridge_dst": "int32",
+    "bridge_weight": "float32",
+    "mean_hops": "float32",
+    "mean_cross_hops": "float32",
+    "steps_to_cross": "float32",
+    "steps_to_half": "float32",
+    "steps_to_all": "float32",
+}
+
+
+def sweep_trials(cluster_sizes=((10, 10),), bridge_weights=(0.1,), bridge_endpoints=("random",), replicates=100):
+    """
+    Expands the sweep grid into one row per trial.
+
+    Parameters:
+        cluster_sizes (list[tuple[int]]): Cluster size combinations, e.g. [(10, 10), (50, 10)].
+        bridge_weights (list[float]): Bridge weights to try.
+        bridge_endpoints (list[str]): Endpoint rules ("random", "hub", "periphery").
+        replicates (int): Random draws per parameter combination.
+
+    Returns:
+        pd.DataFrame: Trials with trial_id, replicate, cluster_sizes (e.g. "10,10"),
+        bridge_weight and bridge_endpoints.
+    """
+    grid = list(product([",".join(str(int(s)) for s in sizes) for sizes in cluster_sizes],
+                        bridge_weights, bridge_endpoints, range(replicates)))
+    trials = pd.DataFrame(grid, columns=["cluster_sizes", "bridge_weight", "bridge_endpoints", "replicate"])
+    trials.insert(0, "trial_id", np.arange(len(trials)))
+    return trials
+
+
+def trial_rng(seed, trial_id):
+    """
+    Returns the independent random stream of one trial.
+
+    Streams are derived from the sweep seed and the trial id alone, so a trial
+    draws the same numbers whichever worker runs it and whether or not the
+    sweep was resumed.
+
+    Parameters:
+        seed (int): Sweep seed.
+        trial_id (int): Trial identifier.
+
+    Returns:
+        np.random.Generator: Generator for this trial.
+    """
+    return np.random.Generator(np.random.PCG64(np.random.SeedSequence(seed, spawn_key=(int(trial_id),))))
+
+
+def simulate_spread(network, rng, spread_rate=0.5, max_steps=200):
+    """
+    Simulates susceptible-infected spread where an edge transmits with probability spread_rate * weight.
+
+    Starts from one random node of the first cluster; every step, each edge from
+    an informed to an uninformed node transmits independently.
+
+    Parameters:
+        network (ClusteredNetwork): Network to spread over.
+        rng (np.random.Generator): Random stream.
+        spread_rate (float): Transmission probability of an edge with weight 1 per step.
+        max_steps (int): Steps after which the simulation stops.
+
+    Returns:
+        tuple[float, float, float]: Steps until a node outside the first cluster is
+        informed, until half of all nodes are, and until all are (NaN if never reached).
+    """
+    tail = np.concatenate([network.src, network.dst])
+    head = np.concatenate([network.dst, network.src])
+    probability = np.minimum(spread_rate * np.concatenate([network.weight, network.weight]), 1.0)
+    outside = network.cluster != network.cluster[0]
+
+    informed = np.zeros(network.n_nodes, dtype=bool)
+    informed[rng.integers(0, np.count_nonzero(network.cluster == network.cluster[0]))] = True
+    steps_to_cross = steps_to_half = steps_to_all = np.nan
+    for step in range(1, max_steps + 1):
+        candidates = np.flatnonzero(informed[tail] & ~informed[head])
+        if len(candidates) == 0:
+            break
+        hits = candidates[rng.random(len(candidates)) < probability[candidates]]
+        informed[head[hits]] = True
+        count = np.count_nonzero(informed)
+        if np.isnan(steps_to_cross) and informed[outside].any():
+            steps_to_cross = step
+        if np.isnan(steps_to_half) and count * 2 >= network.n_nodes:
+            steps_to_half = step
+        if count == network.n_nodes:
+            steps_to_all = step
+            break
+    return steps_to_cross, steps_to_half, steps_to_all
+
+
+def path_lengths(network, rng, n_sources=20):
+    """
+    Estimates mean hop distances from a sample of source nodes.
+
+    Parameters:
+        network (ClusteredNetwork): Network to measure.
+        rng (np.random.Generator): Random stream for the source sample.
+        n_sources (int): Number of source nodes.
+
+    Returns:
+        tuple[float, float]: Mean hops to all reachable nodes and to reachable nodes in other clusters.
+    """
+    sources = rng.choice(network.n_nodes, size=min(n_sources, network.n_nodes), replace=False)
+    distances = csgraph.shortest_path(network.to_sparse(), directed=False, unweighted=True, indices=sources)
+    reachable = np.isfinite(distances) & (distances > 0)
+    cross = reachable & (network.cluster[sources][:, None] != network.cluster[None, :])
+    mean_hops = distances[reachable].mean() if reachable.any() else np.nan
+    mean_cross_hops = distances[cross].mean() if cross.any() else np.nan
+    return mean_hops, mean_cross_hops
+
+
+def run_trial(trial, seed=0, p_intra=1.0, spread_rate=0.5, max_steps=200, path_sources=20):
+    """
+    Generates one network and measures path lengths and spread across its weak link.
+
+    Parameters:
+        trial (dict): One row of sweep_trials.
+        seed (int): Sweep seed (combined with the trial id, see trial_rng).
+        p_intra (float): Edge probability within clusters.
+        spread_rate (float): See simulate_spread.
+        max_steps (int): See simulate_spread.
+        path_sources (int): See path_lengths.
+
+    Returns:
+        dict: The trial parameters plus its measurements.
+    """
+    rng = trial_rng(seed, trial["trial_id"])
+    sizes = [int(size) for size in trial["cluster_sizes"].split(",")]
+    network = generate_clustered_network(sizes, p_intra=p_intra, bridge_weight=trial["bridge_weight"],
+                                         bridge_endpoints=trial["bridge_endpoints"], seed=rng)
+    bridge = np.flatnonzero(network.kind == ClusteredNetwork.BRIDGE)
+    mean_hops, mean_cross_hops = path_lengths(network, rng, path_sources)
+    steps_to_cross, steps_to_half, steps_to_all = simulate_spread(network, rng, spread_rate, max_steps)
+    return dict(
+        trial,
+        n_nodes=network.n_nodes,
+        n_edges=network.n_edges,
+        bridge_src=network.src[bridge[0]] if len(bridge) else -1,
+        bridge_dst=network.dst[bridge[0]] if len(bridge) else -1,
+        mean_hops=mean_hops,
+        mean_cross_hops=mean_cross_hops,
+        steps_to_cross=steps_to_cross,
+        steps_to_half=steps_to_half,
+        steps_to_all=steps_to_all,
+    )
+
+
+def _run_chunk(task):
+    trials, options = task
+    return [run_trial(trial, **options) for trial in trials]
+
+
+def _write_part(records, path):
+    part = pd.DataFrame.from_records(records)
+    part = part.astype({col: dtype for col, dtype in RESULT_DTYPES.items() if col in part.columns})
+    for col in ("cluster_sizes", "bridge_endpoints"):
+        part[col] = part[col].astype("category")
+    temp_path = f"{path}.tmp"
+    try:
+        from pyarrow import feather
+    except ImportError:
+        part.to_pickle(temp_path, compression="gzip")
+    else:
+        feather.write_feather(part, temp_path, compression="zstd")
+    os.replace(temp_path, path)  # a part is either complete or absent, never half-written
+
+
+def _read_part(path):
+    try:
+        from pyarrow import feather
+    except ImportError:
+        return pd.read_pickle(path, compression="gzip")
+    return feather.read_table(path).to_pandas()
+
+
+def load_sweep(output_dir):
+    """
+    Reads every completed part of a sweep into one table.
+
+    Parameters:
+        output_dir (str): Sweep directory.
+
+    Returns:
+        pd.DataFrame: One row per completed trial, ordered by trial_id.
+    """
+    paths = sorted(glob.glob(os.path.join(output_dir, "part-*.part")))
+    if not paths:
+        return pd.DataFrame(columns=list(RESULT_DTYPES))
+    results = pd.concat([_read_part(path) for path in paths], ignore_index=True)
+    for col in ("cluster_sizes", "bridge_endpoints"):
+        results[col] = results[col].astype("category")
+    return results.sort_values("trial_id", ignore_index=True)
+
+
+def run_sweep(trials, output_dir="weak_link_sweep", seed=0, workers=None, chunk_size=50, **options):
+    """
+    Runs all trials across a process pool, checkpointing results to disk as they complete.
+
+    Every finished chunk of trials is written as its own compressed Feather
+    (or, without pyarrow, pickle) part file. Rerunning with the same directory, trials, seed and options
+    skips the trials already on disk, so an interrupted sweep resumes where it
+    stopped and produces the same numbers as an uninterrupted one.
+
+    Parameters:
+        trials (pd.DataFrame): Trials as returned by sweep_trials.
+        output_dir (str): Directory for the part files and the sweep manifest.
+        seed (int): Sweep seed for the per-trial random streams.
+        workers (int): Worker processes (defaults to the CPU count; 1 runs in-process).
+        chunk_size (int): Trials per task and per part file.
+        **options: Passed to run_trial (p_intra, spread_rate, max_steps, path_sources).
+
+    Returns:
+        pd.DataFrame: Results of all trials (see load_sweep).
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = {"seed": seed, "n_trials": len(trials), "options": options,
+                "grid": trials.drop(columns=["trial_id"]).astype(str).agg("|".join, axis=1).tolist()}
+    manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            if json.load(f) != json.loads(json.dumps(manifest)):
+                raise ValueError(f"{output_dir} holds a different sweep; use another output directory.")
+    else:
+        with open(manifest_path, "w") as f:
+            json.dump(manifest, f)
+
+    done = set(load_sweep(output_dir)["trial_id"].tolist())
+    pending = trials[~trials["trial_id"].isin(done)].to_dict("records")
+    if done:
+        print(f"Resuming: {len(done)} of {len(trials)} trials already completed")
+
+    chunks = [pending[start:start + chunk_size] for start in range(0, len(pending), chunk_size)]
+    tasks = [(chunk, dict(options, seed=seed)) for chunk in chunks]
+
+    def part_path(chunk):
+        return os.path.join(output_dir, f"part-{chunk[0]['trial_id']:08d}.part")
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for task in tasks:
+            _write_part(_run_chunk(task), part_path(task[0]))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(_run_chunk, task): task for task in tasks}
+            for future in as_completed(futures):
+                _write_part(future.result(), part_path(futures[future][0]))
+
+    return load_sweep(output_dir)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Monte Carlo sweep over the weak link between clusters.")
+    parser.add_argument("--sizes", nargs="+", default=["10,10"], help="Cluster sizes per trial, e.g. 10,10 50,10")
+    parser.add_argument("--weights", nargs="+", type=float, default=[0.1], help="Bridge weights")
+    parser.add_argument("--endpoints", nargs="+", default=["random"], choices=["random", "hub", "periphery"])
+    parser.add_argument("--replicates", type=int, default=100)
+    parser.add_argument("--p-intra", type=float, default=1.0)
+    parser.add_argument("--spread-rate", type=float, default=0.5)
+    parser.add_argument("--max-steps", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=50)
+    parser.add_argument("--output-dir", default="weak_link_sweep")
+    args = parser.parse_args(argv)
+
+    sizes = [tuple(int(size) for size in spec.split(",")) for spec in args.sizes]
+    trials = sweep_trials(sizes, args.weights, args.endpoints, args.replicates)
+    results = run_sweep(trials, args.output_dir, args.seed, args.workers, args.chunk_size,
+                        p_intra=args.p_intra, spread_rate=args.spread_rate, max_steps=args.max_steps)
+    summary = results.groupby(["cluster_sizes", "bridge_weight", "bridge_endpoints"], observed=True)[
+        ["mean_cross_hops", "steps_to_cross", "steps_to_all"]].mean()
+    print(summary.to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import numpy as np
+
+from .trend_forecast import MODEL_PARAMETERS
+
+MODEL_LABELS = {
+    "linear": "Linear Best Fit",
+    "quadratic": "Best Fit Curve",
+    "log": "Logarithmic Best Fit",
+    "exp_decay": "Exponential Decay Best Fit",
+    "piecewise_linear": "Piecewise Linear Best Fit",
+}
+
+
+def draw_trend_forecast(ax, fits, years, values, row=0, model=None, until=2030, target=None,
+                        target_label=None, level=0.95, start=None):
+    """
+    Draws observations, a fitted trend extrapolated to a year, its prediction band and an optional target.
+
+    Parameters:
+        ax (matplotlib.axes.Axes): Axes to draw on.
+        fits (TrendFits): Fitted models (see trend_forecast.fit_trends).
+        years (list[int]): Observation years of the series.
+        values (list[float]): Observations of the series.
+        row (int): Position of the series in fits.
+        model (str): Model to draw (default: the series' best model by AICc).
+        until (int): Last year of the extrapolation, highlighted on the chart.
+        target (float): Horizontal target line; its first crossing by the curve is marked.
+        target_label (str): Legend label of the target line.
+        level (float): Coverage of the prediction band.
+        start (int): First year of the drawn curve (defaults to the first observation year).
+
+    Returns:
+        float: The predicted value in `until`.
+    """
+    from scipy import stats
+
+    model = model or fits.best_models()[row]
+    ax.scatter(years, values, color="blue", s=50, label="Actual Data")
+
+    # Smooth curve including the prediction to `until`
+    years_extended = np.linspace(min(years) if start is None else start, until, 100)
+    predicted, stderr = fits.predict(model, years_extended)
+    predicted, stderr = predicted[row], stderr[row]
+    quantile = stats.t.ppf((1 + level) / 2, fits.fits[model]["n_obs"][row] - MODEL_PARAMETERS[model])
+    ax.plot(years_extended, predicted, "r-", label=MODEL_LABELS.get(model, model))
+    ax.fill_between(years_extended, predicted - quantile * stderr, predicted + quantile * stderr,
+                    color="red", alpha=0.12, label=f"{level:.0%} Prediction Interval")
+
+    if target is not None:
+        ax.axhline(y=target, color="green", linestyle="--", linewidth=2,
+                   label=target_label or f"Target ({target:.2f})")
+        crossing = fits.target_year(target, until=until, model=model).iloc[row]
+        if np.isfinite(crossing):
+            ax.scatter(crossing, target, color="orange", s=100, zorder=5)
+            ax.annotate(f"Target reached: ~{crossing:.0f}", (crossing, target),
+                        xytext=(crossing - 5, target - 0.5), arrowprops=dict(arrowstyle="->"))
+
+    prediction = predicted[-1]
+    ax.scatter(until, prediction, color="green", s=100, zorder=5)
+    ax.annotate(f"{until} Prediction: {prediction:.2f}", (until, prediction),
+                xytext=(until - 15, prediction + 0.5), arrowprops=dict(arrowstyle="->"))
+
+    ax.set_xlabel("Year")
+    ax.set_ylabel("Value")
+    ax.set_title(f"Data Trend with Prediction to {until}")
+    ax.grid(True, linestyle="--", alpha=0.7)
+    ax.legend()
+    return prediction
@@ -0,0 +1,329 @@
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_MODELS = ("linear", "quadratic", "log", "exp_decay", "piecewise_linear")
+
+# Free parameters of each model (the piecewise-linear breakpoint counts as one)
+MODEL_PARAMETERS = {"linear": 2, "quadratic": 3, "log": 2, "exp_decay": 3, "piecewise_linear": 4}
+
+# Time is measured in decades since the first year, which keeps the normal equations well conditioned
+TIME_SCALE = 10.0
+
+# Decay rates (per decade) tried before the nonlinear refinement of the exponential model
+DECAY_RATES = np.logspace(-2, 1, 61)
+
+# Below this many series the nonlinear refinement runs in-process
+PARALLEL_MIN_SERIES = 64
+
+# Smallest residual sum of squares used in AICc, relative to the series' sum of squares
+RSS_FLOOR = 1e-12
+
+
+def _weighted_lstsq(design, values, weights):
+    # Solves one weighted least-squares problem per series at once.
+    # design: (T, p) shared or (n, T, p) per series; values, weights: (n, T)
+    weighted = design * weights[..., None]
+    if design.ndim == 2:
+        gram = np.einsum("ntp,tq->npq", weighted, design)
+    else:
+        gram = np.einsum("ntp,ntq->npq", weighted, design)
+    moment = np.einsum("ntp,nt->np", weighted, values)
+    return np.einsum("npq,nq->np", np.linalg.pinv(gram), moment)
+
+
+def _rss(predicted, values, weights):
+    return np.sum(weights * (values - predicted) ** 2, axis=1)
+
+
+def _features(model, u, params, knots=None, log_offset=1.0):
+    """
+    Evaluates a model and its gradient with respect to the parameters.
+
+    Parameters:
+        model (str): Model name.
+        u (np.ndarray): Times in decades since the first year, shape (m,).
+        params (np.ndarray): Parameters per series, shape (n, p).
+        knots (np.ndarray): Breakpoint per series (piecewise_linear only).
+        log_offset (float): Decades before the first year where the log model starts.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Predictions (n, m) and gradients (n, m, p).
+    """
+    n = len(params)
+    ones = np.ones((n, len(u)))
+    uu = np.broadcast_to(u, (n, len(u)))
+    if model == "linear":
+        grad = np.stack([ones, uu], axis=-1)
+    elif model == "quadratic":
+        grad = np.stack([ones, uu, uu ** 2], axis=-1)
+    elif model == "log":
+        with np.errstate(invalid="ignore", divide="ignore"):
+            grad = np.stack([ones, np.log(uu + log_offset)], axis=-1)
+    elif model == "piecewise_linear":
+        grad = np.stack([ones, uu, np.maximum(uu - knots[:, None], 0.0)], axis=-1)
+    elif model == "exp_decay":
+        # y = c + a * exp(-r * u)
+        c, a, r = params[:, 0:1], params[:, 1:2], params[:, 2:3]
+        decay = np.exp(-r * uu)
+        return c + a * decay, np.stack([ones, decay, -a * uu * decay], axis=-1)
+    else:
+        raise ValueError(f"Unknown model: {model}")
+    return np.einsum("nmp,np->nm", grad, params), grad
+
+
+def _fit_piecewise(u, values, weights):
+    # Grid search over interior breakpoints, each solved in closed form for all series
+    n = len(values)
+    best_rss = np.full(n, np.inf)
+    best_params = np.full((n, 3), np.nan)
+    best_knots = np.full(n, np.nan)
+    for knot in u[2:-2]:
+        design = np.column_stack([np.ones_like(u), u, np.maximum(u - knot, 0.0)])
+        params = _weighted_lstsq(design, values, weights)
+        rss = _rss(params @ design.T, values, weights)
+        # The knot needs observations on both sides to be identified
+        valid = ((weights * (u <= knot)).sum(axis=1) >= 2) & ((weights * (u > knot)).sum(axis=1) >= 2)
+        better = valid & (rss < best_rss)
+        best_rss[better], best_params[better], best_knots[better] = rss[better], params[better], knot
+    return best_params, best_knots
+
+
+def _grid_exp_decay(u, values, weights):
+    # Variable projection: for a fixed rate the model is linear in (c, a)
+    n = len(values)
+    best_rss = np.full(n, np.inf)
+    best_params = np.full((n, 3), np.nan)
+    for rate in DECAY_RATES:
+        design = np.column_stack([np.ones_like(u), np.exp(-rate * u)])
+        params = _weighted_lstsq(design, values, weights)
+        rss = _rss(params @ design.T, values, weights)
+        better = rss < best_rss
+        best_rss[better] = rss[better]
+        best_params[better] = np.column_stack([params[better], np.full(better.sum(), rate)])
+    return best_params
+
+
+def _exp_decay(u, c, a, r):
+    return c + a * np.exp(-r * u)
+
+
+def _refine_exp_decay(task):
+    from scipy.optimize import OptimizeWarning, curve_fit
+
+    u, values, weights, start = task
+    params = start.copy()
+    for row in range(len(values)):
+        observed = weights[row] > 0
+        # Only series that can be scored (n_obs > k + 1) are worth refining
+        if observed.sum() <= MODEL_PARAMETERS["exp_decay"] + 1 or not np.isfinite(start[row]).all():
+            continue
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", OptimizeWarning)
+                refined, _ = curve_fit(_exp_decay, u[observed], values[row, observed], p0=start[row], maxfev=2000)
+        except RuntimeError:
+            continue  # keep the grid estimate
+        # A negative rate is growth, not decay; also never accept a worse fit than the grid
+        y = values[row, observed]
+        if refined[2] >= 0 and np.sum((_exp_decay(u[observed], *refined) - y) ** 2) <= \
+                np.sum((_exp_decay(u[observed], *start[row]) - y) ** 2):
+            params[row] = refined
+    return params
+
+
+class TrendFits:
+    """
+    Fitted trend models for many series sharing one time axis.
+
+    Holds, per model, the parameters, their covariance and the information
+    criterion of every series, and produces forecasts with prediction intervals
+    from the per-series best model or from any named model.
+
+    Parameters:
+        years (np.ndarray): Observation years.
+        labels (list): Series labels.
+        base_year (float): Year mapped to time 0.
+        log_offset (float): Years before base_year where the log model starts.
+        fits (dict): Per-model results (params, cov, rss, n_obs, sigma2, aicc, knots).
+    """
+
+    def __init__(self, years, labels, base_year, log_offset, fits):
+        self.years = years
+        self.labels = labels
+        self.base_year = base_year
+        self.log_offset = log_offset
+        self.fits = fits
+
+    @property
+    def models(self):
+        return list(self.fits)
+
+    def criteria(self):
+        """
+        Returns the AICc of every model (columns) for every series (rows), with the best model.
+        """
+        table = pd.DataFrame({model: fit["aicc"] for model, fit in self.fits.items()}, index=self.labels)
+        table.index.name = "series"
+        best = table.to_numpy()
+        has_fit = ~np.isnan(best).all(axis=1)
+        choice = np.argmin(np.where(np.isnan(best), np.inf, best), axis=1)
+        table["best_model"] = np.where(has_fit, np.array(self.models, dtype=object)[choice], None)
+        return table
+
+    def best_models(self):
+        return self.criteria()["best_model"].to_numpy()
+
+    def predict(self, model, years):
+        """
+        Returns predictions and their standard errors (observation noise included) for one model.
+
+        Parameters:
+            model (str): Model name.
+            years (array-like): Years to predict.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: Predictions and standard errors, both (n_series, n_years).
+        """
+        fit = self.fits[model]
+        u = (np.asarray(years, dtype="float64") - self.base_year) / TIME_SCALE
+        predicted, grad = _features(model, u, fit["params"], fit.get("knots"), self.log_offset / TIME_SCALE)
+        variance = fit["sigma2"][:, None] + np.einsum("nmp,npq,nmq->nm", grad, fit["cov"], grad)
+        return predicted, np.sqrt(variance)
+
+    def forecast(self, years, level=0.95, model=None):
+        """
+        Forecasts every series with prediction intervals.
+
+        Parameters:
+            years (array-like): Years to forecast (may include observed years).
+            level (float): Coverage of the prediction intervals.
+            model (str): Model to use for all series (default: each series' best model by AICc).
+
+        Returns:
+            pd.DataFrame: Long table with series, year, model, forecast, lower and upper.
+        """
+        from scipy import stats
+
+        years = np.asarray(years, dtype="float64")
+        chosen = np.full(len(self.labels), model, dtype=object) if model else self.best_models()
+        frames = []
+        for name in self.models:
+            rows = np.flatnonzero(chosen == name)
+            if len(rows) == 0:
+                continue
+            predicted, stderr = self.predict(name, years)
+            df = self.fits[name]["n_obs"] - MODEL_PARAMETERS[name]
+            with np.errstate(invalid="ignore"):
+                quantile = stats.t.ppf((1 + level) / 2, df)[:, None]
+            frames.append(pd.DataFrame({
+                "series": np.repeat(np.asarray(self.labels, dtype=object)[rows], len(years)),
+                "year": np.tile(years, len(rows)),
+                "model": name,
+                "forecast": predicted[rows].ravel(),
+                "lower": (predicted - quantile * stderr)[rows].ravel(),
+                "upper": (predicted + quantile * stderr)[rows].ravel(),
+            }))
+        if not frames:
+            return pd.DataFrame(columns=["series", "year", "model", "forecast", "lower", "upper"])
+        return pd.concat(frames, ignore_index=True)
+
+    def target_year(self, target, until=2100, model=None, step=0.1):
+        """
+        Returns the first year at which each fitted curve crosses a target (searching from the first year).
+
+        Parameters:
+            target (float | np.ndarray): Target value, or one per series.
+            until (float): Last year searched.
+            model (str): Model to use (default: each series' best model).
+            step (float): Resolution of the search in years.
+
+        Returns:
+            pd.Series: Crossing year per series (NaN if not reached by `until`).
+        """
+        grid = np.arange(self.years.min(), until + step, step)
+        chosen = np.full(len(self.labels), model, dtype=object) if model else self.best_models()
+        target = np.broadcast_to(np.asarray(target, dtype="float64"), (len(self.labels),))
+        crossing = np.full(len(self.labels), np.nan)
+        for name in self.models:
+            rows = np.flatnonzero(chosen == name)
+            if len(rows) == 0:
+                continue
+            gap = self.predict(name, grid)[0][rows] - target[rows, None]
+            crosses = np.sign(gap[:, :-1]) != np.sign(gap[:, 1:])
+            found = crosses.any(axis=1)
+            crossing[rows[found]] = grid[crosses[found].argmax(axis=1) + 1]
+        return pd.Series(crossing, index=self.labels, name="target_year")
+
+
+def fit_trends(years, values, labels=None, models=DEFAULT_MODELS, log_offset=10.0, workers=None):
+    """
+    Fits candidate trend models to many series at once and scores them by AICc.
+
+    Linear-in-parameters models (linear, quadratic, log, and piecewise linear for
+    each candidate breakpoint) are solved in closed form by batched weighted
+    least squares over the series x time matrix, with missing values given zero
+    weight. The exponential decay model is first fitted on a grid of decay
+    rates the same way, then refined with curve_fit starting from the grid
+    estimate, spread over a process pool for many series.
+
+    Parameters:
+        years (array-like): Observation years, shape (T,).
+        values (array-like): Observations, shape (n_series, T) or (T,); NaN marks missing values.
+        labels (list): Series labels (e.g. CountryIndex.names); defaults to 0..n_series-1.
+        models (tuple[str]): Models to fit, from DEFAULT_MODELS.
+        log_offset (float): Years before the first year where log(year - origin) starts.
+        workers (int): Processes for the nonlinear refinement (defaults to the CPU count).
+
+    Returns:
+        TrendFits: The fitted models.
+    """
+    years = np.asarray(years, dtype="float64")
+    values = np.atleast_2d(np.asarray(values, dtype="float64"))
+    labels = list(range(len(values))) if labels is None else list(labels)
+    weights = np.isfinite(values).astype("float64")
+    filled = np.where(weights > 0, values, 0.0)
+    n_obs = weights.sum(axis=1)
+
+    rss_floor = RSS_FLOOR * np.maximum(_rss(0.0, filled, weights), np.finfo("float64").tiny)
+
+    base_year = years.min()
+    u = (years - base_year) / TIME_SCALE
+    offset = log_offset / TIME_SCALE
+    fits = {}
+    for model in models:
+        knots = None
+        if model == "piecewise_linear":
+            params, knots = _fit_piecewise(u, filled, weights)
+        elif model == "exp_decay":
+            params = _grid_exp_decay(u, filled, weights)
+            workers = workers or os.cpu_count() or 1
+            if workers > 1 and len(values) >= PARALLEL_MIN_SERIES:
+                chunks = np.array_split(np.arange(len(values)), workers * 4)
+                tasks = [(u, filled[rows], weights[rows], params[rows]) for rows in chunks if len(rows)]
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    params = np.concatenate(list(pool.map(_refine_exp_decay, tasks)))
+            else:
+                params = _refine_exp_decay((u, filled, weights, params))
+        else:
+            design = _features(model, u, np.zeros((1, MODEL_PARAMETERS[model])), log_offset=offset)[1][0]
+            params = _weighted_lstsq(design, filled, weights)
+
+        predicted, grad = _features(model, u, params, knots, offset)
+        grad = np.nan_to_num(grad)
+        rss = _rss(np.nan_to_num(predicted), filled, weights)
+        k = MODEL_PARAMETERS[model]
+        valid = (n_obs > k + 1) & np.isfinite(params).all(axis=1) & np.isfinite(predicted[:, weights.any(axis=0)]).all(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sigma2 = np.where(valid, rss / (n_obs - k), np.nan)
+            cov = sigma2[:, None, None] * np.linalg.pinv(np.einsum("ntp,nt,ntq->npq", grad, weights, grad))
+            # An exact fit (rss at rounding level) would score -inf; the floor keeps it finite so
+            # the parameter penalty still prefers the simpler of several exact fits
+            floored = np.maximum(rss, rss_floor)
+            aicc = np.where(valid, n_obs * np.log(floored / n_obs) + 2 * k + 2 * k * (k + 1) / (n_obs - k - 1), np.nan)
+        fits[model] = {"params": params, "knots": knots, "cov": cov, "rss": rss, "n_obs": n_obs,
+                       "sigma2": sigma2, "aicc": aicc}
+    return TrendFits(years, labels, base_year, log_offset, fits)
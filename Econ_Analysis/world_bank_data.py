@@ -0,0 +1,234 @@
+import csv
+import glob
+import hashlib
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+# Identifier columns shared by every World Bank indicator export
+ID_COLUMNS = ["Country Name", "Country Code", "Indicator Name", "Indicator Code"]
+
+DEFAULT_CACHE_DIR = ".cache"
+
+
+def file_digest(file_path, chunk_size=1 << 20):
+    """
+    Returns a short content hash for a file, used to key cached artifacts.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:16]
+
+
+def detect_header_row(file_path, max_lines=50):
+    """
+    Finds the row holding the column header in a World Bank-format CSV.
+
+    World Bank exports start with a few metadata lines ("Data Source",
+    "Last Updated Date", ...) before the "Country Name" header row.
+
+    Parameters:
+        file_path (str): Path to the World Bank-format CSV file.
+        max_lines (int): Number of leading lines to scan.
+
+    Returns:
+        int: Zero-based line number of the header row.
+    """
+    with open(file_path, newline="", encoding="utf-8-sig") as handle:
+        for line_number, row in enumerate(csv.reader(handle)):
+            if line_number >= max_lines:
+                break
+            if row and row[0].strip() == "Country Name":
+                return line_number
+    raise ValueError(f"No 'Country Name' header found in the first {max_lines} lines of {file_path}")
+
+
+def parse_world_bank_csv(file_path):
+    """
+    Parses a World Bank indicator CSV into its wide (one column per year) form.
+
+    The metadata rows and the empty trailing "Unnamed: NN" column left by the
+    export's trailing commas are detected rather than hard-coded.
+
+    Parameters:
+        file_path (str): Path to the World Bank-format CSV file.
+
+    Returns:
+        pd.DataFrame: The wide table with string year columns.
+    """
+    wide = pd.read_csv(file_path, skiprows=detect_header_row(file_path), encoding="utf-8-sig")
+    unnamed = [col for col in wide.columns if str(col).startswith("Unnamed:")]
+    wide = wide.drop(columns=unnamed).dropna(how="all", axis=0).reset_index(drop=True)
+    return wide
+
+
+def melt_world_bank_data(wide, value_name="Gini Index"):
+    """
+    Transforms the wide World Bank table into a long (country, year, value) table.
+
+    Parameters:
+        wide (pd.DataFrame): Wide table as returned by parse_world_bank_csv.
+        value_name (str): Name of the value column in the long table.
+
+    Returns:
+        pd.DataFrame: Long table with typed categorical id columns and an integer Year.
+    """
+    id_vars = [col for col in ID_COLUMNS if col in wide.columns]
+    long = wide.melt(id_vars=id_vars, var_name="Year", value_name=value_name)
+    # Columns that are not years (e.g. a trailing unnamed column) are dropped with their values
+    long["Year"] = pd.to_numeric(long["Year"], errors="coerce")
+    long = long.dropna(subset=["Year", value_name]).reset_index(drop=True)
+    long["Year"] = long["Year"].astype("int16")
+    long[value_name] = long[value_name].astype("float64")
+    for col in id_vars:
+        long[col] = long[col].astype("category")
+    return long
+
+
+def _cache_paths(file_path, cache_dir, value_name):
+    stem = os.path.splitext(os.path.basename(file_path))[0]
+    key = f"{stem}.{file_digest(file_path)}"
+    value_key = value_name.lower().replace(" ", "_")
+    wide_path = os.path.join(cache_dir, f"{key}.wide.feather")
+    long_path = os.path.join(cache_dir, f"{key}.{value_key}.long.feather")
+    return stem, key, wide_path, long_path
+
+
+def _remove_stale(cache_dir, stem, key):
+    # Older cache generations of the same source file are dropped once a new one is written.
+    # Names must match _cache_paths exactly, so files whose stem merely starts with this
+    # stem (e.g. "gini.v2" next to "gini") and other loaders' caches are left alone.
+    pattern = re.compile(rf"{re.escape(stem)}\.[0-9a-f]{{16}}\.(wide|.+\.long)\.feather")
+    for name in os.listdir(cache_dir):
+        if pattern.fullmatch(name) and not name.startswith(f"{key}."):
+            os.remove(os.path.join(cache_dir, name))
+
+
+def write_feather_cache(table, path):
+    """
+    Writes a table to an uncompressed Feather cache file atomically.
+
+    The table is written under a per-process temporary name and renamed into
+    place, so concurrent loaders never read or overwrite a half-written file.
+
+    Parameters:
+        table (pd.DataFrame): Table to cache.
+        path (str): Final path of the Feather file.
+    """
+    from pyarrow import feather
+
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    feather.write_feather(table, temp_path, compression="uncompressed")
+    os.replace(temp_path, path)
+
+
+def load_world_bank_data(file_path, value_name="Gini Index", cache_dir=None, use_cache=True):
+    """
+    Loads a World Bank indicator CSV as wide and long tables, using a columnar cache.
+
+    The first load parses and melts the CSV and stores both tables as uncompressed
+    Feather files keyed by the source file's content hash. Later loads read those
+    files back into pandas (a columnar read with no CSV parsing or melting), and
+    the cache rebuilds itself when the source file changes. Without pyarrow
+    installed the CSV is parsed every time.
+
+    Parameters:
+        file_path (str): Path to the World Bank-format CSV file.
+        value_name (str): Name of the value column in the long table.
+        cache_dir (str): Directory for cached tables (defaults to ".cache" next to the CSV).
+        use_cache (bool): Set to False to always parse the CSV.
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame]: The wide and long tables.
+    """
+    try:
+        from pyarrow import feather
+    except ImportError:
+        feather = None
+
+    if not use_cache or feather is None:
+        wide = parse_world_bank_csv(file_path)
+        return wide, melt_world_bank_data(wide, value_name)
+
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(os.path.abspath(file_path)), DEFAULT_CACHE_DIR)
+    stem, key, wide_path, long_path = _cache_paths(file_path, cache_dir, value_name)
+
+    if os.path.exists(wide_path) and os.path.exists(long_path):
+        wide = feather.read_table(wide_path, memory_map=True).to_pandas()
+        long = feather.read_table(long_path, memory_map=True).to_pandas()
+        return wide, long
+
+    wide = parse_world_bank_csv(file_path)
+    long = melt_world_bank_data(wide, value_name)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    write_feather_cache(wide, wide_path)
+    write_feather_cache(long, long_path)
+    _remove_stale(cache_dir, stem, key)
+    return wide, long
+
+
+def _load_indicator_long(task):
+    file_path, cache_dir, value_dtype = task
+    try:
+        _, long = load_world_bank_data(file_path, value_name="Value", cache_dir=cache_dir)
+    except ValueError as error:
+        return file_path, None, str(error)
+    long = long[ID_COLUMNS + ["Year", "Value"]].astype({"Value": value_dtype})
+    return file_path, long, None
+
+
+def _concat_categorical(frames):
+    # Unify category sets across files so the combined columns stay categorical
+    combined = {}
+    for col in frames[0].columns:
+        if isinstance(frames[0][col].dtype, pd.CategoricalDtype):
+            combined[col] = union_categoricals([frame[col] for frame in frames])
+        else:
+            combined[col] = np.concatenate([frame[col].to_numpy() for frame in frames])
+    return pd.DataFrame(combined)
+
+
+def load_world_bank_indicators(source, workers=None, cache_dir=None, value_dtype="float32"):
+    """
+    Loads many World Bank indicator CSVs into one long (country, indicator, year, value) table.
+
+    Files are parsed in parallel (reusing the per-file columnar cache) and each
+    result is reduced to categorical id columns, an int16 Year and a compact
+    Value column before being combined. Files that are not indicator exports
+    (for example the "Metadata_*.csv" files shipped alongside them) are skipped.
+
+    Parameters:
+        source (str): Directory containing the CSVs, or a glob pattern.
+        workers (int): Number of worker processes (defaults to the CPU count).
+        cache_dir (str): Cache directory passed to load_world_bank_data.
+        value_dtype (str): dtype of the Value column.
+
+    Returns:
+        pd.DataFrame: Long table with Country Name, Country Code, Indicator Name,
+        Indicator Code, Year and Value columns.
+    """
+    pattern = os.path.join(source, "*.csv") if os.path.isdir(source) else source
+    file_paths = sorted(glob.glob(pattern))
+    if not file_paths:
+        raise FileNotFoundError(f"No CSV files match {pattern}")
+
+    tasks = [(path, cache_dir, value_dtype) for path in file_paths]
+    frames = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for file_path, long, error in pool.map(_load_indicator_long, tasks):
+            if long is None:
+                print(f"Skipping {file_path}: {error}")
+                continue
+            frames.append(long)
+
+    if not frames:
+        raise ValueError(f"None of the files matching {pattern} are World Bank indicator exports")
+    return _concat_categorical(frames)
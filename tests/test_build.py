@@ -0,0 +1,58 @@
+import inspect
+import os
+
+from Econ_Analysis.build import ARTIFACTS, Artifact, build, module_dependencies
+
+
+def copy_input(output_dir, inputs, suffix):
+    path = os.path.join(output_dir, f"copy{suffix}.txt")
+    with open(inputs["source"]) as source, open(path, "w") as target:
+        target.write(source.read())
+    return [path]
+
+
+def write_shared_cache(inputs, suffix):
+    with open(f"{inputs['source']}.cache", "w") as handle:
+        handle.write("warm")
+
+
+def read_shared_cache(output_dir, inputs, suffix):
+    # Fails unless the prepare step filled the cache before the builders started
+    with open(f"{inputs['source']}.cache") as handle:
+        assert handle.read() == "warm"
+    return copy_input(output_dir, inputs, suffix)
+
+
+def test_dependencies_follow_indirect_imports():
+    nepal_map = next(artifact for artifact in ARTIFACTS if artifact.name == "nepal_population_map")
+    modules = module_dependencies(nepal_map.code, [inspect.getsource(nepal_map.builder)])
+    assert {"nepal_population_density_map", "nepal_map", "nepal_admin", "pipeline_timing"} <= set(modules)
+
+
+def test_build_rebuilds_only_stale_artifacts(tmp_path):
+    source = tmp_path / "input.txt"
+    source.write_text("one")
+    other = tmp_path / "other.txt"
+    other.write_text("other")
+    output_dir = str(tmp_path / "build")
+    artifacts = [Artifact("a", copy_input, inputs={"source": str(source)}, params={"suffix": "_a"}),
+                 Artifact("b", copy_input, inputs={"source": str(other)}, params={"suffix": "_b"})]
+
+    assert build(artifacts, output_dir, workers=1) == {"a": "built", "b": "built"}
+    assert build(artifacts, output_dir, workers=1) == {"a": "up to date", "b": "up to date"}
+
+    source.write_text("two")
+    assert build(artifacts, output_dir, workers=1) == {"a": "built", "b": "up to date"}
+    assert (tmp_path / "build" / "copy_a.txt").read_text() == "two"
+
+    os.remove(tmp_path / "build" / "copy_b.txt")
+    assert build(artifacts, output_dir, workers=1) == {"a": "up to date", "b": "built"}
+
+
+def test_prepare_runs_before_the_builders(tmp_path):
+    source = tmp_path / "input.txt"
+    source.write_text("data")
+    artifacts = [Artifact(name, read_shared_cache, inputs={"source": str(source)}, params={"suffix": name},
+                          prepare=write_shared_cache) for name in ("a", "b")]
+
+    assert build(artifacts, str(tmp_path / "build"), workers=2) == {"a": "built", "b": "built"}
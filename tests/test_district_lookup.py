@@ -0,0 +1,32 @@
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+from shapely.geometry import box
+
+from Econ_Analysis.district_lookup import DistrictLocator
+
+
+def _two_districts():
+    return gpd.GeoDataFrame({"NAME_3": ["West", "East"]}, geometry=[box(0, 0, 1, 1), box(1, 0, 2, 1)],
+                            crs="EPSG:4326")
+
+
+def test_aggregate_mean_skips_missing_values():
+    points = pd.DataFrame({
+        "lon": [0.2, 0.5, 0.8, 1.5, 5.0],
+        "lat": [0.5, 0.5, 0.5, 0.5, 0.5],
+        "income": [10.0, np.nan, 20.0, 7.0, 99.0],
+    })
+    result = DistrictLocator(_two_districts()).aggregate([points], value_columns=["income"])
+
+    assert result["count"].tolist() == [3, 1]
+    assert result["income_sum"].tolist() == [30.0, 7.0]
+    assert result["income_mean"].tolist() == [15.0, 7.0]
+
+
+def test_aggregate_mean_is_nan_when_all_values_missing():
+    points = pd.DataFrame({"lon": [0.5, 1.5], "lat": [0.5, 0.5], "income": [np.nan, 4.0]})
+    result = DistrictLocator(_two_districts()).aggregate([points], value_columns=["income"])
+
+    assert np.isnan(result["income_mean"].iloc[0])
+    assert result["income_mean"].iloc[1] == 4.0
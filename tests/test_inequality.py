@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from Econ_Analysis.inequality import inequality_from_csv, inequality_measures
+
+
+@pytest.fixture
+def income_csv(tmp_path):
+    rng = np.random.default_rng(0)
+    n = 2000
+    survey = pd.DataFrame({
+        "year": np.repeat([2020, 2021], n),
+        "income": rng.lognormal(8, 1, 2 * n),
+        "weight": rng.uniform(0.5, 2, 2 * n),
+    })
+    survey.loc[::50, "income"] = 0.0
+    survey.loc[1::50, "income"] = 0.005  # below the first bin edge
+    # Zero and tiny positive incomes only: Gini 0.5 if they are kept apart, 0 if they share a bin
+    tiny = pd.DataFrame({"year": [2022] * 4, "income": [0.0, 0.0, 0.005, 0.005], "weight": [1.0] * 4})
+    path = tmp_path / "incomes.csv"
+    pd.concat([survey, tiny]).to_csv(path, index=False)
+    return path
+
+
+def test_binned_mode_matches_exact_mode(income_csv):
+    exact = inequality_from_csv(income_csv, weight="weight", chunksize=1000, mode="exact")
+    binned = inequality_from_csv(income_csv, weight="weight", chunksize=1000, mode="binned")
+
+    assert binned["year"].tolist() == exact["year"].tolist() == [2020, 2021, 2022]
+    np.testing.assert_allclose(binned["population"], exact["population"])
+    np.testing.assert_allclose(binned["mean"], exact["mean"])
+    np.testing.assert_allclose(binned["gini"], exact["gini"], rtol=1e-4)
+    np.testing.assert_allclose(binned["palma"], exact["palma"], rtol=1e-4)
+    np.testing.assert_allclose(binned["theil"], exact["theil"], rtol=1e-3)
+
+
+def test_binned_mode_keeps_non_positive_incomes_apart(income_csv):
+    binned = inequality_from_csv(income_csv, weight="weight", mode="binned")
+    assert binned.loc[binned["year"] == 2022, "gini"].item() == pytest.approx(0.5)
+
+
+def _reference_theil(values, weights):
+    mean = np.average(values, weights=weights)
+    ratio = values / mean
+    terms = np.zeros_like(ratio)
+    positive = ratio > 0
+    terms[positive] = ratio[positive] * np.log(ratio[positive])
+    return np.average(terms, weights=weights)
+
+
+def test_theil_with_zero_income():
+    values = np.array([0.0, 1.0, 2.0, 3.0, 10.0])
+    weights = np.array([1.0, 2.0, 1.0, 0.5, 1.5])
+    measures = inequality_measures(values, weights)
+
+    assert measures["theil"][0] == pytest.approx(_reference_theil(values, weights))
+
+
+def test_theil_is_undefined_for_negative_incomes_only():
+    measures = inequality_measures([0.0, 5.0, -1.0, 5.0], groups=[0, 0, 1, 1])
+
+    assert measures["theil"][0] == pytest.approx(np.log(2))
+    assert np.isnan(measures["theil"][1])
+
+
+def test_equal_incomes_have_no_inequality():
+    measures = inequality_measures([4.0, 4.0, 4.0, 4.0])
+
+    assert measures["gini"][0] == pytest.approx(0.0)
+    assert measures["theil"][0] == pytest.approx(0.0)
+
+
+def test_weights_match_replicated_observations():
+    values = np.array([1.0, 3.0, 7.0, 20.0])
+    weights = np.array([3, 1, 2, 1])
+    weighted = inequality_measures(values, weights)
+    replicated = inequality_measures(np.repeat(values, weights))
+
+    for name in ("mean", "gini", "theil"):
+        assert weighted[name][0] == pytest.approx(replicated[name][0])
+
+
+def test_groups_match_separate_calls():
+    rng = np.random.default_rng(0)
+    values = rng.lognormal(size=300)
+    groups = rng.integers(0, 3, size=300)
+    grouped = inequality_measures(values, groups=groups)
+
+    for group in range(3):
+        alone = inequality_measures(values[groups == group])
+        for name in ("n", "mean", "gini", "theil", "palma"):
+            assert grouped[name][group] == pytest.approx(alone[name][0])
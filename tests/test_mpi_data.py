@@ -0,0 +1,66 @@
+import os
+
+import numpy as np
+import pytest
+
+from Econ_Analysis.poverty.mpi_data import load_mpi_table, read_mpi_workbook, select_countries
+
+openpyxl = pytest.importorskip("openpyxl")
+
+# Same layout as the UNDP/OPHI national results sheet: title rows, a group header row with
+# merged cells (only the first cell filled), a sub-header row, units, then the data rows
+ROWS = [
+    ["Table 1.1 Global MPI results"],
+    [],
+    ["ISO\ncountry numeric code", "ISO\ncountry code", "Country", "World region", "MPI data source", None,
+     "Multidimensional poverty", None, None, "Destitution² ", "Inequality\namong the poor\n(variance)¹", "Comment"],
+    [None, None, None, None, None, None, "Multidimensional Poverty Index\n(MPI = H*A)",
+     "Headcount ratio: Population in multidimensional poverty\n(H)", "Intensity of deprivation among the poor\n(A) ",
+     "Headcount ratio: Population in multidimensional  destitution poverty\n(D)"],
+    [None, None, None, None, "Survey ", "Year"],
+    [None, None, None, None, None, None, "Range 0 to 1", "% Population", "Average % of weighted deprivations"],
+    [64, "BTN", "Bhutan", "South Asia", "BLSS", "2022", 0.0386, 9.6, 40.2, 1.2, "...*", "x"],
+    [418, "LAO", "Lao PDR", "East Asia and the Pacific", "MICS", "2017", 0.1083, 23.1, 47.0, 6.4, 0.012, "y"],
+    [524, "NPL", "Nepal", "South Asia", "DHS", "2022", 0.0852, 20.1, 42.5, 2.9, 0.009, "z"],
+    ["Notes: values marked ...* are suppressed"],
+]
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    book = openpyxl.Workbook()
+    for row in ROWS:
+        book.active.append(row)
+    path = tmp_path / "mpi.xlsx"
+    book.save(path)
+    return str(path)
+
+
+def test_read_resolves_columns_and_types(workbook):
+    table = read_mpi_workbook(workbook)
+
+    assert list(table.columns) == ["ISO numeric", "ISO", "Country", "Region", "Survey", "Survey year",
+                                   "MPI", "H", "A", "D", "Inequality"]
+    assert table["Country"].tolist() == ["Bhutan", "Lao PDR", "Nepal"]  # the notes row is dropped
+    assert table["MPI"].tolist() == [0.0386, 0.1083, 0.0852]
+    assert table["Survey year"].tolist() == ["2022", "2017", "2022"]
+    assert np.isnan(table["Inequality"].iloc[0])  # suppressed value
+
+
+def test_countries_resolve_through_aliases_and_codes(workbook, capsys):
+    streamed = read_mpi_workbook(workbook, countries=["Laos", "NPL", "Atlantis"])
+    assert streamed["Country"].tolist() == ["Lao PDR", "Nepal"]
+    assert "No MPI data found for country: Atlantis" in capsys.readouterr().out
+
+    selected = select_countries(read_mpi_workbook(workbook), ["Nepal", "Laos", "Bhutan"])
+    assert selected["Country"].tolist() == ["Nepal", "Lao PDR", "Bhutan"]
+
+
+def test_load_caches_the_cleaned_table(workbook, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    first = load_mpi_table(workbook, cache_dir=cache_dir)
+    assert len(os.listdir(cache_dir)) == 1
+
+    cached = load_mpi_table(workbook, cache_dir=cache_dir, countries=["Laos"])
+    assert cached["ISO"].tolist() == ["LAO"]
+    assert cached["MPI"].tolist() == first.loc[first["ISO"] == "LAO", "MPI"].tolist()
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from Econ_Analysis.social_network import ClusteredNetwork, _ranked_members, generate_clustered_network
+
+
+@pytest.mark.parametrize("options", [
+    {"bridge_endpoints": "hub", "bridges_per_pair": 3},
+    {"bridge_endpoints": "periphery", "bridges_per_pair": 3, "p_intra": 0.5},
+    {"bridge_endpoints": "random", "bridges_per_pair": 30},
+    {"bridge_endpoints": "hub", "bridges_per_pair": 2, "bridge_layout": "ring"},
+    {"bridge_endpoints": "hub", "bridges_per_pair": 5, "p_inter": 0.3},
+])
+def test_edge_count_matches_networkx(options):
+    network = generate_clustered_network([5, 5, 4], seed=0, **options)
+    graph = network.to_networkx()
+
+    assert network.n_edges == graph.number_of_edges()
+    assert network.to_sparse().nnz == 2 * network.n_edges
+    assert network.to_sparse().max() == 1.0  # no duplicate weights summed up
+
+
+def test_hub_bridges_use_distinct_members():
+    network = generate_clustered_network([5, 5], bridges_per_pair=3, bridge_endpoints="hub", seed=0)
+    bridges = network.kind == ClusteredNetwork.BRIDGE
+
+    assert bridges.sum() == 3
+    assert len(np.unique(network.src[bridges])) == 3
+    assert len(np.unique(network.dst[bridges])) == 3
+
+
+def test_hub_is_ranked_by_intra_cluster_degree():
+    # Node 0 has two ties inside its cluster; node 1 has one inside and three background links
+    cluster = np.array([0, 0, 0, 1, 1, 1])
+    src = np.array([0, 0, 1, 1, 1, 1])
+    dst = np.array([1, 2, 3, 4, 5, 3])
+    order = _ranked_members(cluster, src, dst, np.random.default_rng(0))
+
+    assert order[2] == 0  # the last member of cluster 0 is its hub
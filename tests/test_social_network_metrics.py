@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from Econ_Analysis.social_network import generate_clustered_network
+from Econ_Analysis.social_network_metrics import cluster_metrics, edge_betweenness, node_metrics
+
+nx = pytest.importorskip("networkx")
+
+
+@pytest.fixture
+def network():
+    return generate_clustered_network([6, 5, 4], p_intra=0.7, p_inter=0.05, bridges_per_pair=2,
+                                      bridge_weight=0.2, seed=3)
+
+
+def test_node_metrics_match_networkx(network):
+    graph = network.to_networkx()
+    nodes = node_metrics(network)
+
+    assert nodes["degree"].tolist() == [graph.degree(node) for node in graph]
+    assert nodes["triangles"].tolist() == [nx.triangles(graph)[node] for node in graph]
+    np.testing.assert_allclose(nodes["clustering"], [nx.clustering(graph)[node] for node in graph])
+    np.testing.assert_allclose(nodes["effective_size"], [nx.effective_size(graph)[node] for node in graph])
+    np.testing.assert_allclose(nodes["constraint"],
+                               [nx.constraint(graph, weight="weight")[node] for node in graph])
+
+
+def test_cluster_metrics_count_every_edge_once(network):
+    clusters = cluster_metrics(network)
+
+    assert clusters["size"].tolist() == [6, 5, 4]
+    assert clusters["internal_edges"].sum() + clusters["external_edges"].sum() / 2 == network.n_edges
+    np.testing.assert_allclose(clusters["volume"].sum(), 2 * network.weight.sum())
+
+
+def test_edge_betweenness_matches_networkx(network):
+    graph = network.to_networkx()
+    expected = nx.edge_betweenness_centrality(graph, normalized=False)
+    edges = edge_betweenness(network, workers=1)
+
+    assert len(edges) == graph.number_of_edges()
+    actual = dict(zip(zip(edges["source"], edges["target"]), edges["betweenness"]))
+    for (u, v), value in expected.items():
+        assert actual[min(u, v), max(u, v)] == pytest.approx(value)
@@ -0,0 +1,23 @@
+import numpy as np
+
+from Econ_Analysis.trend_forecast import fit_trends
+
+YEARS = np.array([1990, 1995, 2000, 2005, 2010, 2015, 2020], dtype="float64")
+
+
+def test_exact_fits_keep_a_finite_aicc_and_win():
+    u = (YEARS - YEARS[0]) / 10
+    quadratic = 3 + 2 * u - 0.5 * u ** 2
+    zeros = np.zeros(len(YEARS))  # every model fits with a residual sum of squares of exactly 0
+    constant = np.full(len(YEARS), 4.0)
+    criteria = fit_trends(YEARS, [quadratic, zeros, constant]).criteria()
+
+    # Among several exact fits the parameter penalty picks the simplest model
+    assert criteria["best_model"].tolist() == ["quadratic", "linear", "linear"]
+    assert np.isfinite(criteria.drop(columns="best_model").to_numpy(dtype="float64")).all()
+
+
+def test_series_without_any_fit_has_no_best_model():
+    values = np.full(len(YEARS), np.nan)
+    values[:2] = [1.0, 2.0]  # too few observations for every model
+    assert fit_trends(YEARS, values).criteria()["best_model"].tolist() == [None]
@@ -0,0 +1,51 @@
+import os
+
+import pandas as pd
+
+from Econ_Analysis.world_bank_data import load_world_bank_data, melt_world_bank_data
+
+HEADER = '"Data Source","World Development Indicators",\n\n"Last Updated Date","2024-12-16",\n\n'
+
+
+def _write_csv(path, value):
+    path.write_text(HEADER + '"Country Name","Country Code","Indicator Name","Indicator Code","2000","2001",\n'
+                    f'"Nepal","NPL","Gini index","SI.POV.GINI","{value}","",\n'
+                    '"India","IND","Gini index","SI.POV.GINI","","35.0",\n', encoding="utf-8")
+
+
+def test_load_parses_and_melts(tmp_path):
+    source = tmp_path / "gini.csv"
+    _write_csv(source, 30.5)
+    wide, long = load_world_bank_data(str(source), cache_dir=str(tmp_path / "cache"))
+    cached_wide, cached_long = load_world_bank_data(str(source), cache_dir=str(tmp_path / "cache"))
+
+    assert list(wide["Country Code"]) == ["NPL", "IND"]
+    assert long[["Country Code", "Year", "Gini Index"]].values.tolist() == [["NPL", 2000, 30.5], ["IND", 2001, 35.0]]
+    pd.testing.assert_frame_equal(cached_long, long)
+    assert not [name for name in os.listdir(tmp_path / "cache") if name.endswith(".tmp")]
+
+
+def test_stale_cleanup_keeps_files_with_a_longer_stem(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    source, sibling = tmp_path / "gini.csv", tmp_path / "gini.v2.csv"
+    _write_csv(source, 30.5)
+    _write_csv(sibling, 31.0)
+    load_world_bank_data(str(sibling), cache_dir=cache_dir)
+    sibling_files = set(os.listdir(cache_dir))
+    load_world_bank_data(str(source), cache_dir=cache_dir)
+
+    _write_csv(source, 32.0)  # a new generation of gini.csv replaces its old cache files only
+    _, long = load_world_bank_data(str(source), cache_dir=cache_dir)
+
+    names = set(os.listdir(cache_dir))
+    assert long["Gini Index"].iloc[0] == 32.0
+    assert len(sibling_files) == 2 and sibling_files <= names
+    assert len(names - sibling_files) == 2
+
+
+def test_melt_drops_columns_that_are_not_years():
+    wide = pd.DataFrame({"Country Name": ["Nepal"], "Country Code": ["NPL"], "2000": [30.5], "notes": [1.0]})
+    long = melt_world_bank_data(wide)
+
+    assert long["Year"].tolist() == [2000]
+    assert long["Year"].dtype == "int16"